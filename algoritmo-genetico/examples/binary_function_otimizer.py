@@ -1,6 +1,7 @@
 import numpy as np
 from typing import Callable
 from src.GA_base import GABase
+from src.objective import Objective, as_objective
 
 class BinaryFunctionOtimizer(GABase):
     """
@@ -16,7 +17,7 @@ class BinaryFunctionOtimizer(GABase):
     def __init__(self, n_individuals: int, n_genes: int, 
                  otimizer: Callable[[np.ndarray], int], n_generations: int = 500,
                  mutation_rate: float = 0.1, n_bits: int = 6, min_value: float = -1,
-                 max_value: float = 10, function: Callable[[np.ndarray], int] = None):
+                 max_value: float = 10, function: Callable[[np.ndarray], int] | Objective = None):
        """
        Initializes the binary function optimizer.
 
@@ -24,13 +25,15 @@ class BinaryFunctionOtimizer(GABase):
            n_bits (int, optional): The number of bits used to represent each value.
            min_value (float, optional): The minimum value in the search space.
            max_value (float, optional): The maximum value in the search space
-           function (Callable[[np.ndarray], int], optional): The function to be optimized.
+           function (Callable[[np.ndarray], int] | Objective, optional): The function to be
+               optimized. Functions declared with `vectorized` are called once with the
+               whole population.
        """
 
        self.n_bits = n_bits
        self.min_value = min_value
        self.max_value = max_value
-       self.function = function
+       self.function = as_objective(function)
        super().__init__(n_individuals, n_genes, otimizer, n_generations, mutation_rate)
 
     def create_individuals(self) -> np.ndarray:
@@ -43,7 +46,7 @@ class BinaryFunctionOtimizer(GABase):
             np.ndarray: The initial population of individuals.
         """
 
-        return np.random.randint(0, 2, (self.n_individuals, self.n_genes))
+        return np.random.randint(0, 2, (self.n_individuals, self.n_genes), dtype=self.dtypes.binary)
 
 
     def fitness(self, individuals: np.ndarray) -> np.ndarray:
@@ -57,13 +60,7 @@ class BinaryFunctionOtimizer(GABase):
             np.ndarray: The fitness values for each individual.
         """
 
-        individuals_values = self.binary_to_value(individuals)
-        individuals_fitness = np.empty(self.n_individuals, dtype=float)
-
-        for i,ind in enumerate(individuals_values):
-            individuals_fitness[i] = self.function(ind)
-
-        return individuals_fitness
+        return self.function(self.binary_to_value(individuals))
 
 
     def binary_to_value(self, individuals: np.ndarray) -> np.ndarray:
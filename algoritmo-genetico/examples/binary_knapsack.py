@@ -39,7 +39,7 @@ class BinaryKnapSack(GABase):
             np.ndarray: The initial population of individuals.
         """
 
-        return np.random.randint(0, 2, (self.n_individuals, self.n_genes))
+        return np.random.randint(0, 2, (self.n_individuals, self.n_genes), dtype=self.dtypes.binary)
     
     def fitness(self, individuals: np.ndarray) -> np.ndarray:
         """
@@ -52,16 +52,10 @@ class BinaryKnapSack(GABase):
             np.ndarray: The fitness values for each individual.
         """
 
-        individuals_fitness = np.empty(self.n_individuals, dtype=float)
+        individuals = np.asarray(individuals)
+        ind_weight = individuals @ self.weights
+        profits_ind = individuals @ self.profits
 
-        for i,ind in enumerate(individuals):
-            ind_weight = np.sum(self.weights * ind)
-            profits_ind = np.sum(self.profits * ind)
+        penalty = np.where(ind_weight < self.capacity, 0, profits_ind*(ind_weight-self.capacity))
 
-            if ind_weight < self.capacity:
-                individuals_fitness[i] = profits_ind
-            else:
-                penalty = profits_ind*(ind_weight-self.capacity)
-                individuals_fitness[i] = profits_ind  - penalty
-
-        return individuals_fitness
\ No newline at end of file
+        return (profits_ind - penalty).astype(float)
\ No newline at end of file
@@ -0,0 +1,66 @@
+import numpy as np
+from typing import Callable
+from src.NSGA2_base import NSGA2Base
+
+class MultiObjectiveKnapSack(NSGA2Base):
+    """
+    Solves a multi-objective Binary KnapSack Problem using NSGA-II.
+
+    Each individual is a binary array indicating whether an item is inside
+    or not. The objectives are the profit, to maximize, and the weight and
+    the risk of the knapsack, to minimize. Knapsacks over the capacity are
+    penalized in the profit, as in BinaryKnapSack.
+    """
+
+    def __init__(self, n_individuals: int = 100, n_genes: int = None,
+                otimizer: list[Callable[[np.ndarray], int]] = None, n_generations: int = 500,
+                mutation_rate: float = 0.1, weights: np.ndarray = None,
+                profits: np.ndarray = None, risks: np.ndarray = None, capacity: int = None):
+        """
+        Initializes the multi-objective knapsack optimizer.
+
+        Args:
+            otimizer (list[Callable[[np.ndarray], int]], optional): The direction of the
+                profit, weight and risk objectives. Defaults to [np.argmax, np.argmin, np.argmin].
+            weights (np.ndarray): The weight of each item.
+            profits (np.ndarray): The profit of each item.
+            risks (np.ndarray): The risk of each item.
+            capacity (int): The capacity of knapsack.
+        """
+
+        self.weights = weights
+        self.profits = profits
+        self.risks = risks
+        self.capacity = capacity
+        otimizer = [np.argmax, np.argmin, np.argmin] if otimizer is None else otimizer
+        super().__init__(n_individuals, n_genes, otimizer, n_generations, mutation_rate)
+
+    def create_individuals(self) -> np.ndarray:
+        """
+        Creates the initial population of individuals.
+
+        Returns:
+            np.ndarray: The initial population of individuals.
+        """
+
+        return np.random.randint(0, 2, (self.n_individuals, self.n_genes), dtype=self.dtypes.binary)
+
+    def fitness(self, individuals: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the objectives of each individual in the population.
+
+        Args:
+            individuals (np.ndarray): The population of individuals to evaluate.
+
+        Returns:
+            np.ndarray: The (N, 3) profit, weight and risk of each individual.
+        """
+
+        individuals = np.asarray(individuals)
+        ind_weight = individuals @ self.weights
+        profits_ind = individuals @ self.profits
+        risk_ind = individuals @ self.risks
+
+        penalty = np.where(ind_weight < self.capacity, 0, profits_ind*(ind_weight-self.capacity))
+
+        return np.column_stack([profits_ind - penalty, ind_weight, risk_ind]).astype(float)
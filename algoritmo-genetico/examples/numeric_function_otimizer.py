@@ -1,6 +1,8 @@
 import numpy as np
 from typing import Callable
 from src.GA_base import GABase
+from src.objective import Objective, as_objective
+from src.initialization.uniform_initialization import UniformInitialization
 
 class NumericFunctionOtimizer(GABase):
     """
@@ -14,7 +16,7 @@ class NumericFunctionOtimizer(GABase):
     def __init__(self, n_individuals: int = 100, n_genes: int = 3, 
                  otimizer: Callable[[np.ndarray], int] = None, n_generations: int = 500,
                  mutation_rate: float = 0.1, lmin: float = -1,
-                 lmax: float = 1, function: Callable[[np.ndarray], int] = None):
+                 lmax: float = 1, function: Callable[[np.ndarray], int] | Objective = None):
        """
        Initializes the binary function optimizer.
 
@@ -22,25 +24,31 @@ class NumericFunctionOtimizer(GABase):
            n_bits (int, optional): The number of bits used to represent each value.
            lmin (float, optional): The minimum value in the search space.
            lmax (float, optional): The maximum value in the search space
-           function (Callable[[np.ndarray], int], optional): The function to be optimized.
+           function (Callable[[np.ndarray], int] | Objective, optional): The function to be
+               optimized. Functions declared with `vectorized` are called once with the
+               whole population.
        """
 
        self.lmin = lmin
        self.lmax = lmax
-       self.function = function
+       self.function = as_objective(function)
        super().__init__(n_individuals, n_genes, otimizer, n_generations, mutation_rate)
+       self.set_initialization(UniformInitialization())
 
     def create_individuals(self) -> np.ndarray:
         """
         Creates the initial population of individuals.
 
-        Each individual is represented by a binary array.
+        Each individual is represented by a real array, sampled in [lmin, lmax)
+        by the initialization set with `set_initialization`.
 
         Returns:
             np.ndarray: The initial population of individuals.
         """
 
-        return np.random.uniform(self.lmin, self.lmax, (self.n_individuals, self.n_genes))
+        samples = self.initialization.initialize(self.n_individuals, self.n_genes)
+        individuals = self.lmin + (self.lmax - self.lmin) * samples
+        return individuals.astype(self.dtypes.real, copy=False)
 
 
     def fitness(self, individuals: np.ndarray) -> np.ndarray:
@@ -54,9 +62,4 @@ class NumericFunctionOtimizer(GABase):
             np.ndarray: The fitness values for each individual.
         """
 
-        individuals_fitness = np.empty(self.n_individuals, dtype=float)
-
-        for i,ind in enumerate(individuals):
-            individuals_fitness[i] = self.function(ind)
-
-        return individuals_fitness
+        return self.function(individuals)
@@ -1,6 +1,9 @@
 import numpy as np
 from typing import Callable
 from src.GA_base import GABase
+from src.distance.abstract_distance import AbstractDistance
+from src.distance.matrix_distance import as_distance
+from src.initialization.permutation_initialization import PermutationInitialization
 
 class TravelingSalesmanGA(GABase):
     """
@@ -13,29 +16,32 @@ class TravelingSalesmanGA(GABase):
     
     def __init__(self, n_individuals: int = 500, n_genes: int = 10, 
                 otimizer: Callable[[np.ndarray], int] = np.argmin, n_generations: int = 500,
-                mutation_rate: float = 0.1, distance_matrix: np.ndarray = None):
+                mutation_rate: float = 0.1, distance_matrix: np.ndarray | AbstractDistance = None):
         """
         Initializes the binary function optimizer.
 
         Args:
-            distance_matrix (np.ndarray): The distance matrix of all cities. 
+            distance_matrix (np.ndarray | AbstractDistance): The distance matrix of all cities
+                                                             or a distance provider.
         """
 
-        self.distance_matrix = distance_matrix
+        self.distance_matrix = as_distance(distance_matrix)
         super().__init__(n_individuals, n_genes, otimizer, n_generations, mutation_rate)
+        self.set_initialization(PermutationInitialization())
 
     def create_individuals(self) -> np.ndarray:
         """
         Creates the initial population of individuals.
 
-        Each individual is represented by a sequence of cities.
+        Each individual is represented by a sequence of cities, created by the
+        initialization set with `set_initialization` (random permutations by default).
 
         Returns:
             np.ndarray: The initial population of individuals.
         """
 
-        return np.array([np.random.choice(self.n_genes, self.n_genes, replace=False)
-                        for _ in range(self.n_individuals)])
+        individuals = self.initialization.initialize(self.n_individuals, self.n_genes)
+        return individuals.astype(self.dtypes.index(self.n_genes), copy=False)
     
     def fitness(self, individuals: np.ndarray) -> np.ndarray:
         """
@@ -48,11 +54,4 @@ class TravelingSalesmanGA(GABase):
             np.ndarray: The fitness values for each individual.
         """
 
-        individuals_fitness = np.empty(self.n_individuals, dtype=float)
-
-        for i,ind in enumerate(individuals):
-            path_distance = [self.distance_matrix[ind[j-1]][ind[j]]
-                             for j in range(self.n_genes)]
-            individuals_fitness[i] = np.sum(path_distance)
-
-        return individuals_fitness
\ No newline at end of file
+        return self.distance_matrix.tour_length(np.asarray(individuals)).astype(float)
\ No newline at end of file
@@ -1,10 +1,20 @@
+import time
 import itertools
 import numpy as np
 from tqdm import tqdm
 from typing import Callable
+from collections import deque
+from concurrent.futures import Executor
+from src.async_evaluation import AsyncEvaluator
+from src.dtype_policy import DTypePolicy, LEGACY
+from src.checkpoint import Checkpointer, load_checkpoint, get_random_state, set_random_state
+from src.telemetry import TelemetrySink, generation_record
+from src.distributed import DistributedEvaluator
 from src.selection.abstract_selection import AbstractSelection
 from src.mutation.abstract_mutation import AbstractMutation
 from src.crossover.abstract_crossover import AbstractCrossover
+from src.local_search.abstract_local_search import AbstractLocalSearch
+from src.initialization.abstract_initialization import AbstractInitialization
 
 
 class GABase:
@@ -43,6 +53,15 @@ class GABase:
        self.selection = None
        self.mutation = None
        self.crossover = None
+       self.local_search = None
+       self.initialization = None
+       self.checkpointer = None
+       self.dtypes = LEGACY
+       self.keep_history = True
+       self.telemetry = None
+       self.evaluator = None
+
+       self.reset()
 
     def simulate(self, verbose: bool = False) -> np.ndarray:
        """
@@ -55,23 +74,323 @@ class GABase:
        Returns:
            np.ndarray: The best individual found after the simulation.
        """
-       self.history_individuals = []
-       individuals = self.create_individuals()
+       self.reset()
+       return self.run_generations(verbose)
+
+    def resume(self, path: str, verbose: bool = False) -> np.ndarray:
+        """
+        Continues a simulation from a checkpoint until the last generation.
+
+        Args:
+            path (str): The checkpoint written by the checkpointer.
+            verbose (bool): If True, prints progress information for each generation.
+
+        Returns:
+            np.ndarray: The best individual found after the simulation.
+        """
+        self.reset()
+        self.set_state(load_checkpoint(path))
+        return self.run_generations(verbose)
+
+    def run_generations(self, verbose: bool = False) -> np.ndarray:
+        """
+        Runs the remaining generations, writing checkpoints when they are due.
+
+        Args:
+            verbose (bool): If True, prints progress information for each generation.
+
+        Returns:
+            np.ndarray: The best individual found after the simulation.
+        """
+        start = time.perf_counter()
+        for i in range(self.generation, self.n_generations):
+
+            individuals = self.ask()
+            self.tell(self.evaluate(individuals))
+
+            if self.telemetry is not None:
+                self.telemetry.emit(generation_record(i, individuals, self.last_fitness, self.otimizer,
+                                                      (i + 1) * self.n_individuals,
+                                                      time.perf_counter() - start))
+
+            if verbose:
+                print(f'Geracao {i}: {self.last_fitness[self.otimizer(self.last_fitness)]}')
+
+            if self.checkpointer is not None and \
+               (self.checkpointer.due(self.generation) or self.generation == self.n_generations):
+                self.checkpointer.save(self.get_state())
+
+        return self.individuals[0]  # Return the best individual
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """
+        Returns the state of the run as arrays, to be written in a checkpoint.
+
+        Returns:
+            dict[str, np.ndarray]: The population, its last fitness, the generation
+                                   and the random generator state.
+        """
+        state = {'generation': np.array(self.generation),
+                 'individuals': self.ask(),
+                 **get_random_state()}
+        if self.last_fitness is not None:
+            state['last_fitness'] = self.last_fitness
+        return state
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        """
+        Restores the state of the run returned by `get_state`.
+
+        Args:
+            state (dict[str, np.ndarray]): The arrays of the run state.
+        """
+        self.generation = int(state['generation'])
+        self.individuals = state['individuals']
+        self.spare = None
+        self.last_fitness = state.get('last_fitness')
+        set_random_state(state)
+
+    def reset(self) -> None:
+        """
+        Discards the current population, so the next `ask` starts a new run.
+        """
+        self.history_individuals = []
+        self.individuals = None
+        self.spare = None
+        self.last_fitness = None
+        self.generation = 0
+
+    def ask(self) -> np.ndarray:
+        """
+        Returns the population waiting for evaluation.
+
+        The first call creates the initial population. Calling it again before
+        `tell` returns the same population.
+
+        Returns:
+            np.ndarray: The individuals to evaluate.
+        """
+        if self.individuals is None:
+            self.individuals = self.create_individuals()
+        return self.individuals
+
+    def tell(self, fitness: np.ndarray) -> None:
+        """
+        Receives the fitness of the asked population and breeds the next generation.
+
+        The offspring are written into a spare buffer that swaps roles with the
+        population every generation, so the asked array is reused two generations
+        later and callers must copy it to keep it. With `keep_history` a copy of
+        each population is kept in `history_individuals`, outside the two buffers.
+
+        Args:
+            fitness (np.ndarray): The fitness of each individual returned by `ask`.
+        """
+        if self.individuals is None:
+            raise RuntimeError("tell() called before ask()")
+
+        individuals = self.individuals
+        fitness = np.asarray(fitness, dtype=float)
+        if fitness.shape != (len(individuals),):
+            raise ValueError(f"Expected {len(individuals)} fitness values, got shape {fitness.shape}")
+
+        if self.keep_history:
+            self.history_individuals.append(individuals.copy())
+
+        out = self.spare
+        if out is None or out.shape != individuals.shape or out.dtype != individuals.dtype:
+            out = np.empty_like(individuals)
+
+        if self.local_search is not None:
+            individuals, fitness = self.local_search.improve(individuals, fitness, self.otimizer)
+        parents = self.selection.select(fitness, self.otimizer)
+        new_ind = self.crossover.crossover(individuals, parents, out=out)
+        new_ind = self.mutation.mutate(new_ind, self.mutation_rate)
+        new_ind[0] = individuals[self.otimizer(fitness)]  # Elitism
+
+        self.spare = self.individuals
+        self.individuals = new_ind
+        self.last_fitness = fitness
+        self.generation += 1
+
+    def simulate_async(self, executor: Executor = None, max_concurrent: int = 4,
+                       verbose: bool = False) -> np.ndarray:
+        """
+        Simulates a steady-state evolution with asynchronous evaluations.
+
+        Evaluations run concurrently, up to `max_concurrent` at a time. As soon as
+        an offspring finishes its evaluation it replaces the worst individual
+        (if it is better) and a new offspring is submitted, so there is no
+        generation barrier. The budget is n_generations * n_individuals evaluations.
+
+        Args:
+            executor (Executor, optional): The executor running the evaluations. If None,
+                                           a thread pool is used.
+            max_concurrent (int, optional): The maximum number of evaluations in flight.
+            verbose (bool): If True, prints progress information every n_individuals evaluations.
+
+        Returns:
+            np.ndarray: The best individual found after the simulation.
+        """
+        individuals = self.create_individuals()
+        fitness = np.empty(self.n_individuals, dtype=float)
+        budget = self.n_generations * self.n_individuals
+
+        initial = deque(range(self.n_individuals))
+        bred = deque()
+        in_flight = {}
+        n_evaluated = n_submitted = 0
+
+        with AsyncEvaluator(self.fitness, executor, max_concurrent) as evaluator:
+            while n_evaluated < budget:
+                while evaluator.has_capacity() and n_submitted < budget:
+                    if initial:
+                        i = initial.popleft()
+                        evaluator.submit(('initial', i), individuals[i])
+                    elif n_evaluated >= self.n_individuals:
+                        if not bred:
+                            bred.extend(self.breed(individuals, fitness, 2))
+                        in_flight[n_submitted] = bred.popleft()
+                        evaluator.submit(('offspring', n_submitted), in_flight[n_submitted])
+                    else:
+                        break
+                    n_submitted += 1
+
+                (kind, key), value = evaluator.next_completed()
+                n_evaluated += 1
+
+                if kind == 'initial':
+                    fitness[key] = value
+                else:
+                    self.insert(individuals, fitness, in_flight.pop(key), value)
+
+                if verbose and n_evaluated % self.n_individuals == 0:
+                    print(f'Avaliacao {n_evaluated}: {fitness[self.otimizer(fitness)]}')
+
+        return individuals[self.otimizer(fitness)]
+
+    def breed(self, individuals: np.ndarray, fitness: np.ndarray, n_offspring: int) -> np.ndarray:
+        """
+        Breeds offspring from the current population with the genetic operators.
+
+        Args:
+            individuals (np.ndarray): The population of individuals.
+            fitness (np.ndarray): The fitness of the population.
+            n_offspring (int): The number of offspring to breed.
 
-       for i in range(self.n_generations):
+        Returns:
+            np.ndarray: The mutated offspring.
+        """
+        n_parents = n_offspring + n_offspring % 2
+        parents = self.selection.select(fitness, self.otimizer, n_parents)
+
+        offspring = self.crossover.crossover(individuals[parents], np.arange(n_parents))
+        offspring = self.mutation.mutate(offspring, self.mutation_rate)
+
+        return offspring[:n_offspring]
+
+    def simulate_steady_state(self, n_offspring: int = 2, replacement: str = 'worst',
+                              tournament_size: int = 3, verbose: bool = False) -> np.ndarray:
+        """
+        Simulates a steady-state evolution.
 
-           self.history_individuals.append(individuals)
-           
-           fitness = self.fitness(individuals)
-           parents = self.selection.select(fitness, self.otimizer)
-           new_ind = self.crossover.crossover(individuals, parents)
-           new_ind = self.mutation.mutate(new_ind, self.mutation_rate)
-           new_ind[0] = individuals[self.otimizer(fitness)]  # Elitism
-           individuals = np.array(new_ind)
-           if verbose:
-               print(f'Geracao {i}: {fitness[self.otimizer(fitness)]}')
+        Each step breeds `n_offspring` individuals, evaluates only them and
+        replaces members of the population in place, keeping the fitness array
+        aligned with it, so no evaluation is spent on individuals already known.
+        The budget is n_generations * n_individuals evaluations, as in `simulate`.
 
-       return individuals[0]  # Return the best individual
+        Args:
+            n_offspring (int, optional): The number of offspring bred and evaluated per step.
+            replacement (str, optional): 'worst' to compete with the worst members, or
+                                         'tournament' to compete with the worst of a
+                                         random tournament.
+            tournament_size (int, optional): The size of the replacement tournaments.
+            verbose (bool): If True, prints progress information every n_individuals evaluations.
+
+        Returns:
+            np.ndarray: The best individual found after the simulation.
+        """
+        individuals = self.create_individuals()
+        fitness = np.asarray(self.evaluate(individuals), dtype=float)
+        budget = self.n_generations * self.n_individuals
+        n_evaluated = self.n_individuals
+
+        while n_evaluated < budget:
+            n_step = min(n_offspring, budget - n_evaluated)
+            offspring = self.breed(individuals, fitness, n_step)
+            offspring_fitness = np.asarray(self.evaluate(offspring), dtype=float)
+            self.replace(individuals, fitness, offspring, offspring_fitness, replacement, tournament_size)
+
+            if verbose and (n_evaluated + n_step) // self.n_individuals > n_evaluated // self.n_individuals:
+                print(f'Avaliacao {n_evaluated + n_step}: {fitness[self.otimizer(fitness)]}')
+            n_evaluated += n_step
+
+        return individuals[self.otimizer(fitness)]
+
+    def replace(self, individuals: np.ndarray, fitness: np.ndarray, offspring: np.ndarray,
+                offspring_fitness: np.ndarray, replacement: str = 'worst',
+                tournament_size: int = 3) -> int:
+        """
+        Replaces members of the population in place with better offspring.
+
+        With 'worst', the offspring and the len(offspring) worst members, found
+        with a partial sort, compete and the best of them keep the slots. With
+        'tournament', each offspring replaces the worst member of a random
+        tournament if it is better. The best member is never lost.
+
+        Args:
+            individuals (np.ndarray): The population of individuals.
+            fitness (np.ndarray): The fitness of the population, kept aligned.
+            offspring (np.ndarray): The evaluated offspring.
+            offspring_fitness (np.ndarray): The fitness of the offspring.
+            replacement (str, optional): 'worst' or 'tournament'.
+            tournament_size (int, optional): The size of the replacement tournaments.
+
+        Returns:
+            int: The number of offspring inserted.
+        """
+        sign = -1 if self.otimizer == np.argmax else 1
+        n_offspring = len(offspring)
+
+        if replacement == 'worst':
+            targets = np.argpartition(sign * fitness, -n_offspring)[-n_offspring:]
+            pool_fitness = np.concatenate([fitness[targets], offspring_fitness])
+            keep = np.argsort(sign * pool_fitness, kind='stable')[:n_offspring]
+
+            individuals[targets] = np.concatenate([individuals[targets], offspring])[keep]
+            fitness[targets] = pool_fitness[keep]
+            return int((keep >= n_offspring).sum())
+
+        if replacement != 'tournament':
+            raise ValueError(f"Unknown replacement '{replacement}', expected 'worst' or 'tournament'")
+
+        n_inserted = 0
+        contestants = np.random.randint(0, len(individuals), (n_offspring, tournament_size))
+        for child, candidates in enumerate(contestants):
+            target = candidates[np.argmax(sign * fitness[candidates])]
+            if sign * offspring_fitness[child] < sign * fitness[target]:
+                individuals[target] = offspring[child]
+                fitness[target] = offspring_fitness[child]
+                n_inserted += 1
+
+        return n_inserted
+
+    def insert(self, individuals: np.ndarray, fitness: np.ndarray,
+               offspring: np.ndarray, offspring_fitness: float) -> bool:
+        """
+        Replaces the worst individual in place if the offspring is better.
+
+        Args:
+            individuals (np.ndarray): The population of individuals.
+            fitness (np.ndarray): The fitness of the population, kept aligned.
+            offspring (np.ndarray): The evaluated offspring.
+            offspring_fitness (float): The fitness of the offspring.
+
+        Returns:
+            bool: True if the offspring was inserted.
+        """
+        return self.replace(individuals, fitness, np.asarray(offspring)[None],
+                            np.array([offspring_fitness], dtype=float)) == 1
 
     def create_individuals(self) -> np.ndarray:
        """
@@ -98,6 +417,20 @@ class GABase:
        """
        raise NotImplementedError("Subclasses must implement fitness")
 
+    def evaluate(self, individuals: np.ndarray) -> np.ndarray:
+        """
+        Evaluates individuals with the evaluator set by `set_evaluator`, or with
+        `fitness` in this process if there is none.
+
+        Args:
+            individuals (np.ndarray): The population of individuals to evaluate.
+
+        Returns:
+            np.ndarray: The fitness values for each individual.
+        """
+        if self.evaluator is None:
+            return self.fitness(individuals)
+        return self.evaluator(individuals)
 
     def set_selection(self, selection: AbstractSelection):
         self.selection = selection
@@ -108,6 +441,27 @@ class GABase:
     def set_crossover(self, crossover: AbstractCrossover):
         self.crossover = crossover
 
+    def set_local_search(self, local_search: AbstractLocalSearch):
+        self.local_search = local_search
+
+    def set_initialization(self, initialization: AbstractInitialization):
+        self.initialization = initialization
+
+    def set_checkpointer(self, checkpointer: Checkpointer):
+        self.checkpointer = checkpointer
+
+    def set_dtype_policy(self, dtypes: DTypePolicy):
+        self.dtypes = dtypes
+
+    def set_keep_history(self, keep_history: bool):
+        self.keep_history = keep_history
+
+    def set_telemetry(self, telemetry: TelemetrySink):
+        self.telemetry = telemetry
+
+    def set_evaluator(self, evaluator: DistributedEvaluator):
+        self.evaluator = evaluator
+
     def grid_search(self, n_individuals: list[int], n_genes: list[int],
                     otimizer: Callable[[np.ndarray], int], n_generations: list[int],
                     mutation_rate: list[float], selection: list[AbstractSelection],
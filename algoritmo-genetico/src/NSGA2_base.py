@@ -0,0 +1,166 @@
+import time
+import numpy as np
+from typing import Callable
+from src.GA_base import GABase
+from src.multi_objective import non_dominated_sort, crowding_distance, crowded_key
+from src.telemetry import generation_record
+
+
+class NSGA2Base(GABase):
+    """
+    Base class for multi-objective genetic algorithms with NSGA-II.
+
+    The fitness returns one column per objective and `otimizer` holds one
+    np.argmin or np.argmax per objective. Each generation the parents and the
+    evaluated offspring are merged, ranked by non-dominated sorting and
+    crowding distance, and the best n_individuals survive. The next offspring
+    are bred from the survivors with the usual selection, crossover and
+    mutation operators, the selection receiving the crowded comparison key
+    to minimize (see CrowdedTournamentSelection).
+
+    Concrete subclasses should implement the `create_individuals` and `fitness`
+    methods, `fitness` returning an (N, M) array.
+    """
+
+    def __init__(self, n_individuals: int, n_genes: int,
+                 otimizer: list[Callable[[np.ndarray], int]],
+                 n_generations: int = 500, mutation_rate: float = 0.1):
+        """
+        Initializes the NSGA-II base class.
+
+        Args:
+            n_individuals (int): The number of individuals in the population.
+            n_genes (int): The number of genes in each individual.
+            otimizer (list[Callable[[np.ndarray], int]]): The direction of each objective,
+                                                          np.argmin or np.argmax.
+            n_generations (int, optional): The number of generations to run.
+            mutation_rate (float, optional): The probability of mutation.
+        """
+        super().__init__(n_individuals, n_genes, otimizer, n_generations, mutation_rate)
+
+    def reset(self) -> None:
+        """
+        Discards the current population and parents, so the next `ask` starts a new run.
+        """
+        super().reset()
+        self.parents = None
+        self.parents_fitness = None
+        self.ranks = None
+        self.crowding = None
+
+    def minimized(self, fitness: np.ndarray) -> np.ndarray:
+        """Returns the objectives with the maximized ones negated, so all are minimized."""
+        signs = np.array([-1.0 if otimizer == np.argmax else 1.0 for otimizer in self.otimizer])
+        return fitness * signs
+
+    def tell(self, fitness: np.ndarray) -> None:
+        """
+        Receives the objectives of the asked offspring and breeds the next ones.
+
+        Args:
+            fitness (np.ndarray): The (N, M) objectives of the individuals returned by `ask`.
+        """
+        if self.individuals is None:
+            raise RuntimeError("tell() called before ask()")
+
+        individuals = self.individuals
+        fitness = np.asarray(fitness, dtype=float)
+        if fitness.shape != (len(individuals), len(self.otimizer)):
+            raise ValueError(f"Expected ({len(individuals)}, {len(self.otimizer)}) objectives, "
+                             f"got shape {fitness.shape}")
+
+        if self.keep_history:
+            self.history_individuals.append(individuals)
+
+        if self.parents is None:
+            pool, pool_fitness = individuals, fitness
+        else:
+            pool = np.concatenate([self.parents, individuals])
+            pool_fitness = np.concatenate([self.parents_fitness, fitness])
+
+        objectives = self.minimized(pool_fitness)
+        ranks = non_dominated_sort(objectives)
+        crowding = crowding_distance(objectives, ranks)
+        survivors = np.lexsort((-crowding, ranks))[:self.n_individuals]
+
+        self.parents = pool[survivors]
+        self.parents_fitness = pool_fitness[survivors]
+        self.ranks = ranks[survivors]
+        self.crowding = crowding[survivors]
+
+        parents = self.selection.select(crowded_key(self.ranks, self.crowding), np.argmin)
+        new_ind = self.crossover.crossover(self.parents, parents, out=np.empty_like(self.parents))
+        new_ind = self.mutation.mutate(new_ind, self.mutation_rate)
+
+        self.individuals = new_ind
+        self.last_fitness = fitness
+        self.generation += 1
+
+    def pareto_front(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the non-dominated individuals among the current parents.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The individuals of the first front and their objectives.
+        """
+        if self.parents is None:
+            raise RuntimeError("pareto_front() called before any generation")
+        front = self.ranks == 0
+        return self.parents[front], self.parents_fitness[front]
+
+    def run_generations(self, verbose: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Runs the remaining generations, writing checkpoints when they are due.
+
+        Args:
+            verbose (bool): If True, prints the size of the first front for each generation.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The Pareto front found and its objectives.
+        """
+        start = time.perf_counter()
+        for i in range(self.generation, self.n_generations):
+
+            individuals = self.ask()
+            self.tell(self.evaluate(individuals))
+
+            if self.telemetry is not None:
+                self.telemetry.emit(generation_record(i, individuals, self.last_fitness, self.otimizer,
+                                                      (i + 1) * self.n_individuals,
+                                                      time.perf_counter() - start))
+
+            if verbose:
+                print(f'Geracao {i}: {np.sum(self.ranks == 0)} solucoes na fronteira')
+
+            if self.checkpointer is not None and \
+               (self.checkpointer.due(self.generation) or self.generation == self.n_generations):
+                self.checkpointer.save(self.get_state())
+
+        return self.pareto_front()
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """
+        Returns the state of the run as arrays, to be written in a checkpoint.
+
+        Returns:
+            dict[str, np.ndarray]: The GA state plus the parents, their objectives,
+                                   fronts and crowding distances.
+        """
+        state = super().get_state()
+        if self.parents is not None:
+            state.update(parents=self.parents, parents_fitness=self.parents_fitness,
+                         ranks=self.ranks, crowding=self.crowding)
+        return state
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        """
+        Restores the state of the run returned by `get_state`.
+
+        Args:
+            state (dict[str, np.ndarray]): The arrays of the run state.
+        """
+        super().set_state(state)
+        self.parents = state.get('parents')
+        self.parents_fitness = state.get('parents_fitness')
+        self.ranks = state.get('ranks')
+        self.crowding = state.get('crowding')
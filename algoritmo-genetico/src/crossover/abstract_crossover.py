@@ -11,7 +11,8 @@ class AbstractCrossover(ABC):
     """
 
     @abstractmethod
-    def crossover(self, individuals: np.ndarray, parents: np.ndarray) -> np.ndarray:
+    def crossover(self, individuals: np.ndarray, parents: np.ndarray,
+                  out: np.ndarray = None) -> np.ndarray:
         """Performs crossover on a population of individuals.
 
         This method takes a population of individuals and a set of parent indices
@@ -21,8 +22,12 @@ class AbstractCrossover(ABC):
             individuals (np.ndarray): The population of individuals.
             parents (np.ndarray): The indices of parent individuals for 
                                   crossover.
+            out (np.ndarray, optional): The array the offspring are written to,
+                                        with the shape and dtype of `individuals`.
+                                        It must not share memory with `individuals`.
+                                        If None, a new array is allocated.
 
         Returns:
-            np.ndarray: The new offspring individuals.
+            np.ndarray: The new offspring individuals (`out`, if given).
         """
         pass
@@ -22,7 +22,8 @@ class BlendCrossover(AbstractCrossover):
         super().__init__()
 
 
-    def crossover(self, individuals: np.ndarray, parents: np.ndarray) -> np.ndarray:
+    def crossover(self, individuals: np.ndarray, parents: np.ndarray,
+                  out: np.ndarray = None) -> np.ndarray:
         """
         Performs blend crossover on a population of individuals.
 
@@ -33,27 +34,22 @@ class BlendCrossover(AbstractCrossover):
             individuals (np.ndarray): The population of individuals.
             parents (np.ndarray): The indices of the parent individuals selected
                                   for crossover.
+            out (np.ndarray, optional): The array the offspring are written to.
 
         Returns:
             np.ndarray: The new offspring individuals.
         """
-        new_individuals = []
-        n_individuals, n_genes = individuals.shape
+        if out is None:
+            out = np.empty_like(individuals)
+        n_individuals = individuals.shape[0]
 
         for i in range(0, n_individuals, 2):
             parent1, parent2 = individuals[parents[i]], individuals[parents[i + 1]]
-
             diff = np.abs(parent1-parent2)
-            linf = np.empty(n_genes)
-            lsup = np.empty(n_genes)
-            for i, x in enumerate(np.array([parent1,parent2]).T):
-                linf[i] = x[0] - self.beta*diff[i] if x[0] < x[[1]] else x[[1]] - self.alpha*diff[i] 
-                lsup[i] = x[[1]] + self.alpha*diff[i] if x[0] < x[[1]] else x[0] + self.beta*diff[i] 
-            
-            offspring1 = np.random.uniform(linf, lsup)
-            offspring2 = np.random.uniform(linf, lsup)
-
-            new_individuals.append(offspring1)
-            new_individuals.append(offspring2)
-
-        return np.array(new_individuals)
+            lower = parent1 < parent2
+            linf = np.where(lower, parent1 - self.beta*diff, parent2 - self.alpha*diff)
+            lsup = np.where(lower, parent2 + self.alpha*diff, parent1 + self.beta*diff)
+            out[i] = np.random.uniform(linf, lsup)
+            out[i + 1] = np.random.uniform(linf, lsup)
+
+        return out
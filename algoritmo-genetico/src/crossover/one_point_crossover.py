@@ -13,13 +13,16 @@ class OnePointCrossover(AbstractCrossover):
         individuals (np.ndarray): The population of individuals.
         parents (np.ndarray): The indices of the parent individuals selected for
                               crossover.
+        out (np.ndarray, optional): The array the offspring are written to.
 
     Returns:
         np.ndarray: The new offspring individuals.
     """
 
-    def crossover(self, individuals: np.ndarray, parents: np.ndarray) -> np.ndarray:
-        new_individuals = []
+    def crossover(self, individuals: np.ndarray, parents: np.ndarray,
+                  out: np.ndarray = None) -> np.ndarray:
+        if out is None:
+            out = np.empty_like(individuals)
         n_individuals, n_genes = individuals.shape
 
         for i in range(0, n_individuals, 2):
@@ -27,11 +30,7 @@ class OnePointCrossover(AbstractCrossover):
 
             point = np.random.randint(1, n_genes)
 
-            offspring1 = np.copy(parent1)
-            offspring2 = np.copy(parent2)
-            offspring1[:point], offspring2[:point] = parent2[:point], parent1[:point]
+            out[i, :point], out[i, point:] = parent2[:point], parent1[point:]
+            out[i + 1, :point], out[i + 1, point:] = parent1[:point], parent2[point:]
 
-            new_individuals.append(offspring1)
-            new_individuals.append(offspring2)
-
-        return np.array(new_individuals)
+        return out
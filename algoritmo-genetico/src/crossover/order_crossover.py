@@ -1,4 +1,5 @@
 from src.crossover.abstract_crossover import AbstractCrossover
+from src.backend import Kernel
 import numpy as np
 
 
@@ -9,47 +10,77 @@ class OrderCrossover(AbstractCrossover):
     It works by selecting a random segment from one parent and inserting it
     into the same position in the other parent. The remaining elements are filled
     sequentially from both parents to ensure all unique elements are included
-    in the offspring.
+    in the offspring. The individuals must be permutations of 0..n_genes-1.
 
     Args:
         individuals (np.ndarray): The population of individuals.
         parents (np.ndarray): The indices of the parent individuals selected for
                               crossover.
+        out (np.ndarray, optional): The array the offspring are written to.
 
     Returns:
         np.ndarray: The new offspring individuals.
     """
 
-    def crossover(self, individuals: np.ndarray, parents: np.ndarray) -> np.ndarray:
-        new_individuals = []
+    def crossover(self, individuals: np.ndarray, parents: np.ndarray,
+                  out: np.ndarray = None) -> np.ndarray:
         n_individuals, n_genes = individuals.shape
+        first = individuals[parents[0:n_individuals:2]]
+        second = individuals[parents[1:n_individuals:2]]
 
-        for i in range(0, n_individuals, 2):
-            parent1, parent2 = individuals[parents[i]], individuals[parents[i + 1]]
+        point1 = np.random.randint(1, n_genes - 2, first.shape[0])
+        point2 = np.random.randint(point1, n_genes - 1)
 
-            point1 = np.random.randint(1, n_genes - 2)
-            point2 = np.random.randint(point1, n_genes - 1)
+        if out is None:
+            out = np.empty_like(individuals)
+        order_fill(second, first, point1, point2, out[0::2])
+        order_fill(first, second, point1, point2, out[1::2])
 
-            parent1_reorder = np.concatenate([parent1[point2:], parent1[:point2]])
-            parent2_reorder = np.concatenate([parent2[point2:], parent2[:point2]])
+        return out
 
-            offspring1, offspring2 = np.full(n_genes, -1), np.full(n_genes, -1)
 
-            offspring1[point1:point2] = parent2[point1:point2]
-            offspring2[point1:point2] = parent1[point1:point2]
+def order_fill_numpy(donors: np.ndarray, receivers: np.ndarray, point1: np.ndarray,
+                     point2: np.ndarray, out: np.ndarray) -> None:
+    """
+    Builds order crossover offspring in `out`.
+
+    Each offspring keeps the segment [point1, point2) of its donor, and the
+    remaining positions, starting at point2 and wrapping around, receive the
+    missing genes in the order they appear in the receiver from point2 on.
+
+    Args:
+        donors (np.ndarray): The parents giving the segment.
+        receivers (np.ndarray): The parents giving the order of the other genes.
+        point1 (np.ndarray): The start of the segment of each pair.
+        point2 (np.ndarray): The end of the segment of each pair.
+        out (np.ndarray): The offspring, written in place.
+    """
+    n_genes = donors.shape[1]
+    for k in range(donors.shape[0]):
+        segment = donors[k, point1[k]:point2[k]]
+        reorder = np.roll(receivers[k], -point2[k])
+        remaining = reorder[~np.isin(reorder, segment)]
+
+        out[k, point1[k]:point2[k]] = segment
+        out[k, (point2[k] + np.arange(remaining.shape[0])) % n_genes] = remaining
+
+
+def order_fill_loop(donors, receivers, point1, point2, out):
+    n_pairs, n_genes = donors.shape
+    for k in range(n_pairs):
+        used = np.zeros(n_genes, dtype=np.bool_)
+        for g in range(point1[k], point2[k]):
+            out[k, g] = donors[k, g]
+            used[donors[k, g]] = True
 
-            fill_index = point2
-            for value in parent1_reorder:
-                if value not in offspring1:
-                    offspring1[fill_index] = value
-                    fill_index = (fill_index + 1) % n_genes
-            fill_index = point2
-            for value in parent2_reorder:
-                if value not in offspring2:
-                    offspring2[fill_index] = value
-                    fill_index = (fill_index + 1) % n_genes
+        fill = point2[k]
+        for step in range(n_genes):
+            value = receivers[k, (point2[k] + step) % n_genes]
+            if not used[value]:
+                out[k, fill] = value
+                fill = (fill + 1) % n_genes
 
-            new_individuals.append(offspring1)
-            new_individuals.append(offspring2)
 
-        return np.array(new_individuals)
+order_fill = Kernel(order_fill_loop, order_fill_numpy,
+                    example=lambda: (np.array([[0, 1, 2, 3, 4]]), np.array([[4, 3, 2, 1, 0]]),
+                                     np.array([1]), np.array([3]), np.empty((1, 5), dtype=np.int_)))
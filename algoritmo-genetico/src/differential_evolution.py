@@ -0,0 +1,364 @@
+import time
+import numpy as np
+from src.GA_base import GABase
+from src.checkpoint import Checkpointer, load_checkpoint, get_random_state, set_random_state
+from src.telemetry import TelemetrySink, generation_record
+
+STRATEGIES = ('rand/1', 'best/1', 'current-to-pbest/1')
+
+
+def distinct_indices(n_rows: int, n_choices: int, exclude: list[np.ndarray]) -> np.ndarray:
+    """
+    Draws, for each row, an index in range(n_choices) different from the excluded ones.
+
+    Conflicting rows are drawn again until none is left, so each draw is
+    uniform among the allowed indices.
+
+    Args:
+        n_rows (int): The number of indices to draw.
+        n_choices (int): The number of candidates.
+        exclude (list[np.ndarray]): The indices each row must avoid.
+
+    Returns:
+        np.ndarray: The drawn indices.
+    """
+    indices = np.random.randint(0, n_choices, n_rows)
+    conflict = np.zeros(n_rows, dtype=bool)
+    for excluded in exclude:
+        conflict |= indices == excluded
+
+    while np.any(conflict):
+        rows = np.flatnonzero(conflict)
+        indices[rows] = np.random.randint(0, n_choices, rows.size)
+        conflict[:] = False
+        for excluded in exclude:
+            conflict[rows] |= indices[rows] == np.broadcast_to(excluded, n_rows)[rows]
+
+    return indices
+
+
+class DifferentialEvolution:
+    """
+    Runs Differential Evolution on the individuals of a GA problem.
+
+    The problem, e.g. a NumericFunctionOtimizer, provides the initial
+    population (`create_individuals`), the fitness (`evaluate`, so a
+    distributed evaluator set on it is used), the population size, the
+    number of generations and the direction. Each generation builds all the
+    trial vectors at once: a mutant per individual with the chosen strategy,
+    binomial crossover with its parent, and a one-to-one selection that keeps
+    the trial if it is no worse.
+
+    Strategies:
+        - rand/1: v = x_r1 + F (x_r2 - x_r3)
+        - best/1: v = x_best + F (x_r1 - x_r2)
+        - current-to-pbest/1: v = x_i + F (x_pbest - x_i) + F (x_r1 - x_r2), where
+          x_pbest is one of the best p * N individuals and x_r2 may come from the
+          archive of replaced parents (JADE).
+
+    With `adaptive`, each individual draws its own F from Cauchy(mu_F, 0.1)
+    and CR from Normal(mu_CR, 0.1), and the means move towards the values of
+    the successful trials (the Lehmer mean for F), as in JADE.
+
+    Parameters:
+        problem (GABase): The problem, with real-valued individuals.
+        strategy (str): 'rand/1', 'best/1' or 'current-to-pbest/1'.
+        F (float): The scale factor, or the initial mu_F when adaptive.
+        CR (float): The crossover rate, or the initial mu_CR when adaptive.
+        adaptive (bool): If True, adapts F and CR as in JADE.
+        p (float): The fraction of the best individuals used by current-to-pbest/1.
+        c (float): The learning rate of mu_F and mu_CR.
+        bounds (tuple[float, float], optional): The lower and upper bounds of the genes.
+                                                If None, the problem's (lmin, lmax) is
+                                                used when it has them. Mutants outside
+                                                are moved halfway between their parent
+                                                and the bound.
+    """
+
+    def __init__(self, problem: GABase, strategy: str = 'current-to-pbest/1',
+                 F: float = 0.5, CR: float = 0.9, adaptive: bool = True,
+                 p: float = 0.05, c: float = 0.1, bounds: tuple[float, float] = None) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}', expected one of {list(STRATEGIES)}")
+
+        self.problem = problem
+        self.strategy = strategy
+        self.F = F
+        self.CR = CR
+        self.adaptive = adaptive
+        self.p = p
+        self.c = c
+        if bounds is None and hasattr(problem, 'lmin') and hasattr(problem, 'lmax'):
+            bounds = (problem.lmin, problem.lmax)
+        self.bounds = bounds
+
+        self.n_individuals = problem.n_individuals
+        self.n_generations = problem.n_generations
+        self.otimizer = problem.otimizer
+        self.checkpointer = None
+        self.telemetry = None
+
+        self.reset()
+
+    def simulate(self, verbose: bool = False) -> np.ndarray:
+        """
+        Runs Differential Evolution for the problem's number of generations.
+
+        Args:
+            verbose (bool): If True, prints the best fitness of each generation.
+
+        Returns:
+            np.ndarray: The best individual found.
+        """
+        self.reset()
+        return self.run_generations(verbose)
+
+    def resume(self, path: str, verbose: bool = False) -> np.ndarray:
+        """
+        Continues a run from a checkpoint until the last generation.
+
+        Args:
+            path (str): The checkpoint written by the checkpointer.
+            verbose (bool): If True, prints the best fitness of each generation.
+
+        Returns:
+            np.ndarray: The best individual found.
+        """
+        self.reset()
+        self.set_state(load_checkpoint(path))
+        return self.run_generations(verbose)
+
+    def run_generations(self, verbose: bool = False) -> np.ndarray:
+        """
+        Runs the remaining generations, writing checkpoints when they are due.
+
+        Args:
+            verbose (bool): If True, prints the best fitness of each generation.
+
+        Returns:
+            np.ndarray: The best individual found.
+        """
+        start = time.perf_counter()
+        if self.fitness is None:
+            individuals = self.ask()
+            self.tell(self.problem.evaluate(individuals))
+
+        for i in range(self.generation, self.n_generations):
+
+            trials = self.ask()
+            self.tell(self.problem.evaluate(trials))
+
+            if self.telemetry is not None:
+                self.telemetry.emit(generation_record(i, self.individuals, self.fitness, self.otimizer,
+                                                      (i + 2) * self.n_individuals,
+                                                      time.perf_counter() - start))
+
+            if verbose:
+                print(f'Geracao {i}: {self.fitness[self.otimizer(self.fitness)]}')
+
+            if self.checkpointer is not None and \
+               (self.checkpointer.due(self.generation) or self.generation == self.n_generations):
+                self.checkpointer.save(self.get_state())
+
+        return self.best()
+
+    def reset(self) -> None:
+        """
+        Discards the population, so the next `ask` starts a new run.
+        """
+        self.individuals = None
+        self.fitness = None
+        self.trials = None
+        self.trial_F = None
+        self.trial_CR = None
+        self.archive = None
+        self.mu_F = self.F
+        self.mu_CR = self.CR
+        self.generation = 0
+
+    def best(self) -> np.ndarray:
+        """Returns the best individual of the current population."""
+        if self.fitness is None:
+            raise RuntimeError("best() called before the population was evaluated")
+        return self.individuals[self.otimizer(self.fitness)]
+
+    def minimized(self, fitness: np.ndarray) -> np.ndarray:
+        """Returns the fitness negated when it is maximized, so lower is always better."""
+        return -fitness if self.otimizer == np.argmax else fitness
+
+    def ask(self) -> np.ndarray:
+        """
+        Returns the candidates waiting for evaluation.
+
+        The first call returns the initial population of the problem, the next
+        ones the trial vectors of the current generation. Calling it again
+        before `tell` returns the same candidates.
+
+        Returns:
+            np.ndarray: The candidates to evaluate.
+        """
+        if self.individuals is None:
+            self.individuals = self.problem.create_individuals()
+            self.archive = np.empty((0, self.individuals.shape[1]), dtype=self.individuals.dtype)
+            return self.individuals
+        if self.fitness is None:
+            return self.individuals
+        if self.trials is None:
+            self.trials = self.create_trials()
+        return self.trials
+
+    def tell(self, fitness: np.ndarray) -> None:
+        """
+        Receives the fitness of the asked candidates.
+
+        The first call evaluates the initial population. The next ones replace
+        each individual by its trial when the trial is no worse.
+
+        Args:
+            fitness (np.ndarray): The fitness of each candidate returned by `ask`.
+        """
+        if self.individuals is None:
+            raise RuntimeError("tell() called before ask()")
+
+        fitness = np.asarray(fitness, dtype=float)
+        if fitness.shape != (self.n_individuals,):
+            raise ValueError(f"Expected {self.n_individuals} fitness values, got shape {fitness.shape}")
+
+        if self.fitness is None:
+            self.fitness = fitness
+            return
+
+        if self.trials is None:
+            raise RuntimeError("tell() called before ask()")
+
+        improved = self.minimized(fitness) <= self.minimized(self.fitness)
+        better = self.minimized(fitness) < self.minimized(self.fitness)
+
+        if self.strategy == 'current-to-pbest/1':
+            self.archive = np.concatenate([self.archive, self.individuals[better]])
+            if len(self.archive) > self.n_individuals:
+                keep = np.random.choice(len(self.archive), self.n_individuals, replace=False)
+                self.archive = self.archive[keep]
+
+        if self.adaptive and np.any(better):
+            successful_F = self.trial_F[better]
+            self.mu_CR = (1 - self.c) * self.mu_CR + self.c * np.mean(self.trial_CR[better])
+            self.mu_F = (1 - self.c) * self.mu_F + \
+                        self.c * np.sum(successful_F ** 2) / np.sum(successful_F)
+
+        self.individuals[improved] = self.trials[improved]
+        self.fitness = np.where(improved, fitness, self.fitness)
+        self.trials = None
+        self.generation += 1
+
+    def sample_parameters(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Draws the F and CR of each individual.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: F and CR, with one value per individual.
+        """
+        n = self.n_individuals
+        if not self.adaptive:
+            return np.full(n, self.F), np.full(n, self.CR)
+
+        CR = np.clip(np.random.normal(self.mu_CR, 0.1, n), 0, 1)
+
+        # Cauchy draws are truncated at 1 and drawn again while not positive.
+        F = self.mu_F + 0.1 * np.random.standard_cauchy(n)
+        while np.any(F <= 0):
+            rows = F <= 0
+            F[rows] = self.mu_F + 0.1 * np.random.standard_cauchy(rows.sum())
+        return np.minimum(F, 1), CR
+
+    def create_trials(self) -> np.ndarray:
+        """
+        Builds the trial vector of every individual with mutation and binomial crossover.
+
+        Returns:
+            np.ndarray: The (N, D) trial vectors.
+        """
+        x = self.individuals.astype(float, copy=False)
+        n, d = x.shape
+        if n < 4:
+            raise ValueError("Differential Evolution needs at least 4 individuals")
+
+        F, CR = self.sample_parameters()
+        self.trial_F, self.trial_CR = F, CR
+        rows = np.arange(n)
+        scale = F[:, None]
+
+        if self.strategy == 'rand/1':
+            r1 = distinct_indices(n, n, [rows])
+            r2 = distinct_indices(n, n, [rows, r1])
+            r3 = distinct_indices(n, n, [rows, r1, r2])
+            mutants = x[r1] + scale * (x[r2] - x[r3])
+        elif self.strategy == 'best/1':
+            best = x[np.argmin(self.minimized(self.fitness))]
+            r1 = distinct_indices(n, n, [rows])
+            r2 = distinct_indices(n, n, [rows, r1])
+            mutants = best + scale * (x[r1] - x[r2])
+        else:
+            n_best = max(1, int(round(self.p * n)))
+            top = np.argsort(self.minimized(self.fitness), kind='stable')[:n_best]
+            pbest = x[top[np.random.randint(0, n_best, n)]]
+
+            # The second difference vector may come from the archive of replaced parents.
+            pool = np.concatenate([x, self.archive.astype(float, copy=False)])
+            r1 = distinct_indices(n, n, [rows])
+            r2 = distinct_indices(n, len(pool), [rows, r1])
+            mutants = x + scale * (pbest - x) + scale * (x[r1] - pool[r2])
+
+        if self.bounds is not None:
+            lower, upper = self.bounds
+            mutants = np.where(mutants < lower, (lower + x) / 2, mutants)
+            mutants = np.where(mutants > upper, (upper + x) / 2, mutants)
+
+        # Binomial crossover, with at least one gene from the mutant.
+        crossover = np.random.random((n, d)) < CR[:, None]
+        crossover[rows, np.random.randint(0, d, n)] = True
+        trials = np.where(crossover, mutants, x)
+
+        return trials.astype(self.individuals.dtype, copy=False)
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """
+        Returns the state of the run as arrays, to be written in a checkpoint.
+
+        Must be called between generations, when no trials are waiting for `tell`.
+
+        Returns:
+            dict[str, np.ndarray]: The population, its fitness, the archive, mu_F,
+                                   mu_CR, the generation and the random generator state.
+        """
+        state = {'generation': np.array(self.generation),
+                 'mu_F': np.array(self.mu_F),
+                 'mu_CR': np.array(self.mu_CR),
+                 **get_random_state()}
+        if self.individuals is not None:
+            state.update(individuals=self.individuals, archive=self.archive)
+        if self.fitness is not None:
+            state['fitness'] = self.fitness
+        return state
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        """
+        Restores the state of the run returned by `get_state`.
+
+        Args:
+            state (dict[str, np.ndarray]): The arrays of the run state.
+        """
+        self.generation = int(state['generation'])
+        self.mu_F = float(state['mu_F'])
+        self.mu_CR = float(state['mu_CR'])
+        self.individuals = state.get('individuals')
+        self.archive = state.get('archive')
+        self.fitness = state.get('fitness')
+        self.trials = None
+        set_random_state(state)
+
+    def set_checkpointer(self, checkpointer: Checkpointer) -> None:
+        self.checkpointer = checkpointer
+
+    def set_telemetry(self, telemetry: TelemetrySink) -> None:
+        self.telemetry = telemetry
@@ -0,0 +1,62 @@
+from src.distance.abstract_distance import AbstractDistance
+import numpy as np
+
+
+class CoordinateDistance(AbstractDistance):
+    """
+    Provides Euclidean distances computed on the fly from city coordinates.
+
+    Only the coordinates are kept in memory, and distances are computed for
+    the rows and edges that are requested.
+
+    Parameters:
+        coordinates (np.ndarray): The (n_cities, n_dim) coordinates of the cities.
+        metric (str): 'euclidean' for exact distances, or the TSPLIB rounded
+                      variants 'euc_2d', 'ceil_2d' and 'att'.
+    """
+
+    metrics = ('euclidean', 'euc_2d', 'ceil_2d', 'att')
+
+    def __init__(self, coordinates: np.ndarray, metric: str = 'euclidean') -> None:
+        if metric not in self.metrics:
+            raise ValueError(f"metric must be one of {self.metrics}")
+
+        self.coordinates = np.asarray(coordinates, dtype=float)
+        self.metric = metric
+
+    @property
+    def n_cities(self) -> int:
+        return self.coordinates.shape[0]
+
+    def rows(self, indices: np.ndarray) -> np.ndarray:
+        origins = self.coordinates[indices]
+        squared = np.zeros((origins.shape[0], self.n_cities))
+        for k in range(self.coordinates.shape[1]):
+            squared += np.square(origins[:, k, None] - self.coordinates[None, :, k])
+        return self.apply_metric(squared)
+
+    def edges(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        diff = self.coordinates[i] - self.coordinates[j]
+        return self.apply_metric(np.sum(diff * diff, axis=-1))
+
+    def apply_metric(self, squared: np.ndarray) -> np.ndarray:
+        """
+        Converts squared Euclidean distances into distances of the chosen metric.
+
+        Args:
+            squared (np.ndarray): The squared Euclidean distances.
+
+        Returns:
+            np.ndarray: The distances.
+        """
+        if self.metric == 'att':
+            pseudo = np.sqrt(squared / 10.0)
+            rounded = np.floor(pseudo + 0.5)
+            return np.where(rounded < pseudo, rounded + 1, rounded)
+
+        distances = np.sqrt(squared)
+        if self.metric == 'euc_2d':
+            return np.floor(distances + 0.5)
+        if self.metric == 'ceil_2d':
+            return np.ceil(distances)
+        return distances
@@ -0,0 +1,41 @@
+from src.distance.abstract_distance import AbstractDistance
+import numpy as np
+
+
+class MatrixDistance(AbstractDistance):
+    """
+    Provides distances from a dense matrix held in memory.
+
+    The matrix is never modified by the provider.
+
+    Parameters:
+        distance_matrix (np.ndarray): The (n_cities, n_cities) distance matrix.
+    """
+
+    def __init__(self, distance_matrix: np.ndarray) -> None:
+        self.distance_matrix = distance_matrix
+
+    @property
+    def n_cities(self) -> int:
+        return self.distance_matrix.shape[0]
+
+    def rows(self, indices: np.ndarray) -> np.ndarray:
+        return self.distance_matrix[indices]
+
+    def edges(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        return self.distance_matrix[i, j]
+
+
+def as_distance(distance_matrix) -> AbstractDistance:
+    """
+    Wraps a distance matrix into a distance provider.
+
+    Args:
+        distance_matrix (np.ndarray | AbstractDistance): A dense matrix or a provider.
+
+    Returns:
+        AbstractDistance: The given provider, or a MatrixDistance over the matrix.
+    """
+    if distance_matrix is None or isinstance(distance_matrix, AbstractDistance):
+        return distance_matrix
+    return MatrixDistance(np.asarray(distance_matrix))
@@ -0,0 +1,41 @@
+from src.distance.matrix_distance import MatrixDistance
+import numpy as np
+
+
+class MemmapDistance(MatrixDistance):
+    """
+    Provides distances from a matrix stored on disk in `.npy` format.
+
+    The file is memory-mapped, so only the pages of the requested rows and
+    edges are read into memory by the operating system.
+
+    Parameters:
+        path (str): The path of the `.npy` file with the distance matrix.
+        mode (str): The memory-map mode, 'r' for read-only or 'r+' for read/write.
+    """
+
+    def __init__(self, path: str, mode: str = 'r') -> None:
+        self.path = path
+        super().__init__(np.load(path, mmap_mode=mode))
+
+    @classmethod
+    def create(cls, path: str, n_cities: int, dtype: np.dtype = np.float32) -> 'MemmapDistance':
+        """
+        Creates an empty on-disk matrix to be filled row by row.
+
+        Args:
+            path (str): The path of the `.npy` file to create.
+            n_cities (int): The number of cities.
+            dtype (np.dtype): The data type of the distances.
+
+        Returns:
+            MemmapDistance: A writable provider over the new file.
+        """
+        matrix = np.lib.format.open_memmap(path, mode='w+', dtype=dtype,
+                                           shape=(n_cities, n_cities))
+        del matrix
+        return cls(path, mode='r+')
+
+    def flush(self) -> None:
+        """Writes the pending changes of a writable matrix to disk."""
+        self.distance_matrix.flush()
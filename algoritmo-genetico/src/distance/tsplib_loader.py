@@ -0,0 +1,123 @@
+import itertools
+import numpy as np
+from src.distance.abstract_distance import AbstractDistance
+from src.distance.matrix_distance import MatrixDistance
+from src.distance.memmap_distance import MemmapDistance
+from src.distance.coordinate_distance import CoordinateDistance
+
+COORDINATE_METRICS = {
+    'EUC_2D': 'euc_2d',
+    'EUC_3D': 'euc_2d',
+    'CEIL_2D': 'ceil_2d',
+    'ATT': 'att',
+}
+
+
+def load_tsplib(path: str, memmap_path: str = None,
+                dtype: np.dtype = np.float32) -> AbstractDistance:
+    """
+    Loads a TSPLIB instance reading the file line by line.
+
+    Instances given by node coordinates become a CoordinateDistance, so no
+    matrix is ever built. Instances given by explicit edge weights are
+    streamed row by row into a matrix, which is written to `memmap_path`
+    when given, so that the whole file is never held in memory.
+
+    Args:
+        path (str): The path of the TSPLIB file.
+        memmap_path (str, optional): The `.npy` file where explicit weights are written.
+        dtype (np.dtype, optional): The data type of explicit weights.
+
+    Returns:
+        AbstractDistance: The distance provider of the instance.
+    """
+    header = {}
+
+    with open(path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+
+            if ':' in line:
+                key, value = line.split(':', 1)
+                header[key.strip().upper()] = value.strip()
+                continue
+
+            section = line.upper()
+            n_cities = int(header['DIMENSION'])
+            weight_type = header.get('EDGE_WEIGHT_TYPE', 'EXPLICIT').upper()
+
+            if section == 'NODE_COORD_SECTION':
+                if weight_type not in COORDINATE_METRICS:
+                    raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {weight_type}")
+                coordinates = read_coordinates(file, n_cities)
+                return CoordinateDistance(coordinates, COORDINATE_METRICS[weight_type])
+
+            if section == 'EDGE_WEIGHT_SECTION':
+                weight_format = header.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX').upper()
+                if memmap_path is None:
+                    distance = MatrixDistance(np.zeros((n_cities, n_cities), dtype=dtype))
+                else:
+                    distance = MemmapDistance.create(memmap_path, n_cities, dtype)
+                read_weights(file, distance.distance_matrix, weight_format)
+                if memmap_path is not None:
+                    distance.flush()
+                return distance
+
+            if section == 'EOF':
+                break
+
+    raise ValueError(f"No NODE_COORD_SECTION or EDGE_WEIGHT_SECTION found in {path}")
+
+
+def read_coordinates(file, n_cities: int) -> np.ndarray:
+    """
+    Reads the NODE_COORD_SECTION of a TSPLIB file.
+
+    Args:
+        file: The open file, positioned after the section keyword.
+        n_cities (int): The number of cities.
+
+    Returns:
+        np.ndarray: The (n_cities, n_dim) coordinates, ordered by node id.
+    """
+    coordinates = None
+
+    for _ in range(n_cities):
+        values = file.readline().split()
+        if coordinates is None:
+            coordinates = np.empty((n_cities, len(values) - 1))
+        coordinates[int(values[0]) - 1] = [float(v) for v in values[1:]]
+
+    return coordinates
+
+
+def read_weights(file, matrix: np.ndarray, weight_format: str) -> None:
+    """
+    Streams the EDGE_WEIGHT_SECTION of a TSPLIB file into a matrix, row by row.
+
+    Args:
+        file: The open file, positioned after the section keyword.
+        matrix (np.ndarray): The (n_cities, n_cities) matrix to fill.
+        weight_format (str): The TSPLIB EDGE_WEIGHT_FORMAT.
+    """
+    n_cities = matrix.shape[0]
+    tokens = (float(token) for line in file for token in line.split())
+
+    def read(count: int) -> np.ndarray:
+        return np.fromiter(itertools.islice(tokens, count), dtype=matrix.dtype, count=count)
+
+    for i in range(n_cities):
+        if weight_format == 'FULL_MATRIX':
+            matrix[i] = read(n_cities)
+        elif weight_format == 'UPPER_ROW':
+            matrix[i, i + 1:] = matrix[i + 1:, i] = read(n_cities - i - 1)
+        elif weight_format == 'UPPER_DIAG_ROW':
+            matrix[i, i:] = matrix[i:, i] = read(n_cities - i)
+        elif weight_format == 'LOWER_ROW':
+            matrix[i, :i] = matrix[:i, i] = read(i)
+        elif weight_format == 'LOWER_DIAG_ROW':
+            matrix[i, :i + 1] = matrix[:i + 1, i] = read(i + 1)
+        else:
+            raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT: {weight_format}")
@@ -0,0 +1,442 @@
+import os
+import json
+import math
+import time
+import socket
+import struct
+import argparse
+import importlib
+import selectors
+import threading
+import numpy as np
+from typing import Callable
+from src.objective import Objective, is_vectorized
+
+HEADER = struct.Struct('!4sBQIQ')
+MAGIC = b'EVAL'
+
+# The largest JSON description and array accepted from a peer.
+MAX_DESCRIPTION = 1 << 16
+MAX_PAYLOAD = 1 << 30
+
+JOIN, BATCH, RESULT, STOP, ERROR = range(1, 6)
+
+
+def send_message(connection: socket.socket, kind: int, batch_id: int = 0,
+                 array: np.ndarray = None, **meta) -> None:
+    """
+    Sends a message with an optional array as a raw buffer.
+
+    Args:
+        connection (socket.socket): The connected socket.
+        kind (int): The message kind (JOIN, BATCH, RESULT, STOP or ERROR).
+        batch_id (int, optional): The batch the message refers to.
+        array (np.ndarray, optional): The array to send.
+        **meta: Extra JSON fields, such as the worker name or an error message.
+    """
+    payload = b''
+    if array is not None:
+        array = np.ascontiguousarray(array)
+        meta.update(dtype=array.dtype.str, shape=array.shape)
+        payload = memoryview(array).cast('B')
+
+    description = json.dumps(meta).encode()
+    connection.sendall(HEADER.pack(MAGIC, kind, batch_id, len(description), len(payload)) + description)
+    if len(payload):
+        connection.sendall(payload)
+
+
+def receive_exactly(connection: socket.socket, n_bytes: int, buffer=None) -> bytearray:
+    buffer = bytearray(n_bytes) if buffer is None else buffer
+    view = memoryview(buffer).cast('B')
+    received = 0
+    while received < n_bytes:
+        n_received = connection.recv_into(view[received:])
+        if n_received == 0:
+            raise ConnectionError("connection closed by the peer")
+        received += n_received
+    return buffer
+
+
+def receive_message(connection: socket.socket,
+                    max_payload: int = MAX_PAYLOAD) -> tuple[int, int, dict, np.ndarray]:
+    """
+    Receives a message sent by `send_message`.
+
+    Only arrays of booleans, integers and floats are accepted, so a peer cannot
+    make the receiver build object arrays from raw bytes, and the description
+    and the array are limited in size before anything is allocated.
+
+    Args:
+        connection (socket.socket): The connected socket.
+        max_payload (int, optional): The largest array accepted, in bytes.
+
+    Returns:
+        tuple[int, int, dict, np.ndarray]: The kind, the batch id, the JSON fields
+                                           and the array (None if there is none).
+    """
+    magic, kind, batch_id, description_size, payload_size = \
+        HEADER.unpack(receive_exactly(connection, HEADER.size))
+    if magic != MAGIC:
+        raise ConnectionError("unexpected data on the evaluation connection")
+    if description_size > MAX_DESCRIPTION or payload_size > max_payload:
+        raise ConnectionError("the message is larger than allowed")
+
+    meta = json.loads(receive_exactly(connection, description_size)) if description_size else {}
+    if not isinstance(meta, dict):
+        raise ConnectionError("the message description is not a JSON object")
+
+    array = None
+    if 'dtype' in meta:
+        dtype, shape = array_description(meta)
+        if math.prod(shape) * dtype.itemsize != payload_size:
+            raise ConnectionError("the array size does not match its description")
+        # Receives straight into an aligned array, as it would be allocated locally.
+        array = np.empty(shape, dtype=dtype)
+        receive_exactly(connection, payload_size, array)
+    elif payload_size:
+        raise ConnectionError("the message has data without an array description")
+
+    return kind, batch_id, meta, array
+
+
+def array_description(meta: dict) -> tuple[np.dtype, tuple[int, ...]]:
+    """Returns the dtype and shape of a received array, if they describe a numeric array."""
+    try:
+        dtype = np.dtype(meta['dtype'])
+    except (TypeError, ValueError):
+        raise ConnectionError("the array dtype is not valid") from None
+    if dtype.kind not in 'biuf' or dtype.hasobject:
+        raise ConnectionError(f"arrays of dtype {dtype} are not accepted")
+
+    shape = meta.get('shape')
+    if not isinstance(shape, list) or \
+       not all(isinstance(size, int) and not isinstance(size, bool) and size >= 0 for size in shape):
+        raise ConnectionError("the array shape is not valid")
+    return dtype, tuple(shape)
+
+
+class Worker:
+    """
+    The master's view of a connected worker.
+
+    Parameters:
+        connection (socket.socket): The connection to the worker.
+        name (str): The name the worker joined with.
+    """
+
+    def __init__(self, connection: socket.socket, name: str) -> None:
+        self.connection = connection
+        self.name = name
+        self.throughput = None
+        self.batch = None
+        self.sent_at = None
+
+    def update_throughput(self, n_rows: int, elapsed: float, smoothing: float = 0.5) -> None:
+        """Updates the moving average of the rows evaluated per second."""
+        rate = n_rows / max(elapsed, 1e-9)
+        self.throughput = rate if self.throughput is None else \
+                          smoothing * rate + (1 - smoothing) * self.throughput
+
+
+class DistributedEvaluator:
+    """
+    Evaluates populations on remote workers connected over TCP.
+
+    Every message is a fixed header followed by a small JSON description and
+    a raw array buffer, so genomes and fitness values are sent without pickling.
+
+    Workers can join and leave at any time. Each call splits the population in
+    batches sized by the measured throughput of each worker, so faster
+    workers receive more rows, and the remaining rows are handed out as
+    workers finish, in smaller and smaller batches. A batch whose worker
+    disconnects, or does not answer within `timeout` seconds, is resubmitted
+    to another worker, and the slow worker is dropped.
+
+    Parameters:
+        address (tuple[str, int]): The (host, port) to listen on. Port 0 picks a free port.
+                                   Listens on this machine only by default; use ('0.0.0.0', port)
+                                   on a trusted network to accept remote workers.
+        timeout (float): The seconds a worker has to answer a batch.
+        join_timeout (float): The seconds to wait for a worker when none is connected.
+        min_batch (int): The smallest batch sent to a worker.
+    """
+
+    def __init__(self, address: tuple[str, int] = ('127.0.0.1', 5555), timeout: float = 60.0,
+                 join_timeout: float = 60.0, min_batch: int = 1) -> None:
+        self.timeout = timeout
+        self.join_timeout = join_timeout
+        self.min_batch = min_batch
+
+        self.listener = socket.create_server(address)
+        self.address = self.listener.getsockname()[:2]
+        self.workers: list[Worker] = []
+        self.lock = threading.Condition()
+        self.next_batch = 0
+        self.closed = False
+
+        self.thread = threading.Thread(target=self.accept_loop, daemon=True)
+        self.thread.start()
+
+    def __enter__(self) -> 'DistributedEvaluator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def n_workers(self) -> int:
+        """Returns the number of connected workers."""
+        with self.lock:
+            return len(self.workers)
+
+    def accept_loop(self) -> None:
+        while not self.closed:
+            try:
+                connection, _ = self.listener.accept()
+            except OSError:
+                break
+
+            try:
+                connection.settimeout(self.timeout)
+                kind, _, meta, _ = receive_message(connection)
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (OSError, ValueError):
+                connection.close()
+                continue
+
+            if kind != JOIN:
+                connection.close()
+                continue
+
+            with self.lock:
+                self.workers.append(Worker(connection, meta.get('name', 'worker')))
+                self.lock.notify_all()
+
+    def remove(self, worker: Worker) -> None:
+        with self.lock:
+            if worker in self.workers:
+                self.workers.remove(worker)
+        worker.connection.close()
+
+    def batch_size(self, worker: Worker, workers: list[Worker], n_remaining: int) -> int:
+        """
+        Returns the rows to send to a worker: half of its throughput share of the
+        remaining rows, so the last batches are small and finish together.
+        """
+        known = [other.throughput for other in workers if other.throughput is not None]
+        default = np.mean(known) if known else 1.0
+        total = sum(default if other.throughput is None else other.throughput for other in workers)
+        share = (default if worker.throughput is None else worker.throughput) / total
+
+        return min(n_remaining, max(self.min_batch, math.ceil(n_remaining * share / 2)))
+
+    def __call__(self, population: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a population on the workers.
+
+        Args:
+            population (np.ndarray): The (N, D) candidates to evaluate.
+
+        Returns:
+            np.ndarray: The N fitness values, or the (N, M) objectives of multi-objective functions.
+        """
+        population = np.ascontiguousarray(population)
+        n_rows = population.shape[0]
+        fitness = np.empty(n_rows, dtype=float) if n_rows == 0 else None
+
+        unassigned = [(0, n_rows)] if n_rows else []
+        in_flight: dict[int, tuple[Worker, int, int]] = {}
+        selector = selectors.DefaultSelector()
+        registered = set()
+
+        try:
+            while unassigned or in_flight:
+                with self.lock:
+                    if not self.workers and not self.lock.wait_for(lambda: self.workers or self.closed,
+                                                                   self.join_timeout):
+                        raise RuntimeError(f"No evaluation worker joined within {self.join_timeout} s")
+                    if self.closed:
+                        raise RuntimeError("The evaluator is closed")
+                    workers = list(self.workers)
+
+                # Hands out rows to the idle workers.
+                for worker in workers:
+                    if not unassigned:
+                        break
+                    if worker.batch is not None:
+                        continue
+
+                    start, stop = unassigned.pop(0)
+                    size = self.batch_size(worker, workers, stop - start)
+                    if start + size < stop:
+                        unassigned.insert(0, (start + size, stop))
+
+                    batch_id = self.next_batch
+                    self.next_batch += 1
+                    try:
+                        send_message(worker.connection, BATCH, batch_id, population[start:start + size])
+                    except OSError:
+                        unassigned.insert(0, (start, start + size))
+                        self.remove(worker)
+                        continue
+
+                    worker.batch, worker.sent_at = batch_id, time.monotonic()
+                    in_flight[batch_id] = (worker, start, start + size)
+                    if worker not in registered:
+                        selector.register(worker.connection, selectors.EVENT_READ, worker)
+                        registered.add(worker)
+
+                # Collects the answers.
+                for key, _ in selector.select(timeout=0.05):
+                    worker = key.data
+                    try:
+                        kind, batch_id, meta, values = receive_message(worker.connection)
+                    except (OSError, ValueError):
+                        kind = None
+
+                    if kind == ERROR:
+                        raise RuntimeError(f"Worker {worker.name} failed: {meta.get('message')}")
+                    if kind != RESULT or batch_id not in in_flight:
+                        self.drop(worker, in_flight, unassigned, selector, registered)
+                        continue
+
+                    _, start, stop = in_flight[batch_id]
+                    if not self.valid_result(values, stop - start, fitness):
+                        self.drop(worker, in_flight, unassigned, selector, registered)
+                        continue
+
+                    del in_flight[batch_id]
+                    if fitness is None:
+                        fitness = np.empty((n_rows,) + values.shape[1:], dtype=float)
+                    fitness[start:stop] = values
+                    worker.update_throughput(stop - start, time.monotonic() - worker.sent_at)
+                    worker.batch = None
+
+                # Resubmits the batches of workers that timed out or left.
+                now = time.monotonic()
+                with self.lock:
+                    connected = set(self.workers)
+                for worker, start, stop in list(in_flight.values()):
+                    if worker not in connected or now - worker.sent_at > self.timeout:
+                        self.drop(worker, in_flight, unassigned, selector, registered)
+        finally:
+            # A worker still busy after an error would answer a batch of this call later.
+            for worker, _, _ in list(in_flight.values()):
+                self.drop(worker, in_flight, unassigned, selector, registered)
+            for worker in registered:
+                try:
+                    selector.unregister(worker.connection)
+                except (KeyError, ValueError):
+                    pass
+            selector.close()
+
+        return fitness
+
+    @staticmethod
+    def valid_result(values: np.ndarray, n_rows: int, fitness: np.ndarray) -> bool:
+        """Checks that a result has one fitness value, or objective vector, per row of its batch."""
+        if values is None or values.ndim not in (1, 2) or values.shape[0] != n_rows:
+            return False
+        return fitness is None or values.shape[1:] == fitness.shape[1:]
+
+    def drop(self, worker: Worker, in_flight: dict, unassigned: list,
+             selector: selectors.BaseSelector, registered: set) -> None:
+        """Disconnects a worker and puts its batch back in the unassigned rows."""
+        if worker.batch in in_flight:
+            _, start, stop = in_flight.pop(worker.batch)
+            unassigned.insert(0, (start, stop))
+        worker.batch = None
+
+        if worker in registered:
+            try:
+                selector.unregister(worker.connection)
+            except (KeyError, ValueError):
+                pass
+            registered.discard(worker)
+        self.remove(worker)
+
+    def close(self) -> None:
+        """Stops the workers and closes the connections."""
+        with self.lock:
+            self.closed = True
+            workers, self.workers = self.workers, []
+            self.lock.notify_all()
+
+        self.listener.close()
+        for worker in workers:
+            try:
+                send_message(worker.connection, STOP)
+            except OSError:
+                pass
+            worker.connection.close()
+
+
+def serve_worker(function: Callable[[np.ndarray], np.ndarray], address: tuple[str, int],
+                 name: str = None) -> int:
+    """
+    Connects to a master and evaluates its batches until it stops or disconnects.
+
+    Also available from the command line, from the project directory:
+
+        python -m src.distributed master-host:5555 module:fitness_function
+
+    Args:
+        function (Callable[[np.ndarray], np.ndarray]): The fitness function. Objectives and
+                                                       functions declared with `vectorized`
+                                                       are called once per batch, other
+                                                       functions once per row.
+        address (tuple[str, int]): The (host, port) of the master.
+        name (str, optional): The name shown by the master. Defaults to '<host>-<pid>'.
+
+    Returns:
+        int: The number of batches evaluated.
+    """
+    if isinstance(function, Objective) or is_vectorized(function):
+        objective = function
+    else:
+        objective = lambda batch: [function(row) for row in batch]
+    n_batches = 0
+
+    with socket.create_connection(address) as connection:
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        send_message(connection, JOIN, name=name or f'{socket.gethostname()}-{os.getpid()}')
+
+        while True:
+            try:
+                kind, batch_id, _, batch = receive_message(connection)
+            except (OSError, ValueError):
+                break
+            if kind != BATCH:
+                break
+
+            try:
+                fitness = np.asarray(objective(batch), dtype=float)
+                kind, meta = RESULT, {}
+            except Exception as error:
+                fitness, kind, meta = None, ERROR, {'message': f'{type(error).__name__}: {error}'}
+
+            try:
+                send_message(connection, kind, batch_id, fitness, **meta)
+            except OSError:
+                break
+            n_batches += kind == RESULT
+
+    return n_batches
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Runs a distributed evaluation worker.')
+    parser.add_argument('master', help='the master address, host:port')
+    parser.add_argument('function', help='the fitness function, module:attribute')
+    parser.add_argument('--name', help='the worker name shown by the master')
+    args = parser.parse_args(argv)
+
+    host, port = args.master.rsplit(':', 1)
+    module, attribute = args.function.split(':')
+    function = getattr(importlib.import_module(module), attribute)
+    serve_worker(function, (host, int(port)), args.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+from src.initialization.abstract_initialization import AbstractInitialization
+import numpy as np
+
+class LatinHypercubeInitialization(AbstractInitialization):
+    """
+    Implements Latin hypercube sampling.
+
+    Each axis is split in n_individuals strata of equal width and every
+    stratum holds exactly one individual, so each gene covers its whole range
+    evenly, unlike independent uniform samples that leave gaps and clusters.
+
+    Parameters:
+        centered (bool): If True, samples the center of the strata instead of a
+                         random point inside them.
+    """
+
+    def __init__(self, centered: bool = False) -> None:
+        self.centered = centered
+
+    def initialize(self, n_individuals: int, n_genes: int) -> np.ndarray:
+        """
+        Samples the unit hypercube with one individual per stratum of each axis.
+
+        Args:
+            n_individuals (int): The number of individuals to create.
+            n_genes (int): The number of genes in each individual.
+
+        Returns:
+            np.ndarray: The samples in [0, 1).
+        """
+        # One random permutation of the strata per gene.
+        strata = np.argsort(np.random.random((n_genes, n_individuals)), axis=1).T
+        offsets = 0.5 if self.centered else np.random.random((n_individuals, n_genes))
+        return (strata + offsets) / n_individuals
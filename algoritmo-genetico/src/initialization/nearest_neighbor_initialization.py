@@ -0,0 +1,45 @@
+from src.initialization.abstract_initialization import AbstractInitialization
+from src.distance.abstract_distance import AbstractDistance
+from src.distance.matrix_distance import as_distance
+import numpy as np
+
+class NearestNeighborInitialization(AbstractInitialization):
+    """
+    Seeds a population of tours with nearest neighbour tours.
+
+    A fraction of the individuals are built with the nearest neighbour
+    heuristic from distinct random start cities, the others are random
+    permutations, so the population starts with good tours without losing
+    its diversity. With `n_candidates` > 1 the seeded tours pick one of the
+    nearest unvisited cities at random (a randomized greedy construction).
+
+    Parameters:
+        distance_matrix (np.ndarray | AbstractDistance): The distances between the cities.
+        fraction (float): The fraction of the population built with the heuristic.
+        n_candidates (int): The number of nearest unvisited cities to choose from.
+    """
+
+    def __init__(self, distance_matrix: np.ndarray | AbstractDistance, fraction: float = 0.2,
+                 n_candidates: int = 1) -> None:
+        self.distance_matrix = as_distance(distance_matrix)
+        self.fraction = fraction
+        self.n_candidates = n_candidates
+
+    def initialize(self, n_individuals: int, n_genes: int) -> np.ndarray:
+        """
+        Creates the seeded tours followed by random permutations.
+
+        Args:
+            n_individuals (int): The number of individuals to create.
+            n_genes (int): The number of cities.
+
+        Returns:
+            np.ndarray: The tours.
+        """
+        n_seeded = min(int(round(self.fraction * n_individuals)), n_individuals)
+        starts = np.random.permutation(n_genes)[:n_seeded] if n_seeded <= n_genes else \
+                 np.random.randint(0, n_genes, n_seeded)
+
+        tours = np.argsort(np.random.random((n_individuals, n_genes)), axis=1)
+        tours[:n_seeded] = self.distance_matrix.nearest_neighbor_tours(starts, self.n_candidates)
+        return tours
@@ -0,0 +1,23 @@
+from src.initialization.abstract_initialization import AbstractInitialization
+import numpy as np
+
+class PermutationInitialization(AbstractInitialization):
+    """
+    Creates random permutations of the genes.
+
+    The permutations are built at once, as the argsort of a random matrix,
+    instead of one `np.random.choice` call per individual.
+    """
+
+    def initialize(self, n_individuals: int, n_genes: int) -> np.ndarray:
+        """
+        Creates one random permutation of range(n_genes) per individual.
+
+        Args:
+            n_individuals (int): The number of individuals to create.
+            n_genes (int): The number of genes in each individual.
+
+        Returns:
+            np.ndarray: The permutations.
+        """
+        return np.argsort(np.random.random((n_individuals, n_genes)), axis=1)
@@ -0,0 +1,120 @@
+from src.initialization.abstract_initialization import AbstractInitialization
+import numpy as np
+
+try:
+    from scipy.stats import qmc
+except ImportError:
+    qmc = None
+
+BITS = 30
+
+# Primitive polynomials and initial direction numbers of dimensions 2 to 64,
+# from the new-joe-kuo-6.21201 table of S. Joe and F. Y. Kuo. Each polynomial
+# is stored as the bits of its coefficients, e.g. 11 = 0b1011 = x^3 + x + 1.
+DIRECTION_NUMBERS = [
+    (3, (1,)), (7, (1, 3)), (11, (1, 3, 1)), (13, (1, 1, 1)), (19, (1, 1, 3, 3)),
+    (25, (1, 3, 5, 13)), (37, (1, 1, 5, 5, 17)), (41, (1, 1, 5, 5, 5)), (47, (1, 1, 7, 11, 19)),
+    (55, (1, 1, 5, 1, 1)), (59, (1, 1, 1, 3, 11)), (61, (1, 3, 5, 5, 31)),
+    (67, (1, 3, 3, 9, 7, 49)), (91, (1, 1, 1, 15, 21, 21)), (97, (1, 3, 1, 13, 27, 49)),
+    (103, (1, 1, 1, 15, 7, 5)), (109, (1, 3, 1, 15, 13, 25)), (115, (1, 1, 5, 5, 19, 61)),
+    (131, (1, 3, 7, 11, 23, 15, 103)), (137, (1, 3, 7, 13, 13, 15, 69)),
+    (143, (1, 1, 3, 13, 7, 35, 63)), (145, (1, 3, 5, 9, 1, 25, 53)),
+    (157, (1, 3, 1, 13, 9, 35, 107)), (167, (1, 3, 1, 5, 27, 61, 31)),
+    (171, (1, 1, 5, 11, 19, 41, 61)), (185, (1, 3, 5, 3, 3, 13, 69)),
+    (191, (1, 1, 7, 13, 1, 19, 1)), (193, (1, 3, 7, 5, 13, 19, 59)),
+    (203, (1, 1, 3, 9, 25, 29, 41)), (211, (1, 3, 5, 13, 23, 1, 55)),
+    (213, (1, 3, 7, 3, 13, 59, 17)), (229, (1, 3, 1, 3, 5, 53, 69)),
+    (239, (1, 1, 5, 5, 23, 33, 13)), (241, (1, 1, 7, 7, 1, 61, 123)),
+    (247, (1, 1, 7, 9, 13, 61, 49)), (253, (1, 3, 3, 5, 3, 55, 33)),
+    (285, (1, 3, 1, 15, 31, 13, 49, 245)), (299, (1, 3, 5, 15, 31, 59, 63, 97)),
+    (301, (1, 3, 1, 11, 11, 11, 77, 249)), (333, (1, 3, 1, 11, 27, 43, 71, 9)),
+    (351, (1, 1, 7, 15, 21, 11, 81, 45)), (355, (1, 3, 7, 3, 25, 31, 65, 79)),
+    (357, (1, 3, 1, 1, 19, 11, 3, 205)), (361, (1, 1, 5, 9, 19, 21, 29, 157)),
+    (369, (1, 3, 7, 11, 1, 33, 89, 185)), (391, (1, 3, 3, 3, 15, 9, 79, 71)),
+    (397, (1, 3, 7, 11, 15, 39, 119, 27)), (425, (1, 1, 3, 1, 11, 31, 97, 225)),
+    (451, (1, 1, 1, 3, 23, 43, 57, 177)), (463, (1, 3, 7, 7, 17, 17, 37, 71)),
+    (487, (1, 3, 1, 5, 27, 63, 123, 213)), (501, (1, 1, 3, 5, 11, 43, 53, 133)),
+    (529, (1, 3, 5, 5, 29, 17, 47, 173, 479)), (539, (1, 3, 3, 11, 3, 1, 109, 9, 69)),
+    (545, (1, 1, 1, 5, 17, 39, 23, 5, 343)), (557, (1, 3, 1, 5, 25, 15, 31, 103, 499)),
+    (563, (1, 1, 1, 11, 11, 17, 63, 105, 183)), (601, (1, 1, 5, 11, 9, 29, 97, 231, 363)),
+    (607, (1, 1, 5, 15, 19, 45, 41, 7, 383)), (617, (1, 3, 7, 7, 31, 19, 83, 137, 221)),
+    (623, (1, 1, 1, 3, 23, 15, 111, 223, 83)), (631, (1, 1, 5, 13, 31, 15, 55, 25, 161)),
+    (637, (1, 1, 3, 13, 25, 47, 39, 87, 257))
+
+]
+
+
+def direction_numbers(n_dims: int) -> np.ndarray:
+    """
+    Computes the direction numbers of the first dimensions of the Sobol sequence.
+
+    Args:
+        n_dims (int): The number of dimensions, at most len(DIRECTION_NUMBERS) + 1.
+
+    Returns:
+        np.ndarray: The (n_dims, BITS) direction numbers, scaled to BITS bits.
+    """
+    directions = np.zeros((n_dims, BITS), dtype=np.int64)
+    directions[0] = 1 << np.arange(BITS - 1, -1, -1)
+
+    for d, (polynomial, initial) in enumerate(DIRECTION_NUMBERS[:n_dims - 1], start=1):
+        degree = len(initial)
+        coefficients = [(polynomial >> (degree - k)) & 1 for k in range(1, degree)]
+        m = list(initial)
+        for k in range(degree, BITS):
+            value = m[k - degree] ^ (m[k - degree] << degree)
+            for j, coefficient in enumerate(coefficients, start=1):
+                if coefficient:
+                    value ^= m[k - j] << j
+            m.append(value)
+        directions[d] = [value << (BITS - 1 - k) for k, value in enumerate(m)]
+
+    return directions
+
+
+class SobolInitialization(AbstractInitialization):
+    """
+    Implements Sobol low-discrepancy sampling.
+
+    The Sobol sequence fills the hypercube more evenly than independent uniform
+    samples; the first 2^k points hold one point in each of the 2^k elementary
+    boxes of every axis. A random digital shift is applied on each run, from
+    the NumPy global generator, so every population is different while keeping
+    the even coverage. Populations of a power of two are the most balanced.
+
+    Up to 64 genes are generated from the Joe-Kuo table; larger genomes require
+    SciPy, which is used for them if it is installed.
+    """
+
+    def initialize(self, n_individuals: int, n_genes: int) -> np.ndarray:
+        """
+        Samples the unit hypercube with a randomly shifted Sobol sequence.
+
+        Args:
+            n_individuals (int): The number of individuals to create.
+            n_genes (int): The number of genes in each individual.
+
+        Returns:
+            np.ndarray: The samples in [0, 1).
+        """
+        if n_genes > len(DIRECTION_NUMBERS) + 1:
+            if qmc is None:
+                raise ValueError(f"Sobol sampling of more than {len(DIRECTION_NUMBERS) + 1} "
+                                 "genes requires scipy")
+            sampler = qmc.Sobol(n_genes, scramble=True, seed=np.random.randint(2**32))
+            return sampler.random_base2(int(np.ceil(np.log2(max(n_individuals, 1)))))[:n_individuals]
+
+        if n_individuals > 2**BITS:
+            raise ValueError(f"Sobol sampling is limited to 2**{BITS} individuals")
+
+        directions = direction_numbers(n_genes)
+        indices = np.arange(n_individuals, dtype=np.int64)
+        gray = indices ^ (indices >> 1)
+
+        # The point of index i is the XOR of the directions of the bits of its Gray code.
+        points = np.zeros((n_individuals, n_genes), dtype=np.int64)
+        for bit in range(int(n_individuals).bit_length()):
+            points ^= ((gray >> bit) & 1)[:, None] * directions[:, bit]
+
+        points ^= np.random.randint(0, 2**BITS, n_genes, dtype=np.int64)
+        return points / 2**BITS
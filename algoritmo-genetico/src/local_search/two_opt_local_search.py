@@ -0,0 +1,173 @@
+from src.local_search.abstract_local_search import AbstractLocalSearch
+from src.distance.matrix_distance import MatrixDistance
+from src.backend import Kernel
+import numpy as np
+
+
+class TwoOptLocalSearch(AbstractLocalSearch):
+    """
+    Implements the 2-opt local search for permutation individuals.
+
+    A 2-opt move removes two edges of the tour and reconnects it by reversing
+    the segment between them. For each city, the moves towards all of its
+    neighbours are evaluated at once, in both tour directions, and the best
+    improving one is applied. With the numba backend and a dense distance
+    matrix, the whole search of a tour runs in a compiled kernel.
+
+    Parameters:
+        distance_matrix (np.ndarray | AbstractDistance): The distances between cities.
+        n_neighbors (int): The number of nearest cities considered for each move.
+        apply_to (str): Which solutions are improved: 'all', 'top_k' or 'best'.
+        top_k (int): The number of solutions improved when apply_to is 'top_k'.
+    """
+
+    def improve_tour(self, tour: np.ndarray) -> tuple[np.ndarray, float]:
+        if two_opt_tour.active and isinstance(self.distance_matrix, MatrixDistance):
+            tour = np.array(tour)
+            matrix = np.asarray(self.distance_matrix.distance_matrix)
+            return tour, two_opt_tour(tour, matrix, self.neighbors)
+        return super().improve_tour(tour)
+
+    def improve_city(self, tour: np.ndarray, position: np.ndarray,
+                     city: int) -> tuple[float, list[int]]:
+        d = self.distance_matrix
+        n_cities = tour.shape[0]
+        i = position[city]
+        candidates = self.neighbors[city]
+        j = position[candidates]
+
+        # Successor direction: (a, b), (c, succ c) -> (a, c), (b, succ c)
+        succ = tour[(i + 1) % n_cities]
+        succ_c = tour[(j + 1) % n_cities]
+        delta_succ = d[city, candidates] + d[succ, succ_c] - d[city, succ] - d[candidates, succ_c]
+        delta_succ[(candidates == succ) | (succ_c == city)] = np.inf
+
+        # Predecessor direction: (pred a, a), (pred c, c) -> (a, c), (pred a, pred c)
+        pred = tour[(i - 1) % n_cities]
+        pred_c = tour[(j - 1) % n_cities]
+        delta_pred = d[city, candidates] + d[pred, pred_c] - d[pred, city] - d[pred_c, candidates]
+        delta_pred[(candidates == pred) | (pred_c == city)] = np.inf
+
+        best_succ = np.argmin(delta_succ)
+        best_pred = np.argmin(delta_pred)
+
+        if delta_succ[best_succ] <= delta_pred[best_pred]:
+            delta = delta_succ[best_succ]
+            if delta >= -1e-10:
+                return 0.0, []
+            c = candidates[best_succ]
+            touched = [city, succ, c, succ_c[best_succ]]
+            self.reverse(tour, position, (i + 1) % n_cities, j[best_succ])
+        else:
+            delta = delta_pred[best_pred]
+            if delta >= -1e-10:
+                return 0.0, []
+            c = candidates[best_pred]
+            touched = [city, pred, c, pred_c[best_pred]]
+            self.reverse(tour, position, j[best_pred], (i - 1) % n_cities)
+
+        return float(delta), touched
+
+    @staticmethod
+    def reverse(tour: np.ndarray, position: np.ndarray, start: int, end: int) -> None:
+        """Reverses the cyclic tour segment from position start to end, inclusive.
+
+        The complementary segment is reversed instead when it is shorter, which
+        yields the same cycle.
+
+        Args:
+            tour (np.ndarray): The tour, modified in place.
+            position (np.ndarray): The position of each city, kept in sync.
+            start (int): The first position of the segment.
+            end (int): The last position of the segment.
+        """
+        n_cities = tour.shape[0]
+        length = (end - start) % n_cities + 1
+        if 2 * length > n_cities:
+            start, end = (end + 1) % n_cities, (start - 1) % n_cities
+            length = n_cities - length
+
+        idx = (start + np.arange(length)) % n_cities
+        tour[idx] = tour[idx[::-1]]
+        position[tour[idx]] = idx
+
+
+def two_opt_tour_loop(tour, matrix, neighbors):
+    n_cities = tour.shape[0]
+    position = np.empty(n_cities, dtype=np.int64)
+    for k in range(n_cities):
+        position[tour[k]] = k
+
+    active = np.ones(n_cities, dtype=np.bool_)
+    queue = np.empty(n_cities, dtype=np.int64)
+    for k in range(n_cities):
+        queue[k] = tour[k]
+    head, size = 0, n_cities
+    touched = np.empty(4, dtype=np.int64)
+    total_delta = 0.0
+
+    while size > 0:
+        city = queue[head]
+        head = (head + 1) % n_cities
+        size -= 1
+        active[city] = False
+
+        i = position[city]
+        succ = tour[(i + 1) % n_cities]
+        pred = tour[(i - 1) % n_cities]
+        best_succ, best_pred = np.inf, np.inf
+        c_succ, c_pred = -1, -1
+
+        for c in neighbors[city]:
+            j = position[c]
+            succ_c = tour[(j + 1) % n_cities]
+            if c != succ and succ_c != city:
+                delta = matrix[city, c] + matrix[succ, succ_c] - matrix[city, succ] - matrix[c, succ_c]
+                if delta < best_succ:
+                    best_succ, c_succ = delta, c
+            pred_c = tour[(j - 1) % n_cities]
+            if c != pred and pred_c != city:
+                delta = matrix[city, c] + matrix[pred, pred_c] - matrix[pred, city] - matrix[pred_c, c]
+                if delta < best_pred:
+                    best_pred, c_pred = delta, c
+
+        if best_succ <= best_pred:
+            if best_succ >= -1e-10:
+                continue
+            j = position[c_succ]
+            touched[0], touched[1], touched[2], touched[3] = city, succ, c_succ, tour[(j + 1) % n_cities]
+            start, end = (i + 1) % n_cities, j
+            total_delta += best_succ
+        else:
+            if best_pred >= -1e-10:
+                continue
+            j = position[c_pred]
+            touched[0], touched[1], touched[2], touched[3] = city, pred, c_pred, tour[(j - 1) % n_cities]
+            start, end = j, (i - 1) % n_cities
+            total_delta += best_pred
+
+        length = (end - start) % n_cities + 1
+        if 2 * length > n_cities:
+            start, end = (end + 1) % n_cities, (start - 1) % n_cities
+            length = n_cities - length
+        for k in range(length // 2):
+            a, b = (start + k) % n_cities, (end - k) % n_cities
+            tour[a], tour[b] = tour[b], tour[a]
+            position[tour[a]], position[tour[b]] = a, b
+
+        for c in touched:
+            if not active[c]:
+                active[c] = True
+                queue[(head + size) % n_cities] = c
+                size += 1
+
+    return total_delta
+
+
+def two_opt_example() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    points = np.array([0.0, 3.0, 1.0, 4.0, 2.0])
+    matrix = np.abs(np.subtract.outer(points, points))
+    return np.arange(5), matrix, np.argsort(matrix, axis=1)[:, 1:]
+
+
+two_opt_tour = Kernel(two_opt_tour_loop, example=two_opt_example)
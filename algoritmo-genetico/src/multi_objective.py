@@ -0,0 +1,149 @@
+import numpy as np
+
+
+def dominance(rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """
+    Returns which candidates of `columns` each candidate of `rows` dominates.
+
+    All objectives are minimized. A candidate dominates another if it is no
+    worse in every objective and better in at least one.
+
+    Args:
+        rows (np.ndarray): The (R, M) objectives of the dominating candidates to test.
+        columns (np.ndarray): The (C, M) objectives of the dominated candidates to test.
+
+    Returns:
+        np.ndarray: The (R, C) boolean matrix, True where rows[i] dominates columns[j].
+    """
+    no_worse = np.ones((len(rows), len(columns)), dtype=bool)
+    better = np.zeros((len(rows), len(columns)), dtype=bool)
+
+    for row, column in zip(rows.T, columns.T):
+        no_worse &= row[:, None] <= column[None, :]
+        better |= row[:, None] < column[None, :]
+
+    return no_worse & better
+
+
+def non_dominated_sort(objectives: np.ndarray, chunk_size: int = None) -> np.ndarray:
+    """
+    Ranks candidates by Pareto front, as in the fast non-dominated sort of NSGA-II.
+
+    The dominance tests are done with broadcast comparisons, one objective at
+    a time, over blocks of `chunk_size` rows, so memory stays bounded for large
+    populations. The candidates are sorted lexicographically first, so a
+    candidate is only compared with the ones after it, and each front is only
+    compared with the candidates not ranked yet. Front 0 holds the
+    non-dominated candidates, front 1 the ones only dominated by front 0, and
+    so on.
+
+    Args:
+        objectives (np.ndarray): The (N, M) objectives, all minimized.
+        chunk_size (int, optional): The number of rows compared at once. If None,
+                                    blocks of about 2**24 comparisons are used.
+
+    Returns:
+        np.ndarray: The front of each candidate.
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    n_candidates = len(objectives)
+    chunk_size = chunk_size or max(1, 2**24 // max(n_candidates, 1))
+
+    # A candidate can only be dominated by candidates before it in lexicographic order.
+    order = np.lexsort(objectives.T[::-1])
+    objectives = objectives[order]
+
+    counts = np.zeros(n_candidates, dtype=np.int64)
+    for start in range(0, n_candidates, chunk_size):
+        counts[start:] += dominance(objectives[start:start + chunk_size], objectives[start:]).sum(axis=0)
+
+    ranks = np.full(n_candidates, -1, dtype=np.int64)
+    front = np.flatnonzero(counts == 0)
+    rank = 0
+
+    while front.size:
+        ranks[front] = rank
+        counts[front] = -1
+        remaining = np.flatnonzero(counts > 0)
+
+        for start in range(0, len(front), chunk_size):
+            rows = objectives[front[start:start + chunk_size]]
+            counts[remaining] -= dominance(rows, objectives[remaining]).sum(axis=0)
+
+        front = np.flatnonzero(counts == 0)
+        rank += 1
+
+    unsorted = np.empty_like(ranks)
+    unsorted[order] = ranks
+    return unsorted
+
+
+def crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    Computes the crowding distance of each candidate inside its front.
+
+    The distance is the sum over the objectives of the normalized gap between
+    the two neighbors of the candidate in its front. The extremes of each front
+    get an infinite distance, so they are always preferred.
+
+    Args:
+        objectives (np.ndarray): The (N, M) objectives.
+        ranks (np.ndarray): The front of each candidate.
+
+    Returns:
+        np.ndarray: The crowding distance of each candidate.
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    distance = np.zeros(len(objectives))
+
+    for column in objectives.T:
+        # Sorts by front, then by the objective, so each front is a contiguous block.
+        order = np.lexsort((column, ranks))
+        values = column[order]
+        fronts = ranks[order]
+
+        first = np.r_[True, fronts[1:] != fronts[:-1]]
+        last = np.r_[fronts[1:] != fronts[:-1], True]
+        starts = np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))
+        ends = np.minimum.accumulate(np.where(last, np.arange(len(order)), len(order))[::-1])[::-1]
+        span = values[ends] - values[starts]
+
+        gap = np.zeros(len(order))
+        inner = ~(first | last)
+        gap[inner] = (values[2:] - values[:-2])[inner[1:-1]]
+        gap[inner] = np.divide(gap[inner], span[inner], out=np.zeros(inner.sum()), where=span[inner] > 0)
+        gap[first | last] = np.inf
+
+        distance[order] += gap
+
+    return distance
+
+
+def crowded_key(ranks: np.ndarray, crowding: np.ndarray) -> np.ndarray:
+    """
+    Combines front and crowding distance into one value to minimize.
+
+    A lower front always wins and, inside a front, a larger crowding distance
+    wins, so the key can be used with any selection operator and np.argmin.
+
+    Args:
+        ranks (np.ndarray): The front of each candidate.
+        crowding (np.ndarray): The crowding distance of each candidate.
+
+    Returns:
+        np.ndarray: The crowded comparison key, in [rank, rank + 0.5].
+    """
+    return ranks + 1 / (2 + crowding)
+
+
+def pareto_front(objectives: np.ndarray) -> np.ndarray:
+    """
+    Returns the indices of the non-dominated candidates.
+
+    Args:
+        objectives (np.ndarray): The (N, M) objectives, all minimized.
+
+    Returns:
+        np.ndarray: The indices of front 0.
+    """
+    return np.flatnonzero(non_dominated_sort(objectives) == 0)
@@ -16,14 +16,14 @@ class AbstractMutation(ABC):
         """Applies mutation to a population of individuals.
 
         This method takes a population of individuals and a mutation rate, and
-        returns a new population with potential mutations applied.
+        applies the mutations in place, so no new population is allocated.
 
         Args:
             individuals (np.ndarray): The population of individuals to be mutated.
             mutation_rate (float): The probability of mutation for each gene.
 
         Returns:
-            np.ndarray: The mutated population of individuals.
+            np.ndarray: The mutated population of individuals (the same array).
 
         """
         pass
@@ -0,0 +1,116 @@
+import numpy as np
+from typing import Callable
+
+# The chunk size of the vectorized functions that do not accept attributes.
+_vectorized_functions = {}
+
+
+def vectorized(function: Callable = None, *, chunk_size: int = None) -> Callable:
+    """
+    Declares that an objective function is vectorized.
+
+    A vectorized function receives an (N, D) matrix with one candidate per row
+    and returns the N fitness values in a single call. Can be used as a
+    decorator (`@vectorized` or `@vectorized(chunk_size=1000)`) or called
+    directly to register functions that do not accept attributes, such as
+    builtins and NumPy ufunc wrappers.
+
+    Args:
+        function (Callable, optional): The function to declare.
+        chunk_size (int, optional): The maximum number of rows per call.
+
+    Returns:
+        Callable: The same function, now recognized as vectorized.
+    """
+    def declare(function: Callable) -> Callable:
+        try:
+            function.vectorized = True
+            function.chunk_size = chunk_size
+        except (AttributeError, TypeError):
+            _vectorized_functions[function] = chunk_size
+        return function
+
+    if function is None:
+        return declare
+    return declare(function)
+
+
+def is_vectorized(function: Callable) -> bool:
+    """Returns True if the function was declared as vectorized."""
+    if getattr(function, 'vectorized', False):
+        return True
+    try:
+        return function in _vectorized_functions
+    except TypeError:
+        return False
+
+
+def declared_chunk_size(function: Callable) -> int:
+    """Returns the chunk size declared with `vectorized`, or None."""
+    if hasattr(function, 'chunk_size'):
+        return function.chunk_size
+    try:
+        return _vectorized_functions.get(function)
+    except TypeError:
+        return None
+
+
+class Objective:
+    """
+    Evaluates an objective function over a whole population.
+
+    Vectorized functions are called once with the full (N, D) population, split
+    in chunks of at most `chunk_size` rows to bound memory. Scalar functions
+    are called once per row as a fallback.
+
+    Parameters:
+        function (Callable): The objective function.
+        vectorized (bool, optional): Whether the function is vectorized. If None,
+                                     it is detected from the `vectorized` declaration.
+        chunk_size (int, optional): The maximum number of rows per vectorized call.
+    """
+
+    def __init__(self, function: Callable, vectorized: bool = None, chunk_size: int = None) -> None:
+        self.function = function
+        self.vectorized = is_vectorized(function) if vectorized is None else vectorized
+        self.chunk_size = chunk_size or declared_chunk_size(function)
+
+    def __call__(self, population: np.ndarray) -> np.ndarray:
+        """
+        Evaluates all the candidates of a population.
+
+        Args:
+            population (np.ndarray): The (N, D) candidates to evaluate.
+
+        Returns:
+            np.ndarray: The N fitness values.
+        """
+        population = np.asarray(population)
+        n_candidates = population.shape[0]
+        fitness = np.empty(n_candidates, dtype=float)
+
+        if not self.vectorized:
+            for i, candidate in enumerate(population):
+                fitness[i] = self.function(candidate)
+            return fitness
+
+        step = self.chunk_size or max(n_candidates, 1)
+        for start in range(0, n_candidates, step):
+            fitness[start:start + step] = self.function(population[start:start + step])
+
+        return fitness
+
+
+def as_objective(function: Callable) -> Objective:
+    """
+    Wraps a function into an Objective, keeping objectives unchanged.
+
+    Args:
+        function (Callable | Objective): The objective function.
+
+    Returns:
+        Objective: The objective evaluating whole populations.
+    """
+    if function is None or isinstance(function, Objective):
+        return function
+    return Objective(function)
@@ -12,7 +12,8 @@ class AbstractSelection(ABC):
     """
 
     @abstractmethod
-    def select(self, fitness: np.ndarray, otimizer: Callable[[np.ndarray], int]) -> np.ndarray:
+    def select(self, fitness: np.ndarray, otimizer: Callable[[np.ndarray], int],
+               n_parents: int = None) -> np.ndarray:
         """Selects parents from a population based on fitness.
 
         This method takes a population's fitness values, and returns the
@@ -22,6 +23,8 @@ class AbstractSelection(ABC):
             fitness (np.ndarray): The fitness values of the individuals.
             otimize (Callable[[np.ndarray], int]) : The function to select best individuals
                                                     np.argmin() or np.argmax.
+            n_parents (int, optional): The number of parents to select, even. Defaults to
+                                       the number of individuals.
 
         Returns:
             np.ndarray: The indices of the selected parent individuals.
@@ -0,0 +1,42 @@
+import numpy as np
+from typing import Callable
+from src.selection.abstract_selection import AbstractSelection
+
+class CrowdedTournamentSelection(AbstractSelection):
+    """
+    Performs crowded tournament selection, as in NSGA-II.
+
+    Each parent is the winner of a tournament between `tournament_size`
+    random individuals. With the crowded comparison key of NSGA-II (see
+    `multi_objective.crowded_key`) and np.argmin, the individual in the best
+    front wins, and ties are broken by the largest crowding distance. All the
+    tournaments are drawn at once.
+
+    Parameters:
+        tournament_size (int): The number of individuals in each tournament.
+    """
+
+    def __init__(self, tournament_size: int = 2) -> None:
+        self.tournament_size = tournament_size
+
+    def select(self, fitness: np.ndarray, otimizer: Callable[[np.ndarray], int],
+               n_parents: int = None) -> np.ndarray:
+        """
+        Selects one parent per individual, or `n_parents`, with crowded tournaments.
+
+        Args:
+            fitness (np.ndarray): The comparison key of each individual.
+            otimizer (Callable[[np.ndarray], int]): The function to select the best individuals,
+                either np.argmin() or np.argmax().
+            n_parents (int, optional): The number of parents to select. Defaults to
+                the number of individuals.
+
+        Returns:
+            np.ndarray: The indices of the selected parent individuals.
+        """
+        n_individuals = fitness.shape[0]
+        n_parents = n_individuals if n_parents is None else n_parents
+        contestants = np.random.randint(0, n_individuals, (n_parents, self.tournament_size))
+        winners = otimizer(fitness[contestants], axis=1)
+
+        return contestants[np.arange(n_parents), winners]
@@ -4,7 +4,8 @@ from src.selection.abstract_selection import AbstractSelection
 
 class RouletteSelection(AbstractSelection):
 
-    def select(self, fitness: np.ndarray, otimizer: Callable[[np.ndarray], int]) -> np.ndarray:
+    def select(self, fitness: np.ndarray, otimizer: Callable[[np.ndarray], int],
+               n_parents: int = None) -> np.ndarray:
         """Performs roulette selection on a population.
 
         This method implements roulette selection, where individuals are selected
@@ -16,18 +17,21 @@ class RouletteSelection(AbstractSelection):
             fitness (np.ndarray): The fitness values of the individuals.
             otimizer (Callable[[np.ndarray], int]): The function to select the best individuals,
                 either np.argmin() or np.argmax().
+            n_parents (int, optional): The number of parents to select, even. Defaults to
+                the number of individuals.
 
         Returns:
             np.ndarray: The indices of the selected parent individuals.
 
         """
         n_individuals = fitness.shape[0]
-        parents = np.empty(n_individuals, dtype=int)
+        n_parents = n_individuals if n_parents is None else n_parents
+        parents = np.empty(n_parents, dtype=int)
         
         prob = 1/fitness if otimizer == np.argmin else fitness
         prob = fitness / np.sum(fitness)
         
-        for i in range(0, n_individuals, 2):
+        for i in range(0, n_parents, 2):
             candidates = np.random.choice(n_individuals, 2, replace=False, p=prob)
 
             parents[i] = candidates[0] if fitness[candidates[0]] > fitness[candidates[1]] else candidates[1]
@@ -4,7 +4,8 @@ from src.selection.abstract_selection import AbstractSelection
 
 class TournamentSelection(AbstractSelection):
 
-    def select(self, fitness: np.ndarray, otimizer: Callable[[np.ndarray], int]) -> np.ndarray:
+    def select(self, fitness: np.ndarray, otimizer: Callable[[np.ndarray], int],
+               n_parents: int = None) -> np.ndarray:
         """Performs tournament selection on a population.
 
         This method implements tournament selection, where a random subset of
@@ -15,15 +16,18 @@ class TournamentSelection(AbstractSelection):
             fitness (np.ndarray): The fitness values of the individuals.
             otimize (Callable[[np.ndarray], int]) : The function to select best individuals
                                                     np.argmin() or np.argmax.
+            n_parents (int, optional): The number of parents to select, even. Defaults to
+                                       the number of individuals.
 
         Returns:
             np.ndarray: The indices of the selected parent individuals.
 
         """
         n_individuals = fitness.shape[0]
-        parents = np.empty(n_individuals, dtype=int)
+        n_parents = n_individuals if n_parents is None else n_parents
+        parents = np.empty(n_parents, dtype=int)
 
-        for i in range(0, n_individuals, 2):
+        for i in range(0, n_parents, 2):
             candidates = np.random.choice(n_individuals, (2,2), replace=False)
 
             best_index1 = otimizer(fitness[candidates[0]])
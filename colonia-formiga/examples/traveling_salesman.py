@@ -1,5 +1,10 @@
 import numpy as np
+from typing import Callable
 from src.ACO_base import ACOBase
+from src.ACS_base import ACSBase
+from src.distance.abstract_distance import AbstractDistance
+from src.distance.matrix_distance import as_distance
+from src.backend import Kernel
 
 class TravelingSalesmanACO(ACOBase):
     """
@@ -13,15 +18,41 @@ class TravelingSalesmanACO(ACOBase):
     def __init__(self, n_ants: int, n_paths: int, 
                 n_generations: int = 500, 
                 alpha: float = 1.0, beta: float = 1.0,
-                distance_matrix: np.ndarray = None):
+                distance_matrix: np.ndarray | AbstractDistance = None, tau0: float = None):
+        """
+        Initializes the ant colony optimizer.
 
-        self.distance_matrix = distance_matrix
-        self.distance_matrix[self.distance_matrix == 0] = 1
+        Args:
+            alpha (float, optional): The weight of the pheronomes.
+            beta (float, optional): The weight of the visibility.
+            distance_matrix (np.ndarray | AbstractDistance): The distance matrix of all cities
+                                                             or a distance provider.
+            tau0 (float, optional): The initial pheronome level. If None, it is set
+                                    to n_ants / L, where L is the length of the
+                                    nearest neighbour tour.
+        """
+
+        self.distance_matrix = as_distance(distance_matrix)
 
         self.alpha = alpha
         self.beta = beta
+        self.tau0 = tau0
+        self.visibility_matrix = None
         super().__init__(n_ants, n_paths, n_generations)
 
+    def create_pheronomes(self) -> np.ndarray:
+        """
+        Creates the initial pheronome matrix filled with tau0.
+
+        Returns:
+            np.ndarray: The initial pheronome matrix.
+        """
+        if self.tau0 is None:
+            greedy = self.distance_matrix.nearest_neighbor_tours(np.array([0]))
+            self.tau0 = self.n_ants / self.fitness(greedy)[0]
+
+        return np.full((self.n_paths, self.n_paths), self.tau0, dtype=self.dtypes.real)
+
     def create_ants(self, pheronomes: np.ndarray) -> np.ndarray:
         """
         Creates the initial population of ants.
@@ -32,21 +63,47 @@ class TravelingSalesmanACO(ACOBase):
             np.ndarray: The initial population of ants.
         """
 
-        ants = np.zeros((self.n_ants, self.n_paths), dtype=int)
-        start = -1
+        starts = np.arange(self.n_ants) % self.n_paths
+        random = np.random.rand(self.n_ants, self.n_paths)
+        ants = np.empty((self.n_ants, self.n_paths), dtype=self.dtypes.index(self.n_paths))
 
-        for i in range(self.n_ants):
-            ant = ants[i]
-            ant[0] = (start:=(start+1)%self.n_paths)
-            neighbors = np.ones((self.n_paths), dtype=int)
-            neighbors[ant[0]] = 0
-            for j in range(1, self.n_paths):
-                weights = neighbors * pow(pheronomes[ant[j-1]],self.alpha) * pow(1/self.distance_matrix[ant[j-1]],self.beta) 
-                weights = weights/sum(weights)
-                ant[j] = np.random.choice(range(self.n_paths), p = weights)
-                neighbors[ant[j]] = 0
+        attraction = pow(pheronomes, self.alpha)
+        if construct_tours.active:
+            construct_tours(attraction, self.visibility(), starts, random, ants)
+        else:
+            construct_tours_numpy(attraction, self.visibility_rows, starts, random, ants)
 
         return ants
+
+    def visibility_rows(self, nodes: np.ndarray) -> np.ndarray:
+        """
+        Computes the weighted inverse of the distance from each given city to all the cities.
+
+        Args:
+            nodes (np.ndarray): The current city of each ant.
+
+        Returns:
+            np.ndarray: The (len(nodes), n_paths) visibility rows.
+        """
+
+        distances = self.distance_matrix.rows(nodes)
+        visibility = pow(1 / np.where(distances == 0, 1, distances), self.beta)
+        return visibility.astype(self.dtypes.real, copy=False)
+
+    def visibility(self) -> np.ndarray:
+        """
+        Computes, once, the visibility between every pair of cities.
+
+        Only the compiled kernel needs the dense matrix, which takes O(n_paths^2)
+        memory; the NumPy backend reads the rows of the current cities instead.
+
+        Returns:
+            np.ndarray: The (n_paths, n_paths) visibility matrix.
+        """
+
+        if self.visibility_matrix is None:
+            self.visibility_matrix = self.visibility_rows(np.arange(self.n_paths))
+        return self.visibility_matrix
     
     def fitness(self, ants: np.ndarray) -> np.ndarray:
         """
@@ -59,11 +116,126 @@ class TravelingSalesmanACO(ACOBase):
             np.ndarray: The fitness values for each ant.
         """
 
-        ants_fitness = np.empty(self.n_ants, dtype=float)
+        return self.distance_matrix.tour_length(np.asarray(ants)).astype(float)
+
+class TravelingSalesmanACS(ACSBase):
+    """
+    Solves the Traveling Salesman Problem (TSP) using the Ant Colony System.
+
+    This class extends ACSBase with the inverse of the distance as the
+    visibility of each city.
+    """
+
+    def __init__(self, n_ants: int, n_paths: int,
+                n_generations: int = 500, beta: float = 2.0,
+                q0: float = 0.9, xi: float = 0.1, evaporation_rate: float = 0.1,
+                distance_matrix: np.ndarray | AbstractDistance = None):
+
+        self.distance_matrix = as_distance(distance_matrix)
+        super().__init__(n_ants, n_paths, n_generations, beta, q0, xi, evaporation_rate)
+
+    def heuristic(self, nodes: np.ndarray) -> np.ndarray:
+        """
+        Computes the visibility from each given city to all the cities.
+
+        Args:
+            nodes (np.ndarray): The current city of each ant.
+
+        Returns:
+            np.ndarray: The inverse of the distances.
+        """
+
+        distances = self.distance_matrix.rows(nodes)
+        return 1 / np.where(distances == 0, 1, distances)
+
+    def fitness(self, ants: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the fitness of each ant in the colony.
+
+        Args:
+            ants (np.ndarray): The colony of ants to evaluate.
+
+        Returns:
+            np.ndarray: The fitness values for each ant.
+        """
+
+        return self.distance_matrix.tour_length(np.asarray(ants)).astype(float)
+
+
+def construct_tours_numpy(attraction: np.ndarray, visibility: Callable[[np.ndarray], np.ndarray],
+                          starts: np.ndarray, random: np.ndarray, out: np.ndarray) -> None:
+    """
+    Builds the tours of all the ants with the random proportional rule.
+
+    All the ants move together, one step at a time. The next city is sampled
+    with probability proportional to attraction * visibility among the cities
+    not visited yet, using the uniform draws in `random`, so both backends
+    build the same tours. The visibility is read only for the current city
+    of each ant, so no dense visibility matrix is needed.
+
+    Args:
+        attraction (np.ndarray): The pheronome matrix raised to alpha.
+        visibility (Callable[[np.ndarray], np.ndarray]): Returns the inverse distances, raised
+                                                        to beta, from the given cities.
+        starts (np.ndarray): The first city of each ant.
+        random (np.ndarray): An (n_ants, n_paths) array of uniform draws in [0, 1).
+        out (np.ndarray): The (n_ants, n_paths) tours, written in place.
+    """
+    n_ants, n_paths = out.shape
+    rows = np.arange(n_ants)
+    visited = np.zeros((n_ants, n_paths), dtype=bool)
+    out[:, 0] = starts
+    visited[rows, starts] = True
+
+    for j in range(1, n_paths):
+        current = out[:, j - 1]
+        weights = attraction[current] * visibility(current)
+        weights[visited] = 0
+
+        stuck = ~np.any(weights > 0, axis=1)
+        if np.any(stuck):
+            weights[stuck] = ~visited[stuck]
+
+        cumulative = np.cumsum(weights, axis=1)
+        threshold = random[:, j] * cumulative[:, -1]
+        out[:, j] = np.argmax(cumulative > threshold[:, None], axis=1)
+        visited[rows, out[:, j]] = True
+
+
+def construct_tours_loop(attraction, visibility, starts, random, out):
+    n_ants, n_paths = out.shape
+    cumulative = np.empty(n_paths)
+
+    for k in range(n_ants):
+        visited = np.zeros(n_paths, dtype=np.bool_)
+        out[k, 0] = starts[k]
+        visited[starts[k]] = True
+
+        for j in range(1, n_paths):
+            current = out[k, j - 1]
+            total = 0.0
+            for c in range(n_paths):
+                if not visited[c]:
+                    total += attraction[current, c] * visibility[current, c]
+                cumulative[c] = total
+
+            if not total > 0:
+                total = 0.0
+                for c in range(n_paths):
+                    if not visited[c]:
+                        total += 1.0
+                    cumulative[c] = total
+
+            threshold = random[k, j] * total
+            chosen = 0
+            while not cumulative[chosen] > threshold:
+                chosen += 1
+            out[k, j] = chosen
+            visited[chosen] = True
 
-        for i,ant in enumerate(ants):
-            path_distance = [self.distance_matrix[ant[j-1]][ant[j]]
-                             for j in range(self.n_paths)]
-            ants_fitness[i] = np.sum(path_distance)
 
-        return ants_fitness
\ No newline at end of file
+# The loop takes the dense visibility matrix; without Numba, `construct_tours_numpy`
+# is called directly with the visibility rows.
+construct_tours = Kernel(construct_tours_loop,
+                         example=lambda: (np.ones((4, 4)), np.ones((4, 4)), np.arange(4),
+                                          np.full((4, 4), 0.5), np.empty((4, 4), dtype=np.int_)))
@@ -1,8 +1,13 @@
+import time
 import itertools
 import numpy as np
 from tqdm import tqdm
 from typing import Callable
 from src.pheronomone_update.abstract_phero_update import AbstractPheroUpdate
+from src.local_search.abstract_local_search import AbstractLocalSearch
+from src.dtype_policy import DTypePolicy, LEGACY
+from src.checkpoint import Checkpointer, load_checkpoint, get_random_state, set_random_state
+from src.telemetry import TelemetrySink, generation_record
 
 class ACOBase:
     """
@@ -29,6 +34,12 @@ class ACOBase:
         self.n_ants = n_ants
         self.n_paths = n_paths
         self.n_generations = n_generations
+        self.local_search = None
+        self.checkpointer = None
+        self.dtypes = LEGACY
+        self.telemetry = None
+
+        self.reset()
 
     def simulate(self, verbose: bool = False) -> np.ndarray:
         """
@@ -40,33 +51,164 @@ class ACOBase:
         Returns:
             np.ndarray: The best path found after the simulation.
         """
-        self.history_ants = []
-        ants = None
-        best_result = float('inf')
-        best_ant = None
-        pheronomes = np.ones((self.n_paths, self.n_paths)) * 1e-6
+        self.reset()
+        return self.run_generations(verbose)
 
-        for i in range(self.n_generations):
+    def resume(self, path: str, verbose: bool = False) -> tuple[float, np.ndarray]:
+        """
+        Continues a simulation from a checkpoint until the last generation.
 
-            ants = self.create_ants(pheronomes)
+        Args:
+            path (str): The checkpoint written by the checkpointer.
+            verbose (bool): If True, prints progress information for each generation.
+
+        Returns:
+            tuple[float, np.ndarray]: The best fitness and the best path found.
+        """
+        self.reset()
+        self.set_state(load_checkpoint(path))
+        return self.run_generations(verbose)
+
+    def run_generations(self, verbose: bool = False) -> tuple[float, np.ndarray]:
+        """
+        Runs the remaining generations, writing checkpoints when they are due.
+
+        Args:
+            verbose (bool): If True, prints progress information for each generation.
 
-            self.history_ants.append(ants)  
+        Returns:
+            tuple[float, np.ndarray]: The best fitness and the best path found.
+        """
+        start = time.perf_counter()
+        for i in range(self.generation, self.n_generations):
 
-            fitness = self.fitness(ants)
+            ants = self.ask()
+            self.tell(self.fitness(ants))
 
-            pheronomes = self.phero_update.update(pheronomes.copy(), ants, fitness)
+            if self.telemetry is not None:
+                self.telemetry.emit(generation_record(i, ants, self.last_fitness, np.argmin,
+                                                      (i + 1) * self.n_ants,
+                                                      time.perf_counter() - start))
 
             if verbose:
-                print(f'Geracao {i}: {fitness[np.argmin(fitness)]}')
+                print(f'Geracao {i}: {self.last_fitness[np.argmin(self.last_fitness)]}')
+
+            if self.checkpointer is not None and \
+               (self.checkpointer.due(self.generation) or self.generation == self.n_generations):
+                self.checkpointer.save(self.get_state())
+
+        # print('Melhor resultado:', self.best_result)
+        # print('Melhor caminho:', self.best_ant)
+
+        return self.best_result, self.best_ant
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """
+        Returns the state of the run as arrays, to be written in a checkpoint.
+
+        Must be called between generations, when no colony is waiting for `tell`.
+
+        Returns:
+            dict[str, np.ndarray]: The pheronomes, the best path, the generation
+                                   and the random generator state.
+        """
+        if self.pheronomes is None:
+            self.pheronomes = self.create_pheronomes()
+
+        state = {'generation': np.array(self.generation),
+                 'pheronomes': self.pheronomes,
+                 'best_result': np.array(self.best_result),
+                 **get_random_state()}
+        if self.best_ant is not None:
+            state['best_ant'] = self.best_ant
+        if self.last_fitness is not None:
+            state['last_fitness'] = self.last_fitness
+        return state
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        """
+        Restores the state of the run returned by `get_state`.
+
+        Args:
+            state (dict[str, np.ndarray]): The arrays of the run state.
+        """
+        self.generation = int(state['generation'])
+        self.pheronomes = state['pheronomes']
+        self.best_result = float(state['best_result'])
+        self.best_ant = state.get('best_ant')
+        self.last_fitness = state.get('last_fitness')
+        self.ants = None
+        set_random_state(state)
+
+    def reset(self) -> None:
+        """
+        Discards the pheronomes and the best path, so the next `ask` starts a new run.
+        """
+        self.history_ants = []
+        self.pheronomes = None
+        self.ants = None
+        self.last_fitness = None
+        self.best_result = float('inf')
+        self.best_ant = None
+        self.generation = 0
+
+    def ask(self) -> np.ndarray:
+        """
+        Returns the colony of ants waiting for evaluation.
+
+        The first call creates the initial pheronomes. The ants are built once per
+        generation, so calling it again before `tell` returns the same colony.
+
+        Returns:
+            np.ndarray: The ants to evaluate.
+        """
+        if self.pheronomes is None:
+            self.pheronomes = self.create_pheronomes()
+        if self.ants is None:
+            self.ants = self.create_ants(self.pheronomes)
+            self.history_ants.append(self.ants)
+        return self.ants
+
+    def tell(self, fitness: np.ndarray) -> None:
+        """
+        Receives the fitness of the asked colony and updates the pheronomes.
+
+        Args:
+            fitness (np.ndarray): The fitness of each ant returned by `ask`.
+        """
+        if self.ants is None:
+            raise RuntimeError("tell() called before ask()")
+
+        ants = self.ants
+        fitness = np.asarray(fitness, dtype=float)
+        if fitness.shape != (len(ants),):
+            raise ValueError(f"Expected {len(ants)} fitness values, got shape {fitness.shape}")
 
-            if np.min(fitness) < best_result:
-                best_result = np.min(fitness)
-                best_ant = ants[np.argmin(fitness)]
+        if self.local_search is not None:
+            ants, fitness = self.local_search.improve(ants, fitness, np.argmin)
 
-        # print('Melhor resultado:', best_result)
-        # print('Melhor caminho:', best_ant)
+        if np.min(fitness) < self.best_result:
+            self.best_result = np.min(fitness)
+            self.best_ant = ants[np.argmin(fitness)].copy()
 
-        return best_result, best_ant
+        self.pheronomes = self.phero_update.update(self.pheronomes.copy(), ants, fitness,
+                                                   best_ant=self.best_ant,
+                                                   best_fitness=self.best_result)
+
+        self.ants = None
+        self.last_fitness = fitness
+        self.generation += 1
+
+    def create_pheronomes(self) -> np.ndarray:
+        """
+        Creates the initial pheronome matrix.
+
+        Subclasses can override it to define a problem-specific initial level.
+
+        Returns:
+            np.ndarray: The initial pheronome matrix.
+        """
+        return np.full((self.n_paths, self.n_paths), 1e-6, dtype=self.dtypes.real)
 
     def create_ants(self) -> np.ndarray:
         """
@@ -95,4 +237,16 @@ class ACOBase:
         raise NotImplementedError("Subclasses must implement fitness")
 
     def set_phero_update(self, phero_update: AbstractPheroUpdate) -> None:
-        self.phero_update = phero_update
\ No newline at end of file
+        self.phero_update = phero_update
+
+    def set_local_search(self, local_search: AbstractLocalSearch) -> None:
+        self.local_search = local_search
+
+    def set_checkpointer(self, checkpointer: Checkpointer) -> None:
+        self.checkpointer = checkpointer
+
+    def set_dtype_policy(self, dtypes: DTypePolicy) -> None:
+        self.dtypes = dtypes
+
+    def set_telemetry(self, telemetry: TelemetrySink) -> None:
+        self.telemetry = telemetry
@@ -0,0 +1,161 @@
+import numpy as np
+from src.ACO_base import ACOBase
+from src.pheronomone_update.acs_phero_update import ACSPheroUpdate
+
+class ACSBase(ACOBase):
+    """
+    Base class for Ant Colony System implementations.
+
+    The Ant Colony System differs from the basic Ant System in three points:
+    with probability q0 an ant moves to the best candidate (argmax) instead
+    of sampling it, each step decays the pheronome of the traversed edge
+    towards tau0 (local update), and the global update only reinforces the
+    best path found so far.
+
+    All the ants are built together, one step at a time, so each step is a
+    few array operations over the whole colony.
+
+    Concrete subclasses should implement the `heuristic` and `fitness`
+    methods to define problem-specific visibility and fitness evaluation.
+    """
+
+    def __init__(self, n_ants: int, n_paths: int,
+                 n_generations: int = 500, beta: float = 2.0,
+                 q0: float = 0.9, xi: float = 0.1,
+                 evaporation_rate: float = 0.1, tau0: float = None):
+        """
+        Initializes the ant colony system base class.
+
+        Args:
+            n_ants (int): The number of ants in the colony.
+            n_paths (int): The number of paths in the problem.
+            n_generations (int, optional): The number of generations to run.
+            beta (float, optional): The weight of the heuristic information.
+            q0 (float, optional): The probability of moving to the best candidate.
+            xi (float, optional): The local pheronome decay rate.
+            evaporation_rate (float, optional): The global pheronome evaporation rate.
+            tau0 (float, optional): The initial pheronome level. If None, it is set
+                                    to 1 / (n_paths * L), where L is the fitness
+                                    of a greedy path.
+        """
+        self.beta = beta
+        self.q0 = q0
+        self.xi = xi
+        self.tau0 = tau0
+        super().__init__(n_ants, n_paths, n_generations)
+        self.set_phero_update(ACSPheroUpdate(Q=1, evaporation_rate=evaporation_rate))
+
+    def create_pheronomes(self) -> np.ndarray:
+        """
+        Creates the initial pheronome matrix filled with tau0.
+
+        Returns:
+            np.ndarray: The initial pheronome matrix.
+        """
+        if self.tau0 is None:
+            greedy = self.construct(np.ones((self.n_paths, self.n_paths), dtype=self.dtypes.real), 1, q0=1.0,
+                                    local_update=False)
+            self.tau0 = 1 / (self.n_paths * self.fitness(greedy)[0])
+
+        return np.full((self.n_paths, self.n_paths), self.tau0, dtype=self.dtypes.real)
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """
+        Returns the state of the run, including tau0, as arrays.
+
+        Returns:
+            dict[str, np.ndarray]: The arrays of the run state.
+        """
+        state = super().get_state()
+        state['tau0'] = np.array(self.tau0)
+        return state
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        """
+        Restores the state of the run returned by `get_state`.
+
+        Args:
+            state (dict[str, np.ndarray]): The arrays of the run state.
+        """
+        super().set_state(state)
+        self.tau0 = float(state['tau0'])
+
+    def create_ants(self, pheronomes: np.ndarray) -> np.ndarray:
+        """
+        Creates the colony of ants applying the pseudo-random proportional rule.
+
+        The pheronome matrix receives the local update in place.
+
+        Args:
+            pheronomes (np.ndarray): The current pheronome matrix.
+
+        Returns:
+            np.ndarray: The colony of ants.
+        """
+        return self.construct(pheronomes, self.n_ants, self.q0, local_update=True)
+
+    def construct(self, pheronomes: np.ndarray, n_ants: int, q0: float,
+                  local_update: bool) -> np.ndarray:
+        """
+        Builds the paths of all the ants step by step.
+
+        Args:
+            pheronomes (np.ndarray): The pheronome matrix.
+            n_ants (int): The number of ants to build.
+            q0 (float): The probability of moving to the best candidate.
+            local_update (bool): If True, applies the local pheronome update.
+
+        Returns:
+            np.ndarray: The colony of ants.
+        """
+        rows = np.arange(n_ants)
+        ants = np.empty((n_ants, self.n_paths), dtype=self.dtypes.index(self.n_paths))
+        ants[:, 0] = rows % self.n_paths
+
+        visited = np.zeros((n_ants, self.n_paths), dtype=bool)
+        visited[rows, ants[:, 0]] = True
+
+        for j in range(1, self.n_paths):
+            current = ants[:, j - 1]
+            weights = pheronomes[current] * pow(self.heuristic(current), self.beta)
+            weights[visited] = 0
+
+            stuck = ~np.any(weights > 0, axis=1)
+            if np.any(stuck):
+                weights[stuck] = ~visited[stuck]
+
+            exploit = np.random.rand(n_ants) < q0
+            explore = ~exploit
+
+            ants[exploit, j] = np.argmax(weights[exploit], axis=1)
+
+            if np.any(explore):
+                cumulative = np.cumsum(weights[explore], axis=1)
+                threshold = np.random.rand(cumulative.shape[0]) * cumulative[:, -1]
+                ants[explore, j] = np.argmax(cumulative > threshold[:, None], axis=1)
+
+            visited[rows, ants[:, j]] = True
+
+            if local_update:
+                edge = (current, ants[:, j])
+                pheronomes[edge] = (1 - self.xi) * pheronomes[edge] + self.xi * self.tau0
+
+        if local_update:
+            edge = (ants[:, -1], ants[:, 0])
+            pheronomes[edge] = (1 - self.xi) * pheronomes[edge] + self.xi * self.tau0
+
+        return ants
+
+    def heuristic(self, nodes: np.ndarray) -> np.ndarray:
+        """
+        Returns the heuristic desirability of moving from each node to every node.
+
+        Should be implemented by subclasses to define problem-specific visibility.
+
+        Args:
+            nodes (np.ndarray): The current node of each ant.
+
+        Returns:
+            np.ndarray: A (len(nodes), n_paths) array of visibilities.
+        """
+        raise NotImplementedError("Subclasses must implement heuristic")
@@ -0,0 +1,91 @@
+from typing import Callable
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+_backend = 'numpy'
+_kernels = []
+
+
+class Kernel:
+    """
+    A loop-heavy operation with a NumPy implementation and a compiled one.
+
+    The loop implementation is written in plain Python over arrays, so Numba
+    can compile it. It is compiled the first time it is needed, with
+    `cache=True`, so the compiled code is stored next to the module and reused
+    by the next processes instead of being compiled on every run.
+
+    Parameters:
+        loop_function (Callable): The implementation compiled by Numba.
+        numpy_function (Callable, optional): The implementation used by the NumPy
+                                             backend. If None, the caller provides
+                                             its own fallback and checks `active`.
+        example (Callable, optional): Returns small arguments used by `warmup`.
+    """
+
+    def __init__(self, loop_function: Callable, numpy_function: Callable = None,
+                 example: Callable = None) -> None:
+        self.loop_function = loop_function
+        self.numpy_function = numpy_function
+        self.example = example
+        self.compiled = None
+        _kernels.append(self)
+
+    @property
+    def active(self) -> bool:
+        """Returns True if the compiled implementation is selected."""
+        return _backend == 'numba'
+
+    def __call__(self, *args):
+        if self.active:
+            if self.compiled is None:
+                self.compiled = numba.njit(cache=True)(self.loop_function)
+            return self.compiled(*args)
+        return self.numpy_function(*args)
+
+
+def available_backends() -> list[str]:
+    """Returns the backends that can be selected in this environment."""
+    return ['numpy'] if numba is None else ['numpy', 'numba']
+
+
+def get_backend() -> str:
+    """Returns the selected backend."""
+    return _backend
+
+
+def set_backend(name: str, warmup: bool = False) -> None:
+    """
+    Selects the implementation of the loop-heavy operators.
+
+    Args:
+        name (str): 'numpy' for the NumPy implementations or 'numba' for the compiled ones.
+        warmup (bool, optional): If True, compiles the kernels imported so far right away.
+    """
+    global _backend
+
+    if name not in ('numpy', 'numba'):
+        raise ValueError(f"Unknown backend '{name}', expected 'numpy' or 'numba'")
+    if name == 'numba' and numba is None:
+        raise ImportError("The numba backend requires the numba package")
+
+    _backend = name
+    if warmup:
+        warmup_kernels()
+
+
+def warmup_kernels() -> None:
+    """
+    Compiles the kernels imported so far by calling them on small examples.
+
+    With the on-disk cache this is only slow the first time on a machine, so
+    it can be done once when deploying instead of inside a timed run.
+    """
+    if _backend != 'numba':
+        return
+    for kernel in _kernels:
+        if kernel.example is not None:
+            kernel(*kernel.example())
@@ -0,0 +1,103 @@
+import os
+import time
+import tempfile
+import numpy as np
+
+
+def get_random_state() -> dict[str, np.ndarray]:
+    """
+    Returns the state of the global NumPy random generator as arrays.
+
+    Returns:
+        dict[str, np.ndarray]: The arrays describing the generator state.
+    """
+    _, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+    return {
+        'random_keys': keys,
+        'random_pos': np.array(pos),
+        'random_has_gauss': np.array(has_gauss),
+        'random_cached_gaussian': np.array(cached_gaussian),
+    }
+
+
+def set_random_state(state: dict[str, np.ndarray]) -> None:
+    """
+    Restores the global NumPy random generator from `get_random_state` arrays.
+
+    Args:
+        state (dict[str, np.ndarray]): The arrays describing the generator state.
+    """
+    np.random.set_state(('MT19937', state['random_keys'], int(state['random_pos']),
+                         int(state['random_has_gauss']), float(state['random_cached_gaussian'])))
+
+
+def save_checkpoint(path: str, state: dict[str, np.ndarray]) -> None:
+    """
+    Writes an engine state to an .npz file atomically.
+
+    The arrays are written to a temporary file in the same directory, flushed
+    to disk and then renamed over `path`, so a crash mid-write leaves the
+    previous checkpoint intact.
+
+    Args:
+        path (str): The path of the checkpoint file.
+        state (dict[str, np.ndarray]): The arrays of the engine state.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            np.savez(file, **state)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def load_checkpoint(path: str) -> dict[str, np.ndarray]:
+    """
+    Reads an engine state written by `save_checkpoint`.
+
+    Args:
+        path (str): The path of the checkpoint file.
+
+    Returns:
+        dict[str, np.ndarray]: The arrays of the engine state.
+    """
+    with np.load(path) as file:
+        return {key: file[key] for key in file.files}
+
+
+class Checkpointer:
+    """
+    Decides when an engine writes its checkpoint.
+
+    A checkpoint is written every `every` generations, every `seconds` seconds
+    of wall time, or whichever comes first when both are given.
+
+    Parameters:
+        path (str): The path of the checkpoint file.
+        every (int, optional): The number of generations between checkpoints.
+        seconds (float, optional): The number of seconds between checkpoints.
+    """
+
+    def __init__(self, path: str, every: int = None, seconds: float = None) -> None:
+        self.path = path
+        self.every = every
+        self.seconds = seconds
+        self.last_time = time.monotonic()
+
+    def due(self, generation: int) -> bool:
+        """Returns True if a checkpoint should be written after this generation."""
+        if self.every is not None and generation % self.every == 0:
+            return True
+        return self.seconds is not None and time.monotonic() - self.last_time >= self.seconds
+
+    def save(self, state: dict[str, np.ndarray]) -> None:
+        """Writes the checkpoint and restarts the timer."""
+        save_checkpoint(self.path, state)
+        self.last_time = time.monotonic()
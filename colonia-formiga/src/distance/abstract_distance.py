@@ -0,0 +1,142 @@
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class AbstractDistance(ABC):
+    """Abstract class representing a distance provider between cities.
+
+    This class defines the interface used by the permutation problems to read
+    distances without requiring a dense matrix in memory. Specific providers
+    (e.g., dense matrix, memory-mapped matrix, coordinates) should inherit from
+    this class and implement the `rows` and `edges` methods.
+
+    Providers can be indexed like a matrix: `distance[i]` returns a row and
+    `distance[i, j]` returns the distances between the paired cities.
+    """
+
+    @property
+    @abstractmethod
+    def n_cities(self) -> int:
+        """The number of cities of the problem."""
+        pass
+
+    @abstractmethod
+    def rows(self, indices: np.ndarray) -> np.ndarray:
+        """Returns the distances from the given cities to all cities.
+
+        Args:
+            indices (np.ndarray): The indices of the origin cities.
+
+        Returns:
+            np.ndarray: A (len(indices), n_cities) array of distances.
+        """
+        pass
+
+    @abstractmethod
+    def edges(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Returns the distances of the edges (i, j), broadcasting i against j.
+
+        Args:
+            i (np.ndarray): The indices of the origin cities.
+            j (np.ndarray): The indices of the destination cities.
+
+        Returns:
+            np.ndarray: The distance of each edge.
+        """
+        pass
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.n_cities, self.n_cities)
+
+    def row(self, i: int) -> np.ndarray:
+        """Returns the distances from a city to all cities."""
+        return self.rows(np.array([i]))[0]
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            i, j = key
+            return self.edges(np.asarray(i), np.asarray(j))
+        if np.ndim(key) == 0:
+            return self.row(key)
+        return self.rows(np.asarray(key))
+
+    def __len__(self) -> int:
+        return self.n_cities
+
+    def tour_length(self, tours: np.ndarray) -> np.ndarray:
+        """Computes the length of closed tours.
+
+        Args:
+            tours (np.ndarray): A tour or a (n_tours, n_cities) array of tours.
+
+        Returns:
+            np.ndarray: The length of each tour.
+        """
+        tours = np.asarray(tours)
+        return self.edges(tours, np.roll(tours, -1, axis=-1)).sum(axis=-1)
+
+    def neighbors(self, n_neighbors: int, block_size: int = 256) -> np.ndarray:
+        """Computes the nearest neighbours of each city, sorted by distance.
+
+        The rows are read in blocks, so only `block_size` rows are held in memory
+        at a time.
+
+        Args:
+            n_neighbors (int): The number of neighbours kept for each city.
+            block_size (int): The number of rows read at a time.
+
+        Returns:
+            np.ndarray: A (n_cities, n_neighbors) array of city indices.
+        """
+        n_cities = self.n_cities
+        n_neighbors = min(n_neighbors, n_cities - 1)
+        nearest = np.empty((n_cities, n_neighbors), dtype=int)
+
+        for start in range(0, n_cities, block_size):
+            indices = np.arange(start, min(start + block_size, n_cities))
+            distances = np.array(self.rows(indices), dtype=float)
+            distances[np.arange(indices.shape[0]), indices] = np.inf
+
+            block = np.argpartition(distances, n_neighbors - 1, axis=1)[:, :n_neighbors]
+            order = np.argsort(np.take_along_axis(distances, block, axis=1), axis=1)
+            nearest[indices] = np.take_along_axis(block, order, axis=1)
+
+        return nearest
+
+    def nearest_neighbor_tours(self, starts: np.ndarray, n_candidates: int = 1) -> np.ndarray:
+        """Builds tours with the nearest neighbour heuristic, one per start city.
+
+        All the tours are built together, one step at a time, reading one row
+        per tour at each step. With more than one candidate, each step moves to
+        one of the `n_candidates` nearest unvisited cities at random, so tours
+        from the same start differ.
+
+        Args:
+            starts (np.ndarray): The first city of each tour.
+            n_candidates (int): The number of nearest unvisited cities to choose from.
+
+        Returns:
+            np.ndarray: A (len(starts), n_cities) array of tours.
+        """
+        starts = np.asarray(starts, dtype=int)
+        n_tours, n_cities = starts.shape[0], self.n_cities
+        rows = np.arange(n_tours)
+        tours = np.empty((n_tours, n_cities), dtype=int)
+        visited = np.zeros((n_tours, n_cities), dtype=bool)
+        tours[:, 0] = starts
+        visited[rows, starts] = True
+
+        for j in range(1, n_cities):
+            distances = np.array(self.rows(tours[:, j - 1]), dtype=float)
+            distances[visited] = np.inf
+
+            k = min(n_candidates, n_cities - j)
+            if k == 1:
+                tours[:, j] = np.argmin(distances, axis=1)
+            else:
+                nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+                tours[:, j] = nearest[rows, np.random.randint(0, k, n_tours)]
+            visited[rows, tours[:, j]] = True
+
+        return tours
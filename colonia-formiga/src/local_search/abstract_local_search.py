@@ -0,0 +1,118 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable
+import numpy as np
+from src.distance.abstract_distance import AbstractDistance
+from src.distance.matrix_distance import as_distance
+
+
+class AbstractLocalSearch(ABC):
+    """Abstract class representing a local search stage for permutation problems.
+
+    This class defines the interface for tour improvement heuristics (e.g., 2-opt,
+    Or-opt). It keeps the neighbour lists and the don't-look bits loop, and
+    decides which individuals are improved each generation. Specific local
+    search implementations should inherit from this class and implement the
+    `improve_city` method.
+
+    Args:
+        distance_matrix (np.ndarray | AbstractDistance): The distances between cities.
+        n_neighbors (int): The number of nearest cities considered for each move.
+        apply_to (str): Which solutions are improved: 'all', 'top_k' or 'best'.
+        top_k (int): The number of solutions improved when apply_to is 'top_k'.
+    """
+
+    def __init__(self, distance_matrix: np.ndarray | AbstractDistance, n_neighbors: int = 10,
+                 apply_to: str = 'best', top_k: int = 5) -> None:
+        if apply_to not in ('all', 'top_k', 'best'):
+            raise ValueError("apply_to must be 'all', 'top_k' or 'best'")
+
+        self.distance_matrix = as_distance(distance_matrix)
+        self.n_neighbors = n_neighbors
+        self.apply_to = apply_to
+        self.top_k = top_k
+        self.neighbors = self.distance_matrix.neighbors(n_neighbors)
+
+    def improve(self, individuals: np.ndarray, fitness: np.ndarray,
+                otimizer: Callable[[np.ndarray], int]) -> tuple[np.ndarray, np.ndarray]:
+        """Improves the selected individuals of a population in place.
+
+        The fitness of the improved individuals is updated with the sum of the
+        applied move deltas, so no extra fitness evaluation is needed.
+
+        Args:
+            individuals (np.ndarray): The population of tours.
+            fitness (np.ndarray): The tour lengths of the population.
+            otimizer (Callable[[np.ndarray], int]): The function to select best individuals
+                                                    np.argmin() or np.argmax.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The improved population and its fitness.
+        """
+        order = np.argsort(fitness)
+        if otimizer == np.argmax:
+            order = order[::-1]
+
+        if self.apply_to == 'best':
+            order = order[:1]
+        elif self.apply_to == 'top_k':
+            order = order[:self.top_k]
+
+        for k in order:
+            tour, delta = self.improve_tour(individuals[k])
+            individuals[k] = tour
+            fitness[k] += delta
+
+        return individuals, fitness
+
+    def improve_tour(self, tour: np.ndarray) -> tuple[np.ndarray, float]:
+        """Applies improving moves to a single tour until a local optimum is reached.
+
+        Uses don't-look bits: a city is only processed again after one of its
+        tour edges has been changed by an applied move.
+
+        Args:
+            tour (np.ndarray): The tour to improve.
+
+        Returns:
+            tuple[np.ndarray, float]: The improved tour and its length variation.
+        """
+        tour = np.array(tour)
+        n_cities = tour.shape[0]
+        position = np.empty(n_cities, dtype=int)
+        position[tour] = np.arange(n_cities)
+
+        active = np.ones(n_cities, dtype=bool)
+        queue = deque(tour.tolist())
+        total_delta = 0.0
+
+        while queue:
+            city = queue.popleft()
+            active[city] = False
+
+            delta, touched = self.improve_city(tour, position, city)
+            if delta < 0:
+                total_delta += delta
+                for c in touched:
+                    if not active[c]:
+                        active[c] = True
+                        queue.append(c)
+
+        return tour, total_delta
+
+    @abstractmethod
+    def improve_city(self, tour: np.ndarray, position: np.ndarray,
+                     city: int) -> tuple[float, list[int]]:
+        """Searches and applies the best improving move starting at a city.
+
+        Args:
+            tour (np.ndarray): The current tour, modified in place.
+            position (np.ndarray): The position of each city in the tour, kept in sync.
+            city (int): The city where the move starts.
+
+        Returns:
+            tuple[float, list[int]]: The length variation of the applied move (0 if
+                                     no improving move was found) and the cities
+                                     whose tour edges were changed.
+        """
+        pass
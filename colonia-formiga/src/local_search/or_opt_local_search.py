@@ -0,0 +1,66 @@
+from src.local_search.abstract_local_search import AbstractLocalSearch
+from src.distance.abstract_distance import AbstractDistance
+import numpy as np
+
+
+class OrOptLocalSearch(AbstractLocalSearch):
+    """
+    Implements the Or-opt local search for permutation individuals.
+
+    An Or-opt move takes a segment of up to `max_segment` consecutive cities
+    and reinserts it, possibly reversed, between two other adjacent cities.
+    The insertion points are the tour edges around the neighbours of the
+    segment endpoints, and all of them are evaluated at once.
+
+    Parameters:
+        distance_matrix (np.ndarray | AbstractDistance): The distances between cities.
+        n_neighbors (int): The number of nearest cities considered for each move.
+        apply_to (str): Which solutions are improved: 'all', 'top_k' or 'best'.
+        top_k (int): The number of solutions improved when apply_to is 'top_k'.
+        max_segment (int): The maximum length of the moved segment.
+    """
+
+    def __init__(self, distance_matrix: np.ndarray | AbstractDistance, n_neighbors: int = 10,
+                 apply_to: str = 'best', top_k: int = 5, max_segment: int = 3) -> None:
+        self.max_segment = max_segment
+        super().__init__(distance_matrix, n_neighbors, apply_to, top_k)
+
+    def improve_city(self, tour: np.ndarray, position: np.ndarray,
+                     city: int) -> tuple[float, list[int]]:
+        d = self.distance_matrix
+        n_cities = tour.shape[0]
+        i = position[city]
+
+        for length in range(1, min(self.max_segment, n_cities - 3) + 1):
+            segment = tour[(i + np.arange(length)) % n_cities]
+            first, last = segment[0], segment[-1]
+            before = tour[(i - 1) % n_cities]
+            after = tour[(i + length) % n_cities]
+            removal_gain = d[before, first] + d[last, after] - d[before, after]
+
+            # Candidate insertion edges (u, v) around the endpoint neighbours
+            candidates = np.concatenate([self.neighbors[first], self.neighbors[last]])
+            j = position[candidates]
+            u = np.concatenate([candidates, tour[(j - 1) % n_cities]])
+            v = np.concatenate([tour[(j + 1) % n_cities], candidates])
+            valid = ~(np.isin(u, segment) | np.isin(v, segment))
+            if not np.any(valid):
+                continue
+            u, v = u[valid], v[valid]
+
+            forward = d[u, first] + d[last, v] - d[u, v]
+            backward = d[u, last] + d[first, v] - d[u, v]
+            reverse = backward < forward
+            delta = np.where(reverse, backward, forward) - removal_gain
+
+            best = np.argmin(delta)
+            if delta[best] < -1e-10:
+                rest = tour[(i + length + np.arange(n_cities - length)) % n_cities]
+                k = (position[u[best]] - i - length) % n_cities
+                moved = segment[::-1] if reverse[best] else segment
+                tour[:] = np.concatenate([rest[:k + 1], moved, rest[k + 1:]])
+                position[tour] = np.arange(n_cities)
+
+                return float(delta[best]), [before, after, first, last, u[best], v[best]]
+
+        return 0.0, []
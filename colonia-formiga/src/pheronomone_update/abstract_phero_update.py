@@ -23,6 +23,8 @@ class AbstractPheroUpdate(ABC):
             pheromone_matrix (np.ndarray): The current pheromone matrix.
             ants (np.ndarray): The solutions found by the ants.
             fitness (np.ndarray): The fitness found by the ants.
+            **kwargs: The engine also passes `best_ant` and `best_fitness`, the
+                      best solution found so far.
 
         Returns:
             np.ndarray: The updated pheromone matrix.
@@ -0,0 +1,30 @@
+from src.pheronomone_update.abstract_phero_update import AbstractPheroUpdate
+import numpy as np
+
+class ACSPheroUpdate(AbstractPheroUpdate):
+    """Updates the pheromone matrix only on the path of the best ant, as in the Ant Colony System.
+
+    Evaporation and deposit are applied only to the edges of the best path found
+    so far (or of the generation, when the best so far is not given).
+
+    Args:
+        Q (int): The pheromone constant.
+        evaporation_rate (float): The rate at which the pheromone evaporates.
+
+    """
+    def __init__(self, Q: int = 1, evaporation_rate: float = 0.1) -> None:
+        super().__init__(Q, evaporation_rate)
+
+    def update(self, pheromones: np.ndarray, ants: np.ndarray, fitness: np.ndarray, **kwargs) -> np.ndarray:
+
+        best_ant = kwargs.get('best_ant')
+        best_fitness = kwargs.get('best_fitness')
+        if best_ant is None:
+            best_ant = ants[np.argmin(fitness)]
+            best_fitness = np.min(fitness)
+
+        i, j = np.roll(best_ant, 1), best_ant
+        pheromones[i, j] = (1 - self.evaporation_rate) * pheromones[i, j] \
+                           + self.evaporation_rate * self.Q / best_fitness
+
+        return pheromones
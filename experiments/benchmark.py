@@ -0,0 +1,399 @@
+"""
+Measures the anytime performance of the engines: how fast they reach a set of
+targets over fixed seeds, in evaluations and in wall time.
+
+Usage:
+    python -m experiments.benchmark suite.toml [--workers N] [--output-dir DIR]
+                                               [--compare REVISION] [--threshold 1.25] [--min-time 1.0]
+
+A suite lists cases, each one a spec of `experiments.runner` without a grid,
+with its known optimum and targets:
+
+    name = "anytime"
+    seeds = [0, 1, 2, 3, 4]
+    targets = [1e1, 1e0, 1e-1, 1e-2]     # the precisions to reach, default of every case
+    output_dir = "results/benchmarks"
+
+    [[case]]
+    name = "rastrigin_pso"
+    engine = "pso"
+    problem = "function"
+    max_evaluations = 20000              # optional, the evaluations of each run
+    [case.params]
+    ...
+    [case.problem_args]
+    function = { benchmark = "rastrigin" }
+
+`optimum` can be omitted for benchmark functions, which know theirs. A run
+reaches the target of precision d when its best fitness is within d of the
+optimum, or within d * |optimum| with `relative_targets = true`. Each run
+records its best-so-far after every generation, with the evaluations and the
+seconds spent, and stops once the last target is reached.
+
+For each case and target, the expected running time (ERT) is the total cost
+of all the runs, counting the failed ones in full, divided by the number of
+successes, both in evaluations and in seconds. The empirical cumulative
+distribution (ECDF) of the runtimes over all the (run, target) pairs is
+written for log-spaced budgets, for plotting.
+
+The results are saved as '<output_dir>/<revision>.json', the revision being
+the short git commit, with '-dirty' for uncommitted changes, so commits can
+be compared. With --compare, every ERT that grows by more than `threshold`
+times, and every target that is reached less often, than in the given
+revision (or JSON file) is reported as a regression, and the command exits
+with status 1. Wall times are only comparable on the same machine, and time
+ERTs under --min-time seconds are not compared; run with one worker for the
+least noisy timings.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from experiments.registry import ROOT, project_dir
+from experiments.runner import load_spec, make_job, init_worker, build_model, open_writer
+
+DEFAULT_TARGETS = [1e1, 1e0, 1e-1, 1e-2, 1e-4, 1e-6, 1e-8]
+
+MEASURES = ('evaluations', 'time')
+
+ECDF_FIELDS = ['case', 'measure', 'budget', 'proportion']
+
+
+def git_revision() -> str:
+    """Returns the short commit of the repository, with '-dirty' if it has uncommitted changes."""
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, check=True,
+                                  capture_output=True, text=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f'{revision}-dirty' if status else revision
+
+
+def expand_runs(suite: dict) -> list[dict]:
+    """
+    Creates the job of every case and seed of a suite.
+
+    Args:
+        suite (dict): The benchmark suite.
+
+    Returns:
+        list[dict]: The jobs, with the case name, optimum, targets and evaluation budget.
+    """
+    runs = []
+    for case_id, case in enumerate(suite['case']):
+        if case.get('grid'):
+            raise ValueError(f"Case '{case['name']}' has a grid, benchmark cases run a single configuration")
+
+        for seed in suite.get('seeds', [0]):
+            job = make_job({**case, 'seed': seed}, case_id, {}, 0)
+            job.update(case=case['name'], optimum=case.get('optimum'),
+                       targets=case.get('targets', suite.get('targets', DEFAULT_TARGETS)),
+                       relative_targets=case.get('relative_targets', False),
+                       max_evaluations=case.get('max_evaluations'))
+            runs.append(job)
+    return runs
+
+
+def known_optimum(model) -> float:
+    """Returns the optimum of a benchmark function optimized by the model, or None."""
+    function = getattr(model, 'function', None)
+    function = getattr(function, 'function', function)
+    return getattr(function, 'optimum_value', None)
+
+
+def run_case(job: dict) -> dict:
+    """
+    Runs one seed of a case, recording the best-so-far after every generation.
+
+    Args:
+        job (dict): The job created by `expand_runs`.
+
+    Returns:
+        dict: The run, with its trace of [evaluations, seconds, best fitness] rows.
+    """
+    run = {'case': job['case'], 'seed': job['seed'], 'status': 'ok', 'error': None,
+           'optimum': job['optimum'], 'trace': []}
+
+    try:
+        np.random.seed(job['seed'])
+        model = build_model(job)
+        evaluate = getattr(model, 'evaluate', model.fitness)
+        sign = -1.0 if getattr(model, 'otimizer', np.argmin) == np.argmax else 1.0
+
+        if run['optimum'] is None:
+            run['optimum'] = known_optimum(model)
+        if run['optimum'] is None:
+            raise ValueError(f"Case '{job['case']}' needs an optimum")
+        smallest = min(target_values(run['optimum'], job['targets'], job['relative_targets']))
+
+        best, n_evaluations = np.inf, 0
+        start = time.perf_counter()
+        for _ in range(model.n_generations):
+            candidates = model.ask()
+            fitness = np.asarray(evaluate(candidates), dtype=float)
+            model.tell(fitness)
+
+            n_evaluations += len(candidates)
+            best = min(best, float(np.min(sign * fitness)))
+            run['trace'].append([n_evaluations, time.perf_counter() - start, sign * best])
+
+            if abs(sign * best - run['optimum']) <= smallest:
+                break
+            if job['max_evaluations'] is not None and n_evaluations >= job['max_evaluations']:
+                break
+    except Exception as error:
+        run['status'], run['error'] = 'error', f'{type(error).__name__}: {error}'
+
+    return run
+
+
+def target_values(optimum: float, targets: list[float], relative: bool) -> list[float]:
+    """Returns the allowed distance to the optimum of each target."""
+    return [target * abs(optimum) if relative else target for target in targets]
+
+
+def hitting_costs(run: dict, targets: list[float], relative: bool) -> dict[str, list[float]]:
+    """
+    Finds when a run first reached each target.
+
+    Args:
+        run (dict): The run returned by `run_case`.
+        targets (list[float]): The precisions of the targets.
+        relative (bool): If True, the precisions are relative to the optimum.
+
+    Returns:
+        dict[str, list[float]]: For 'evaluations' and 'time', the cost of reaching each
+                                target, or None if it was not reached.
+    """
+    trace = np.asarray(run['trace'], dtype=float).reshape(-1, 3)
+    costs = {measure: [] for measure in MEASURES}
+    if not len(trace):
+        return {measure: [None] * len(targets) for measure in MEASURES}
+
+    # The best-so-far only improves, so its distance to the optimum only decreases.
+    distance = np.abs(trace[:, 2] - run['optimum'])
+    for allowed in target_values(run['optimum'], targets, relative):
+        reached = np.flatnonzero(distance <= allowed)
+        for column, measure in enumerate(MEASURES):
+            costs[measure].append(float(trace[reached[0], column]) if reached.size else None)
+    return costs
+
+
+def expected_running_time(costs: list[float], totals: list[float]) -> float:
+    """
+    Computes the expected running time of a target over several runs.
+
+    Args:
+        costs (list[float]): The cost of reaching the target in each run, None if not reached.
+        totals (list[float]): The total cost of each run.
+
+    Returns:
+        float: The spent cost over the number of successes, inf if no run succeeded.
+    """
+    n_successes = sum(cost is not None for cost in costs)
+    if n_successes == 0:
+        return float('inf')
+    spent = sum(total if cost is None else cost for cost, total in zip(costs, totals))
+    return spent / n_successes
+
+
+def ecdf(costs: list[list[float]], budgets: np.ndarray) -> np.ndarray:
+    """
+    Computes the proportion of (run, target) pairs reached within each budget.
+
+    Args:
+        costs (list[list[float]]): The cost of reaching each target, per run.
+        budgets (np.ndarray): The budgets.
+
+    Returns:
+        np.ndarray: The proportion reached for each budget.
+    """
+    values = np.array([np.inf if cost is None else cost for run in costs for cost in run])
+    if not values.size:
+        return np.zeros(len(budgets))
+    return (values[None, :] <= budgets[:, None]).mean(axis=1)
+
+
+def summarize(runs: list[dict], case: dict) -> dict:
+    """
+    Computes the success rates, ERTs and ECDFs of the runs of a case.
+
+    Args:
+        runs (list[dict]): The runs of the case.
+        case (dict): The case options: its targets and whether they are relative.
+
+    Returns:
+        dict: The summary of the case, with its runs.
+    """
+    targets, relative = case['targets'], case['relative_targets']
+    finished = [run for run in runs if run['status'] == 'ok' and run['trace']]
+    costs = [hitting_costs(run, targets, relative) for run in finished]
+
+    summary = {'optimum': finished[0]['optimum'] if finished else case['optimum'],
+               'targets': targets, 'relative_targets': relative,
+               'n_runs': len(runs), 'n_errors': len(runs) - len(finished),
+               'success_rate': [float(np.mean([cost['evaluations'][k] is not None for cost in costs]))
+                                if costs else 0.0 for k in range(len(targets))],
+               'ert': {}, 'ecdf': {}, 'runs': runs}
+
+    for column, measure in enumerate(MEASURES):
+        totals = [run['trace'][-1][column] for run in finished]
+        summary['ert'][measure] = [expected_running_time([cost[measure][k] for cost in costs], totals)
+                                   for k in range(len(targets))]
+
+        largest = max(totals, default=1.0)
+        smallest = min((row[column] for run in finished for row in run['trace']), default=largest)
+        budgets = np.geomspace(max(smallest, 1e-9), max(largest, smallest, 1e-9), 50)
+        summary['ecdf'][measure] = {'budgets': budgets.tolist(),
+                                    'proportion': ecdf([cost[measure] for cost in costs], budgets).tolist()}
+    return summary
+
+
+def run_suite(suite: dict, workers: int = 1) -> dict:
+    """
+    Runs every case of a suite over its seeds.
+
+    The runs of each engine share a process pool, since the engines are
+    imported from different projects.
+
+    Args:
+        suite (dict): The benchmark suite.
+        workers (int): The number of worker processes.
+
+    Returns:
+        dict: The summary of each case, by name.
+    """
+    jobs = expand_runs(suite)
+    runs = {}
+    for engine in dict.fromkeys(job['engine'] for job in jobs):
+        engine_jobs = [job for job in jobs if job['engine'] == engine]
+        with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(project_dir(engine),)) as pool:
+            for job, run in zip(engine_jobs, pool.map(run_case, engine_jobs)):
+                runs.setdefault(job['case'], []).append(run)
+
+    cases = {}
+    for job in jobs:
+        if job['case'] not in cases:
+            cases[job['case']] = summarize(runs[job['case']], job)
+    return cases
+
+
+def compare(current: dict, baseline: dict, threshold: float = 1.25, min_time: float = 1.0) -> list[dict]:
+    """
+    Finds the targets a revision reaches slower, or less often, than a baseline.
+
+    Args:
+        current (dict): The saved results of the revision.
+        baseline (dict): The saved results of the baseline.
+        threshold (float): The largest accepted ratio between the ERTs.
+        min_time (float): The seconds under which time ERTs are too noisy to compare.
+
+    Returns:
+        list[dict]: One row per regression.
+    """
+    regressions = []
+    for name, case in current['cases'].items():
+        reference = baseline['cases'].get(name)
+        if reference is None or reference['targets'] != case['targets']:
+            continue
+
+        for k, target in enumerate(case['targets']):
+            if case['success_rate'][k] < reference['success_rate'][k]:
+                regressions.append({'case': name, 'target': target, 'measure': 'success_rate',
+                                    'baseline': reference['success_rate'][k],
+                                    'current': case['success_rate'][k]})
+                continue
+
+            for measure in MEASURES:
+                before, after = reference['ert'][measure][k], case['ert'][measure][k]
+                if measure == 'time' and max(before, after) < min_time:
+                    continue
+                if np.isfinite(before) and after > threshold * before:
+                    regressions.append({'case': name, 'target': target, 'measure': measure,
+                                        'baseline': before, 'current': after})
+    return regressions
+
+
+def load_results(reference: str, output_dir: str) -> dict:
+    """Reads saved results given as a JSON path or as a revision in the output directory."""
+    path = reference if reference.endswith('.json') else os.path.join(output_dir, f'{reference}.json')
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_results(results: dict, output_dir: str) -> str:
+    """
+    Writes the results of a revision and their ECDFs.
+
+    Args:
+        results (dict): The revision, its metadata and the summary of each case.
+        output_dir (str): The directory of the results.
+
+    Returns:
+        str: The path of the JSON results. The ECDFs go to '<revision>_ecdf.csv'.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{results['revision']}.json")
+    with open(path, 'w') as file:
+        json.dump(results, file)
+
+    writer = open_writer(os.path.join(output_dir, f"{results['revision']}_ecdf.csv"), ECDF_FIELDS)
+    try:
+        for name, case in results['cases'].items():
+            for measure in MEASURES:
+                curve = case['ecdf'][measure]
+                for budget, proportion in zip(curve['budgets'], curve['proportion']):
+                    writer.write({'case': name, 'measure': measure, 'budget': budget,
+                                  'proportion': proportion})
+    finally:
+        writer.close()
+    return path
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Measures the time-to-target of the engines over fixed seeds.')
+    parser.add_argument('suite', help='the benchmark suite (.json or .toml)')
+    parser.add_argument('--workers', type=int, default=1, help='the number of worker processes')
+    parser.add_argument('--output-dir', help='the directory of the saved results')
+    parser.add_argument('--revision', help='the name of the results, defaults to the git commit')
+    parser.add_argument('--compare', help='the revision, or JSON results, to compare with')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='the largest accepted ERT ratio against the compared revision')
+    parser.add_argument('--min-time', type=float, default=1.0,
+                        help='the seconds under which time ERTs are not compared')
+    args = parser.parse_args(argv)
+
+    suite = load_spec(args.suite)
+    output_dir = args.output_dir or suite.get('output_dir', 'results/benchmarks')
+
+    results = {'revision': args.revision or git_revision(),
+               'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+               'suite': suite.get('name', os.path.basename(args.suite)),
+               'seeds': suite.get('seeds', [0]),
+               'cases': run_suite(suite, args.workers)}
+    print(f'Results saved to {save_results(results, output_dir)}')
+
+    for name, case in results['cases'].items():
+        erts = ', '.join(f'{target:g}: {ert:.0f}' for target, ert in zip(case['targets'], case['ert']['evaluations']))
+        print(f"{name} ({case['n_errors']} errors) ERT in evaluations per target: {erts}")
+
+    if args.compare:
+        regressions = compare(results, load_results(args.compare, output_dir), args.threshold, args.min_time)
+        for row in regressions:
+            print(f"REGRESSION {row['case']} target {row['target']:g} {row['measure']}: "
+                  f"{row['baseline']:.4g} -> {row['current']:.4g}")
+        if regressions:
+            sys.exit(1)
+        print(f'No regression against {args.compare}')
+
+
+if __name__ == '__main__':
+    main()
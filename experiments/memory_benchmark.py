@@ -0,0 +1,91 @@
+"""
+Measures the memory the GA generational loop allocates per generation.
+
+Usage:
+    python -m experiments.memory_benchmark [--individuals 500] [--genes 100] [--generations 50]
+
+Runs the numeric function GA with tracemalloc around `tell` (selection,
+crossover, mutation and elitism; the objective is evaluated outside the
+measured window) with and without `keep_history`, and prints, per
+generation, the memory still held afterwards and the peak while breeding,
+next to the size of one population.
+"""
+import sys
+import argparse
+import tracemalloc
+import numpy as np
+
+from experiments.registry import project_dir
+
+
+def measure(keep_history: bool, n_individuals: int, n_genes: int, n_generations: int,
+            warmup: int = 5) -> dict:
+    """
+    Measures the allocations of `tell` over `n_generations` generations.
+
+    Args:
+        keep_history (bool): Whether the engine keeps every population.
+        n_individuals (int): The number of individuals.
+        n_genes (int): The number of genes.
+        n_generations (int): The number of measured generations.
+        warmup (int, optional): The generations run before measuring, so the
+                                buffers already exist.
+
+    Returns:
+        dict: The population size and the mean retained and peak bytes per generation.
+    """
+    from examples.numeric_function_otimizer import NumericFunctionOtimizer
+    from src.benchmark_functions import get_benchmark
+    from src.selection.tournament_selection import TournamentSelection
+    from src.crossover.blend_crossover import BlendCrossover
+    from src.mutation.interval_mutation import IntervalMutation
+
+    sphere = get_benchmark('sphere')
+    model = NumericFunctionOtimizer(n_individuals, n_genes, np.argmin, warmup + n_generations, 0.01,
+                                    sphere.lmin, sphere.lmax, sphere)
+    model.set_selection(TournamentSelection())
+    model.set_crossover(BlendCrossover())
+    model.set_mutation(IntervalMutation(sphere.lmin, sphere.lmax))
+    model.set_keep_history(keep_history)
+
+    np.random.seed(0)
+    model.reset()
+    for _ in range(warmup):
+        model.tell(model.fitness(model.ask()))
+
+    retained, peaks = [], []
+    tracemalloc.start()
+    for _ in range(n_generations):
+        fitness = model.fitness(model.ask())
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        model.tell(fitness)
+
+        current, peak = tracemalloc.get_traced_memory()
+        retained.append(current - before)
+        peaks.append(peak - before)
+    tracemalloc.stop()
+
+    return {'population_bytes': model.individuals.nbytes,
+            'retained_per_generation': float(np.mean(retained)),
+            'peak_per_generation': float(np.mean(peaks))}
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Measures the GA allocations per generation.')
+    parser.add_argument('--individuals', type=int, default=500, help='the number of individuals')
+    parser.add_argument('--genes', type=int, default=100, help='the number of genes')
+    parser.add_argument('--generations', type=int, default=50, help='the number of measured generations')
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, project_dir('ga'))
+    print(f"{'keep_history':>12} {'population':>12} {'retained/gen':>14} {'peak/gen':>12}")
+    for keep_history in (True, False):
+        result = measure(keep_history, args.individuals, args.genes, args.generations)
+        print(f"{str(keep_history):>12} {result['population_bytes']:>12} "
+              f"{result['retained_per_generation']:>14.0f} {result['peak_per_generation']:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each engine lives in its own project, with its own `src` package, so a
+# worker process only ever imports one of them.
+PROJECTS = {
+    'ga': os.path.join(ROOT, 'algoritmo-genetico'),
+    'aco': os.path.join(ROOT, 'colonia-formiga'),
+    'pso': os.path.join(ROOT, 'particle-swarm'),
+}
+
+PROBLEMS = {
+    'ga': {
+        'numeric_function': 'examples.numeric_function_otimizer:NumericFunctionOtimizer',
+        'binary_function': 'examples.binary_function_otimizer:BinaryFunctionOtimizer',
+        'binary_knapsack': 'examples.binary_knapsack:BinaryKnapSack',
+        'traveling_salesman': 'examples.traveling_salesman:TravelingSalesmanGA',
+    },
+    'aco': {
+        'traveling_salesman': 'examples.traveling_salesman:TravelingSalesmanACO',
+        'traveling_salesman_acs': 'examples.traveling_salesman:TravelingSalesmanACS',
+    },
+    'pso': {
+        'function': 'examples.function_otimizer:FunctionOtimizerPSO',
+    },
+}
+
+# The operators of each engine, by kind. Each kind is set on the model with
+# its `set_<kind>` method.
+OPERATORS = {
+    'ga': {
+        'selection': {
+            'tournament': 'src.selection.tournament_selection:TournamentSelection',
+            'roulette': 'src.selection.roulette_selection:RouletteSelection',
+            'crowded_tournament': 'src.selection.crowded_tournament_selection:CrowdedTournamentSelection',
+        },
+        'crossover': {
+            'one_point': 'src.crossover.one_point_crossover:OnePointCrossover',
+            'order': 'src.crossover.order_crossover:OrderCrossover',
+            'blend': 'src.crossover.blend_crossover:BlendCrossover',
+        },
+        'mutation': {
+            'binary': 'src.mutation.binary_mutation:BinaryMutation',
+            'interval': 'src.mutation.interval_mutation:IntervalMutation',
+            'amplification': 'src.mutation.amplification_mutation:AmplificationMutation',
+            'swap': 'src.mutation.swap_mutation:SwapMutation',
+            'position': 'src.mutation.position_mutation:PositionMutation',
+        },
+        'local_search': {
+            'two_opt': 'src.local_search.two_opt_local_search:TwoOptLocalSearch',
+            'or_opt': 'src.local_search.or_opt_local_search:OrOptLocalSearch',
+        },
+        'initialization': {
+            'uniform': 'src.initialization.uniform_initialization:UniformInitialization',
+            'latin_hypercube': 'src.initialization.latin_hypercube_initialization:LatinHypercubeInitialization',
+            'sobol': 'src.initialization.sobol_initialization:SobolInitialization',
+            'permutation': 'src.initialization.permutation_initialization:PermutationInitialization',
+            'nearest_neighbor': 'src.initialization.nearest_neighbor_initialization:NearestNeighborInitialization',
+        },
+    },
+    'aco': {
+        'phero_update': {
+            'standart': 'src.pheronomone_update.standart_phero_update:StandartPheroUpdate',
+            'elitism': 'src.pheronomone_update.elitism_phero_update:ElitismPheroUpdate',
+            'rank': 'src.pheronomone_update.rank_phero_update:RankPheroUpdate',
+            'acs': 'src.pheronomone_update.acs_phero_update:ACSPheroUpdate',
+        },
+        'local_search': {
+            'two_opt': 'src.local_search.two_opt_local_search:TwoOptLocalSearch',
+            'or_opt': 'src.local_search.or_opt_local_search:OrOptLocalSearch',
+        },
+    },
+    'pso': {
+        'topology': {
+            'global': 'src.topology.global_topology:GlobalTopology',
+            'ring': 'src.topology.ring_topology:RingTopology',
+            'von_neumann': 'src.topology.von_neumann_topology:VonNeumannTopology',
+            'random': 'src.topology.random_topology:RandomTopology',
+        },
+        'initialization': {
+            'uniform': 'src.initialization.uniform_initialization:UniformInitialization',
+            'latin_hypercube': 'src.initialization.latin_hypercube_initialization:LatinHypercubeInitialization',
+            'sobol': 'src.initialization.sobol_initialization:SobolInitialization',
+        },
+    },
+}
+
+# Loaders for problem arguments given as {"<loader>": value} in a spec.
+LOADERS = {
+    'tsplib': 'src.distance.tsplib_loader:load_tsplib',
+    'benchmark': 'src.benchmark_functions:get_benchmark',
+    'npy': 'numpy:load',
+}
+
+
+def project_dir(engine: str) -> str:
+    """
+    Returns the project directory of an engine.
+
+    Args:
+        engine (str): 'ga', 'aco' or 'pso'.
+
+    Returns:
+        str: The directory to add to sys.path before importing `src`.
+    """
+    if engine not in PROJECTS:
+        raise ValueError(f"Unknown engine '{engine}', expected one of {list(PROJECTS)}")
+    return PROJECTS[engine]
+
+
+def resolve(path: str):
+    """
+    Imports an object given as 'module:attribute'.
+
+    Args:
+        path (str): The module and the attribute, separated by a colon.
+
+    Returns:
+        The imported object.
+    """
+    import importlib
+
+    module, attribute = path.split(':')
+    return getattr(importlib.import_module(module), attribute)
+
+
+def problem_class(engine: str, problem: str) -> type:
+    """Returns the example class of a problem, e.g. ('ga', 'traveling_salesman')."""
+    if problem not in PROBLEMS[engine]:
+        raise ValueError(f"Unknown {engine} problem '{problem}', expected one of {list(PROBLEMS[engine])}")
+    return resolve(PROBLEMS[engine][problem])
+
+
+def operator_class(engine: str, kind: str, name: str) -> type:
+    """Returns the class of an operator, e.g. ('ga', 'crossover', 'order')."""
+    if kind not in OPERATORS[engine]:
+        raise ValueError(f"Unknown {engine} operator kind '{kind}', expected one of {list(OPERATORS[engine])}")
+    if name not in OPERATORS[engine][kind]:
+        raise ValueError(f"Unknown {kind} '{name}', expected one of {list(OPERATORS[engine][kind])}")
+    return resolve(OPERATORS[engine][kind][name])
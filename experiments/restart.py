@@ -0,0 +1,321 @@
+"""
+Restarts an engine when it stagnates, running several restarts in parallel under
+a global evaluation budget (IPOP-style multi-start).
+
+Usage:
+    python -m experiments.restart spec.toml [--workers N] [--max-evaluations E] [--output restarts.csv]
+
+The spec is the same as for `experiments.runner`, without a grid, with a
+[restart] table:
+
+    [restart]
+    max_evaluations = 200000  # the evaluations shared by all the restarts
+    increase = 2              # the population grows by this factor at every restart
+    patience = 20             # the generations without improvement before a restart
+    tolerance = 1e-8          # the smallest improvement, and population spread, that counts
+    max_restarts = 50         # optional, the maximum number of restarts
+    workers = 4               # the restarts running at the same time
+
+Restart k runs with seed `seed + k` and a population of `increase**k` times
+the population in [params] (n_individuals, n_ants or n_particles), up to
+`max_population` if given. With `increase = 1` every restart only changes
+the seed. A restart stops when its best fitness has not improved by more
+than `tolerance` for `patience` generations, when the fitness spread of its
+population falls below `tolerance`, when it reaches n_generations, or when
+the global budget is spent. Evaluations are reserved from a counter shared
+by the workers before each generation, so the budget is never exceeded.
+
+Each finished restart is appended to the output, and its convergence, the
+best fitness after each generation with the global evaluation count at that
+time, to '<output>_convergence.csv'. The best solution over all the restarts
+is kept and reported at the end.
+"""
+import os
+import json
+import time
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+
+from experiments.registry import project_dir
+from experiments.runner import load_spec, make_job, init_worker, build_model, open_writer
+
+RESTART_FIELDS = ['restart', 'seed', 'population', 'status', 'stop_reason', 'best_fitness',
+                  'generations', 'evaluations', 'wall_time', 'error', 'best_solution']
+
+CONVERGENCE_FIELDS = ['restart', 'generation', 'evaluations', 'global_evaluations', 'best_fitness']
+
+POPULATION_KEYS = {'ga': 'n_individuals', 'aco': 'n_ants', 'pso': 'n_particles'}
+
+# The evaluation counter shared by the workers, set by `init_restart_worker`.
+_counter = None
+
+
+def init_restart_worker(project: str, memory_limit_mb: int, counter) -> None:
+    """
+    Prepares a worker process and keeps the shared evaluation counter.
+
+    Args:
+        project (str): The project directory.
+        memory_limit_mb (int): The address-space limit of the worker.
+        counter (multiprocessing.Value): The evaluations spent by all the restarts.
+    """
+    global _counter
+    init_worker(project, memory_limit_mb)
+    _counter = counter
+
+
+def reserve(counter, n_evaluations: int, max_evaluations: int) -> int:
+    """
+    Reserves evaluations from the global budget.
+
+    Args:
+        counter (multiprocessing.Value): The evaluations spent by all the restarts.
+        n_evaluations (int): The evaluations to reserve.
+        max_evaluations (int): The global budget.
+
+    Returns:
+        int: The global count after the reservation, or -1 if the budget is too small.
+    """
+    with counter.get_lock():
+        if counter.value + n_evaluations > max_evaluations:
+            return -1
+        counter.value += n_evaluations
+        return counter.value
+
+
+def run_restart(job: dict, restart: dict) -> tuple[dict, list[dict]]:
+    """
+    Runs one restart with ask/tell until it stagnates or a budget is spent.
+
+    Args:
+        job (dict): The job created by `make_job`, with the restart's population and seed.
+        restart (dict): The restart index and the stopping options.
+
+    Returns:
+        tuple[dict, list[dict]]: The restart row and its convergence rows.
+    """
+    row = {'restart': restart['restart'], 'seed': job['seed'], 'population': restart['population'],
+           'status': 'ok', 'stop_reason': None, 'best_fitness': None, 'generations': 0,
+           'evaluations': 0, 'error': None, 'best_solution': None}
+    convergence = []
+    start = time.perf_counter()
+
+    try:
+        np.random.seed(job['seed'])
+        model = build_model(job)
+        evaluate = getattr(model, 'evaluate', model.fitness)
+        sign = -1.0 if getattr(model, 'otimizer', np.argmin) == np.argmax else 1.0
+
+        best_loss, best_solution, stalled = np.inf, None, 0
+        row['stop_reason'] = 'generations'
+
+        for generation in range(model.n_generations):
+            candidates = model.ask()
+            global_evaluations = reserve(_counter, len(candidates), restart['max_evaluations'])
+            if global_evaluations < 0:
+                row['stop_reason'] = 'budget'
+                break
+
+            fitness = np.asarray(evaluate(candidates), dtype=float)
+            if fitness.ndim != 1:
+                raise ValueError("Restarts require a single objective")
+
+            # The best candidate is copied before `tell`, which may update the candidates in place.
+            losses = sign * fitness
+            index = np.argmin(losses)
+            stalled = 0 if losses[index] < best_loss - restart['tolerance'] else stalled + 1
+            if losses[index] < best_loss:
+                best_loss, best_solution = losses[index], np.array(candidates[index])
+
+            model.tell(fitness)
+            row['evaluations'] += len(candidates)
+            row['generations'] = generation + 1
+
+            convergence.append({'restart': restart['restart'], 'generation': generation,
+                                'evaluations': row['evaluations'],
+                                'global_evaluations': global_evaluations,
+                                'best_fitness': float(sign * best_loss)})
+
+            if stalled >= restart['patience']:
+                row['stop_reason'] = 'stagnation'
+                break
+            if np.ptp(losses) <= restart['tolerance']:
+                row['stop_reason'] = 'converged'
+                break
+
+        if best_solution is not None:
+            row['best_fitness'] = float(sign * best_loss)
+            row['best_solution'] = json.dumps(best_solution.tolist())
+    except Exception as error:
+        row['status'], row['error'] = 'error', f'{type(error).__name__}: {error}'
+
+    row['wall_time'] = time.perf_counter() - start
+    return row, convergence
+
+
+class RestartManager:
+    """
+    Runs restarts of an engine concurrently until a global evaluation budget is spent.
+
+    Parameters:
+        spec (dict): The experiment spec.
+        max_evaluations (int): The evaluations shared by all the restarts.
+        increase (float): The population growth factor between restarts.
+        patience (int): The generations without improvement before a restart stops.
+        tolerance (float): The smallest improvement, and population spread, that counts.
+        max_restarts (int, optional): The maximum number of restarts.
+        max_population (int, optional): The largest population of a restart.
+        workers (int, optional): The restarts running at the same time. Defaults to
+                                 the number of CPUs.
+    """
+
+    def __init__(self, spec: dict, max_evaluations: int, increase: float = 2.0, patience: int = 20,
+                 tolerance: float = 1e-8, max_restarts: int = None, max_population: int = None,
+                 workers: int = None) -> None:
+        if spec.get('grid'):
+            raise ValueError("Restarts run a single configuration, remove the grid from the spec")
+
+        self.spec = spec
+        self.max_evaluations = max_evaluations
+        self.increase = increase
+        self.patience = patience
+        self.tolerance = tolerance
+        self.max_restarts = max_restarts
+        self.max_population = max_population
+        self.workers = workers or os.cpu_count()
+        self.population_key = POPULATION_KEYS[spec['engine']]
+
+        self.best_fitness = None
+        self.best_solution = None
+        self.rows = []
+        self.convergence = []
+
+    def make_restart(self, index: int) -> tuple[dict, dict]:
+        """
+        Creates the job of a restart, with its population and seed.
+
+        Args:
+            index (int): The index of the restart.
+
+        Returns:
+            tuple[dict, dict]: The job and the restart options.
+        """
+        job = make_job(self.spec, 0, {}, index)
+        population = int(round(job['params'][self.population_key] * self.increase ** index))
+        if self.max_population is not None:
+            population = min(population, self.max_population)
+        job['params'] = {**job['params'], self.population_key: population}
+
+        restart = {'restart': index, 'population': population, 'patience': self.patience,
+                   'tolerance': self.tolerance, 'max_evaluations': self.max_evaluations}
+        return job, restart
+
+    def is_better(self, fitness: float) -> bool:
+        if self.best_fitness is None:
+            return True
+        if self.spec.get('params', {}).get('otimizer') == 'max':
+            return fitness > self.best_fitness
+        return fitness < self.best_fitness
+
+    def record(self, row: dict, convergence: list[dict]) -> None:
+        self.rows.append(row)
+        self.convergence.extend(convergence)
+        if row['best_fitness'] is not None and self.is_better(row['best_fitness']):
+            self.best_fitness = row['best_fitness']
+            self.best_solution = np.asarray(json.loads(row['best_solution']))
+
+    def run(self, output: str = None, verbose: bool = False) -> tuple[float, np.ndarray]:
+        """
+        Runs the restarts until the budget, or the number of restarts, is spent.
+
+        Args:
+            output (str, optional): The restarts output. The convergence goes to
+                                    '<output>_convergence.csv'.
+            verbose (bool): If True, prints each finished restart.
+
+        Returns:
+            tuple[float, np.ndarray]: The best fitness and solution over all the restarts.
+        """
+        counter = mp.Value('q', 0)
+        pool = ProcessPoolExecutor(self.workers, initializer=init_restart_worker,
+                                   initargs=(project_dir(self.spec['engine']),
+                                             self.spec.get('memory_limit_mb'), counter))
+        writers = None
+        if output is not None:
+            stem = os.path.splitext(output)[0]
+            writers = (open_writer(output, RESTART_FIELDS),
+                       open_writer(f'{stem}_convergence.csv', CONVERGENCE_FIELDS))
+
+        running, n_launched = {}, 0
+        try:
+            while True:
+                while len(running) < self.workers and counter.value < self.max_evaluations and \
+                      (self.max_restarts is None or n_launched < self.max_restarts):
+                    job, restart = self.make_restart(n_launched)
+                    running[pool.submit(run_restart, job, restart)] = restart
+                    n_launched += 1
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    restart = running.pop(future)
+                    try:
+                        row, convergence = future.result()
+                    except BrokenProcessPool as error:
+                        row, convergence = {'restart': restart['restart'],
+                                            'population': restart['population'],
+                                            'status': 'error', 'error': f'worker died: {error}'}, []
+
+                    self.record(row, convergence)
+                    if writers is not None:
+                        writers[0].write(row)
+                        for point in convergence:
+                            writers[1].write(point)
+                    if verbose:
+                        print(f"Restart {row['restart']}: {row.get('best_fitness')} "
+                              f"({row.get('stop_reason')}, population {row['population']}, "
+                              f"{row.get('evaluations')} evaluations)")
+
+                    # A restart that failed, or could not run a single generation, would
+                    # fail again with a larger population, so no more restarts are launched.
+                    if row['status'] == 'error' or row.get('generations') == 0:
+                        self.max_restarts = n_launched
+        finally:
+            pool.shutdown(cancel_futures=True)
+            if writers is not None:
+                for writer in writers:
+                    writer.close()
+
+        return self.best_fitness, self.best_solution
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Runs parallel restarts of an engine under an evaluation budget.')
+    parser.add_argument('spec', help='the experiment spec (.json or .toml)')
+    parser.add_argument('--workers', type=int, help='the restarts running at the same time')
+    parser.add_argument('--max-evaluations', type=int, help='the evaluations shared by all the restarts')
+    parser.add_argument('--output', help='the restarts output (.csv or .parquet)')
+    args = parser.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    options = dict(spec.get('restart', {}))
+    if args.max_evaluations is not None:
+        options['max_evaluations'] = args.max_evaluations
+    if args.workers is not None:
+        options['workers'] = args.workers
+    if 'max_evaluations' not in options:
+        parser.error('the evaluation budget must be given in [restart] or with --max-evaluations')
+
+    output = args.output or f"{spec.get('name', 'experiment')}_restarts.csv"
+    best_fitness, best_solution = RestartManager(spec, **options).run(output, verbose=True)
+    print(f'Best fitness: {best_fitness}')
+    print(f'Best solution: {None if best_solution is None else best_solution.tolist()}')
+
+
+if __name__ == '__main__':
+    main()
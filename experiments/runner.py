@@ -0,0 +1,416 @@
+"""
+Runs a batch of experiments described by a JSON or TOML spec.
+
+Usage:
+    python -m experiments.runner spec.toml [--workers N] [--output results.csv] [--dry-run]
+
+A spec names the engine ('ga', 'aco' or 'pso'), the problem example, its
+constructor parameters and problem arguments, the operators, a parameter
+grid, the number of replicates and the base seed:
+
+    engine = "ga"
+    problem = "traveling_salesman"
+    replicates = 5
+    seed = 0
+    output = "results/tsp.csv"
+    time_limit_s = 600
+    memory_limit_mb = 2048
+
+    [params]
+    n_individuals = 100
+    n_genes = 52
+    otimizer = "min"
+
+    [problem_args]
+    distance_matrix = { tsplib = "berlin52.tsp" }
+
+    [operators]
+    selection = "tournament"
+    crossover = "order"
+    mutation = "swap"
+    local_search = { name = "two_opt", distance_matrix = "$distance_matrix" }
+
+    [grid]
+    n_generations = [100, 500]
+    mutation_rate = [0.05, 0.1]
+
+Grid keys that name an operator kind replace the operator, the others
+replace a parameter. Operator arguments starting with '$' are read from the
+model, e.g. the distance provider of the problem. Every combination of the
+grid runs `replicates` times with seeds seed, seed + 1, ..., so all the
+combinations see the same seeds.
+
+Runs are executed on a process pool, one run per task, and each result is
+appended to the CSV (or Parquet) output as soon as it finishes.
+"""
+import os
+import sys
+import csv
+import json
+import time
+import signal
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+from tqdm import tqdm
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from experiments.registry import LOADERS, project_dir, resolve, problem_class, operator_class, OPERATORS
+
+OTIMIZERS = {'min': np.argmin, 'max': np.argmax}
+
+RESULT_FIELDS = ['config_id', 'replicate', 'seed', 'status', 'best_fitness',
+                 'wall_time', 'cpu_time', 'error', 'best_solution']
+
+
+def load_spec(path: str) -> dict:
+    """
+    Reads an experiment spec from a .json or .toml file.
+
+    Args:
+        path (str): The path of the spec.
+
+    Returns:
+        dict: The spec.
+    """
+    if path.endswith('.toml'):
+        import tomllib
+        with open(path, 'rb') as file:
+            return tomllib.load(file)
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def expand_configs(spec: dict) -> list[dict]:
+    """
+    Expands the grid of a spec into its combinations.
+
+    Args:
+        spec (dict): The experiment spec.
+
+    Returns:
+        list[dict]: The value of each grid key, one dictionary per combination.
+    """
+    grid = spec.get('grid', {})
+    return [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+
+
+def make_job(spec: dict, config_id: int, combination: dict, replicate: int) -> dict:
+    """
+    Creates the job of one replicate of a grid combination.
+
+    Args:
+        spec (dict): The experiment spec.
+        config_id (int): The index of the combination.
+        combination (dict): The grid values of the combination.
+        replicate (int): The index of the replicate, added to the base seed.
+
+    Returns:
+        dict: The job, as a picklable dictionary.
+    """
+    kinds = OPERATORS[spec['engine']]
+    params = {**spec.get('params', {}),
+              **{key: value for key, value in combination.items() if key not in kinds}}
+    operators = {**spec.get('operators', {}),
+                 **{key: value for key, value in combination.items() if key in kinds}}
+
+    return {
+        'engine': spec['engine'],
+        'problem': spec['problem'],
+        'params': params,
+        'problem_args': spec.get('problem_args', {}),
+        'operators': operators,
+        'dtypes': spec.get('dtypes'),
+        'backend': spec.get('backend'),
+        'time_limit': spec.get('time_limit_s'),
+        'combination': combination,
+        'config_id': config_id,
+        'replicate': replicate,
+        'seed': spec.get('seed', 0) + replicate,
+    }
+
+
+def expand_jobs(spec: dict) -> list[dict]:
+    """
+    Expands a spec into one job per grid combination and replicate.
+
+    Args:
+        spec (dict): The experiment spec.
+
+    Returns:
+        list[dict]: The jobs, as picklable dictionaries.
+    """
+    return [make_job(spec, config_id, combination, replicate)
+            for config_id, combination in enumerate(expand_configs(spec))
+            for replicate in range(spec.get('replicates', 1))]
+
+
+def init_worker(project: str, memory_limit_mb: int = None) -> None:
+    """
+    Prepares a worker process to import the `src` package of a project.
+
+    Args:
+        project (str): The project directory.
+        memory_limit_mb (int, optional): The address-space limit of the worker.
+    """
+    sys.path.insert(0, project)
+    if memory_limit_mb is not None and resource is not None:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def load_argument(value):
+    """
+    Resolves a problem argument of a spec.
+
+    A dictionary with a single loader key, such as {"tsplib": "berlin52.tsp"},
+    {"benchmark": "rastrigin"} or {"npy": "weights.npy"}, is loaded, and a list
+    becomes an array. Other values are kept.
+    """
+    if isinstance(value, dict) and len(value) == 1 and next(iter(value)) in LOADERS:
+        loader, argument = next(iter(value.items()))
+        return resolve(LOADERS[loader])(argument)
+    if isinstance(value, list):
+        return np.asarray(value)
+    return value
+
+
+def build_model(job: dict):
+    """
+    Creates the model of a job with its operators.
+
+    Args:
+        job (dict): The job created by `expand_jobs`.
+
+    Returns:
+        The model, ready to simulate.
+    """
+    engine = job['engine']
+    params = dict(job['params'])
+    if 'otimizer' in params:
+        params['otimizer'] = OTIMIZERS[params['otimizer']]
+    problem_args = {key: load_argument(value) for key, value in job['problem_args'].items()}
+
+    if job['backend'] is not None:
+        resolve('src.backend:set_backend')(job['backend'])
+
+    model = problem_class(engine, job['problem'])(**params, **problem_args)
+
+    for kind, operator in job['operators'].items():
+        if isinstance(operator, str):
+            operator = {'name': operator}
+        arguments = {key: getattr(model, value[1:]) if isinstance(value, str) and value.startswith('$')
+                     else load_argument(value)
+                     for key, value in operator.items() if key != 'name'}
+        getattr(model, f'set_{kind}')(operator_class(engine, kind, operator['name'])(**arguments))
+
+    if job['dtypes'] is not None:
+        model.set_dtype_policy(resolve(f"src.dtype_policy:{job['dtypes'].upper()}"))
+
+    return model
+
+
+def best_of(model, result) -> tuple[float, np.ndarray]:
+    """
+    Normalizes the result of `simulate` into the best fitness and solution.
+
+    ACO and PSO return both, while GA returns only the best individual, which
+    is evaluated once more.
+    """
+    if isinstance(result, tuple):
+        return result
+    return model.fitness(np.asarray(result)[None])[0], result
+
+
+def raise_timeout(signum, frame):
+    raise TimeoutError('time limit exceeded')
+
+
+def run_job(job: dict) -> dict:
+    """
+    Runs a single job inside a worker process.
+
+    Errors, including the time limit and memory errors, are reported in the
+    returned row instead of being raised, so one bad run does not stop the batch.
+
+    Args:
+        job (dict): The job created by `expand_jobs`.
+
+    Returns:
+        dict: The result row.
+    """
+    row = {'config_id': job['config_id'], 'replicate': job['replicate'], 'seed': job['seed'],
+           'status': 'ok', 'best_fitness': None, 'error': None, 'best_solution': None}
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+    if job['time_limit'] is not None:
+        signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, job['time_limit'])
+
+    try:
+        np.random.seed(job['seed'])
+        model = build_model(job)
+        best_fitness, best = best_of(model, model.simulate())
+
+        row['best_fitness'] = float(best_fitness)
+        row['best_solution'] = json.dumps(np.asarray(best).tolist())
+    except TimeoutError as error:
+        row['status'], row['error'] = 'timeout', str(error)
+    except Exception as error:
+        row['status'], row['error'] = 'error', f'{type(error).__name__}: {error}'
+    finally:
+        if job['time_limit'] is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    row['wall_time'] = time.perf_counter() - wall_start
+    row['cpu_time'] = time.process_time() - cpu_start
+    return row
+
+
+class CSVWriter:
+    """
+    Appends result rows to a CSV file, flushing each row.
+
+    Parameters:
+        path (str): The path of the output file.
+        fields (list[str]): The columns.
+    """
+
+    def __init__(self, path: str, fields: list[str]) -> None:
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.DictWriter(self.file, fields)
+        self.writer.writeheader()
+
+    def write(self, row: dict) -> None:
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ParquetWriter:
+    """
+    Appends result rows to a Parquet file, in row groups of `flush_every` rows.
+
+    Requires pyarrow.
+
+    Parameters:
+        path (str): The path of the output file.
+        fields (list[str]): The columns.
+        flush_every (int): The number of rows per row group.
+    """
+
+    def __init__(self, path: str, fields: list[str], flush_every: int = 64) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output requires the pyarrow package")
+
+        numeric = {'config_id': pyarrow.int64(), 'replicate': pyarrow.int64(), 'seed': pyarrow.int64(),
+                   'best_fitness': pyarrow.float64(), 'wall_time': pyarrow.float64(),
+                   'cpu_time': pyarrow.float64()}
+        self.pyarrow = pyarrow
+        self.schema = pyarrow.schema([(field, numeric.get(field, pyarrow.string())) for field in fields])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        self.flush_every = flush_every
+        self.rows = []
+
+    def write(self, row: dict) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.rows:
+            self.writer.write_table(self.pyarrow.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self) -> None:
+        self.flush()
+        self.writer.close()
+
+
+def open_writer(path: str, fields: list[str]) -> CSVWriter | ParquetWriter:
+    """Opens a Parquet writer for .parquet paths and a CSV writer otherwise."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if path.endswith('.parquet'):
+        return ParquetWriter(path, fields)
+    return CSVWriter(path, fields)
+
+
+def run_experiment(spec: dict, workers: int = None, output: str = None) -> list[dict]:
+    """
+    Runs all the jobs of a spec on a process pool, streaming the results.
+
+    Args:
+        spec (dict): The experiment spec.
+        workers (int, optional): The number of worker processes. Defaults to the
+                                 spec `workers`, or the number of CPUs.
+        output (str, optional): The output path. Defaults to the spec `output`, or
+                                '<name>.csv'.
+
+    Returns:
+        list[dict]: The result rows, in completion order.
+    """
+    jobs = expand_jobs(spec)
+    grid_fields = list(spec.get('grid', {}))
+    workers = workers or spec.get('workers') or os.cpu_count()
+    output = output or spec.get('output') or f"{spec.get('name', 'experiment')}.csv"
+
+    writer = open_writer(output, RESULT_FIELDS[:3] + grid_fields + RESULT_FIELDS[3:])
+    pool = ProcessPoolExecutor(workers, initializer=init_worker,
+                               initargs=(project_dir(spec['engine']), spec.get('memory_limit_mb')))
+    rows = []
+
+    try:
+        futures = {pool.submit(run_job, job): job for job in jobs}
+        for future in tqdm(as_completed(futures), total=len(futures)):
+            job = futures[future]
+            try:
+                row = future.result()
+            except BrokenProcessPool as error:
+                row = {'config_id': job['config_id'], 'replicate': job['replicate'],
+                       'seed': job['seed'], 'status': 'error', 'error': f'worker died: {error}'}
+
+            for key, value in job['combination'].items():
+                row[key] = value if isinstance(value, str) else json.dumps(value)
+            writer.write(row)
+            rows.append(row)
+    finally:
+        pool.shutdown(cancel_futures=True)
+        writer.close()
+
+    return rows
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Runs a batch of experiments from a JSON or TOML spec.')
+    parser.add_argument('spec', help='the experiment spec (.json or .toml)')
+    parser.add_argument('--workers', type=int, help='the number of worker processes')
+    parser.add_argument('--output', help='the results file (.csv or .parquet)')
+    parser.add_argument('--dry-run', action='store_true', help='only prints the number of runs')
+    args = parser.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    if args.dry_run:
+        print(f"{len(expand_jobs(spec))} runs")
+        return
+
+    rows = run_experiment(spec, args.workers, args.output)
+    failed = sum(row['status'] != 'ok' for row in rows)
+    print(f"{len(rows)} runs, {failed} failed")
+
+
+if __name__ == '__main__':
+    main()
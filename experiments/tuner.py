@@ -0,0 +1,396 @@
+"""
+Tunes the parameters and operators of an engine with successive halving and racing.
+
+Usage:
+    python -m experiments.tuner spec.toml [--method hyperband] [--workers N] [--output trajectory.csv]
+
+The spec is the same as for `experiments.runner`, with a [tuner] table:
+
+    [tuner]
+    method = "halving"        # or "hyperband"
+    min_generations = 10      # the budget of the first rung
+    max_generations = 270     # the budget of the last rung
+    eta = 3                   # the budget grows, and the configurations shrink, by eta per rung
+    min_replicates = 3        # the replicates run before racing starts
+    max_replicates = 10       # the replicates run at most per rung
+    alpha = 0.05              # the significance level of the racing test
+
+The grid holds the candidate configurations and `n_generations` is the
+budget, so it is set by the tuner and must not be in the grid.
+
+Successive halving runs every configuration for `min_generations`, keeps the
+best 1/eta of them, runs those eta times longer, and so on up to
+`max_generations`. Hyperband runs several halving brackets, from many
+configurations with a small budget to few with the full budget, sampling the
+configurations of each bracket from the grid.
+
+Inside each rung the replicates are raced: after `min_replicates` seeds, a
+configuration that a paired t-test finds worse than the best one on the same
+seeds is dropped, and the others get one more seed, until `max_replicates` or
+until only the configurations to promote are left.
+
+A promoted run is not restarted: its state is checkpointed at the end of each
+rung and resumed in the next one, so it only pays for the extra generations.
+
+Every evaluation is appended to the trajectory output, and every decision
+(eliminated by racing, stopped by halving, promoted, best) to the rungs output,
+'<trajectory>_rungs.csv'.
+"""
+import os
+import json
+import math
+import time
+import shutil
+import argparse
+import tempfile
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+
+from experiments.registry import project_dir, resolve
+from experiments.runner import (load_spec, expand_configs, make_job, init_worker, build_model,
+                                best_of, open_writer)
+
+TRAJECTORY_FIELDS = ['bracket', 'rung', 'budget', 'config_id', 'replicate', 'seed',
+                     'status', 'fitness', 'generations', 'wall_time', 'error']
+
+RUNG_FIELDS = ['bracket', 'rung', 'budget', 'config_id', 'n_replicates', 'mean_fitness', 'decision']
+
+
+def run_trial(job: dict, budget: int, path: str) -> dict:
+    """
+    Runs one replicate of a configuration up to `budget` generations.
+
+    If a checkpoint of the replicate exists from an earlier rung, the run is
+    resumed from it, otherwise it starts from the seed. The final state is
+    checkpointed for the next rung.
+
+    Args:
+        job (dict): The job created by `make_job`.
+        budget (int): The number of generations to reach.
+        path (str): The checkpoint of the replicate.
+
+    Returns:
+        dict: The evaluation row.
+    """
+    Checkpointer = resolve('src.checkpoint:Checkpointer')
+    row = {'config_id': job['config_id'], 'replicate': job['replicate'], 'seed': job['seed'],
+           'status': 'ok', 'fitness': None, 'error': None}
+    start = time.perf_counter()
+
+    try:
+        np.random.seed(job['seed'])
+        model = build_model({**job, 'params': {**job['params'], 'n_generations': budget}})
+        model.set_checkpointer(Checkpointer(path))
+
+        result = model.resume(path) if os.path.exists(path) else model.simulate()
+        row['fitness'] = float(best_of(model, result)[0])
+    except Exception as error:
+        row['status'], row['error'] = 'error', f'{type(error).__name__}: {error}'
+
+    row['wall_time'] = time.perf_counter() - start
+    return row
+
+
+def t_critical(alpha: float, dof: int) -> float:
+    """
+    Returns the one-sided critical value of Student's t distribution.
+
+    Uses the Cornish-Fisher expansion around the normal quantile, which is
+    within 2% of the exact value from 2 degrees of freedom on.
+
+    Args:
+        alpha (float): The significance level.
+        dof (int): The degrees of freedom.
+
+    Returns:
+        float: The value t such that P(T > t) = alpha.
+    """
+    z = NormalDist().inv_cdf(1 - alpha)
+    g1 = (z**3 + z) / 4
+    g2 = (5 * z**5 + 16 * z**3 + 3 * z) / 96
+    g3 = (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384
+    return z + g1 / dof + g2 / dof**2 + g3 / dof**3
+
+
+def is_worse(scores: np.ndarray, best: np.ndarray, alpha: float) -> bool:
+    """
+    Tests if a configuration is worse than the best one on the same seeds.
+
+    Both arrays hold losses (lower is better), replicate by replicate, so the
+    paired differences remove the variance due to the seeds.
+
+    Args:
+        scores (np.ndarray): The losses of the configuration.
+        best (np.ndarray): The losses of the best configuration.
+        alpha (float): The significance level.
+
+    Returns:
+        bool: True if the configuration is significantly worse.
+    """
+    differences = scores - best
+    mean = differences.mean()
+    deviation = differences.std(ddof=1)
+
+    if deviation == 0:
+        return mean > 0
+    return mean / (deviation / np.sqrt(len(differences))) > t_critical(alpha, len(differences) - 1)
+
+
+class Tuner:
+    """
+    Budget-aware tuner of a spec grid, with successive halving and racing.
+
+    Parameters:
+        spec (dict): The experiment spec, as for `experiments.runner`.
+        min_generations (int): The budget of the first rung.
+        max_generations (int): The budget of the last rung.
+        eta (int): The factor between the budgets, and between the configurations,
+                   of two rungs.
+        min_replicates (int): The replicates run before racing starts.
+        max_replicates (int): The replicates run at most per rung.
+        alpha (float): The significance level of the racing test.
+        workers (int, optional): The number of worker processes. Defaults to the
+                                 number of CPUs.
+        seed (int, optional): The seed used to sample the Hyperband configurations.
+    """
+
+    def __init__(self, spec: dict, min_generations: int, max_generations: int, eta: int = 3,
+                 min_replicates: int = 3, max_replicates: int = 10, alpha: float = 0.05,
+                 workers: int = None, seed: int = None) -> None:
+        if 'n_generations' in spec.get('grid', {}):
+            raise ValueError("'n_generations' is the budget of the tuner and can not be in the grid")
+        if min_replicates < 2 or max_replicates < min_replicates:
+            raise ValueError("Racing needs 2 <= min_replicates <= max_replicates")
+
+        self.spec = spec
+        self.configs = expand_configs(spec)
+        self.min_generations = min_generations
+        self.max_generations = max_generations
+        self.eta = eta
+        self.min_replicates = min_replicates
+        self.max_replicates = max_replicates
+        self.alpha = alpha
+        self.workers = workers or spec.get('workers') or os.cpu_count()
+        self.seed = seed
+        self.sign = -1 if spec.get('params', {}).get('otimizer') == 'max' else 1
+
+        self.trajectory = []
+        self.rungs = []
+        self.scores = {}
+        self.reached = {}
+        self.pool = None
+        self.directory = None
+        self.writers = None
+
+    def losses(self, bracket: int, config_id: int, n_replicates: int) -> np.ndarray:
+        """Returns the losses of the first replicates of a configuration at its current budget."""
+        return np.array([self.scores[bracket, config_id, replicate] for replicate in range(n_replicates)])
+
+    def evaluate(self, bracket: int, rung: int, budget: int, trials: list[tuple[int, int]]) -> None:
+        """
+        Runs (config_id, replicate) trials up to `budget` generations on the pool.
+
+        Resumed runs only pay for the generations since their last rung. Failed
+        runs get an infinite loss, so racing drops them.
+        """
+        jobs = [make_job(self.spec, config_id, self.configs[config_id], replicate)
+                for config_id, replicate in trials]
+        paths = [os.path.join(self.directory, f'{bracket}_{config_id}_{replicate}.npz')
+                 for config_id, replicate in trials]
+        futures = [self.pool.submit(run_trial, job, budget, path) for job, path in zip(jobs, paths)]
+
+        for job, future in zip(jobs, futures):
+            try:
+                row = future.result()
+            except BrokenProcessPool as error:
+                row = {'config_id': job['config_id'], 'replicate': job['replicate'], 'seed': job['seed'],
+                       'status': 'error', 'fitness': None, 'error': f'worker died: {error}'}
+
+            trial = bracket, job['config_id'], job['replicate']
+            row.update(bracket=bracket, rung=rung, budget=budget,
+                       generations=budget - self.reached.get(trial, 0))
+            self.reached[trial] = budget
+            loss = np.inf if row['status'] != 'ok' else self.sign * row['fitness']
+            self.scores[trial] = loss
+            self.record(row, self.writers[0])
+
+    def decide(self, bracket: int, rung: int, budget: int, config_id: int,
+               n_replicates: int, decision: str) -> None:
+        losses = self.losses(bracket, config_id, n_replicates)
+        self.record({'bracket': bracket, 'rung': rung, 'budget': budget, 'config_id': config_id,
+                     'n_replicates': n_replicates, 'mean_fitness': float(self.sign * losses.mean()),
+                     'decision': decision}, self.writers[1])
+
+    def record(self, row: dict, writer) -> None:
+        for key, value in self.configs[row['config_id']].items():
+            row[key] = value if isinstance(value, str) else json.dumps(value)
+        writer.write(row)
+        (self.trajectory if writer is self.writers[0] else self.rungs).append(row)
+
+    def race(self, bracket: int, rung: int, budget: int, config_ids: list[int],
+             n_keep: int) -> list[tuple[int, int]]:
+        """
+        Races the configurations of a rung over the replicates.
+
+        Args:
+            bracket (int): The Hyperband bracket.
+            rung (int): The rung inside the bracket.
+            budget (int): The number of generations of the rung.
+            config_ids (list[int]): The configurations of the rung.
+            n_keep (int): The number of configurations to promote. Racing stops once
+                          no more than these are left.
+
+        Returns:
+            list[tuple[int, int]]: The surviving configurations and their number of
+                                   replicates, from best to worst mean.
+        """
+        alive = list(config_ids)
+        n_replicates = self.min_replicates
+        self.evaluate(bracket, rung, budget,
+                      [(config_id, replicate) for config_id in alive for replicate in range(n_replicates)])
+        replicates = {config_id: n_replicates for config_id in alive}
+
+        while True:
+            best = min(alive, key=lambda config_id: self.losses(bracket, config_id, n_replicates).mean())
+            best_losses = self.losses(bracket, best, n_replicates)
+
+            for config_id in list(alive):
+                losses = self.losses(bracket, config_id, n_replicates)
+                if config_id != best and (np.isinf(losses).any() or is_worse(losses, best_losses, self.alpha)):
+                    alive.remove(config_id)
+                    self.decide(bracket, rung, budget, config_id, n_replicates, 'eliminated')
+
+            if n_replicates >= self.max_replicates or len(alive) <= n_keep:
+                break
+
+            self.evaluate(bracket, rung, budget, [(config_id, n_replicates) for config_id in alive])
+            n_replicates += 1
+            replicates.update({config_id: n_replicates for config_id in alive})
+
+        alive.sort(key=lambda config_id: self.losses(bracket, config_id, replicates[config_id]).mean())
+        return [(config_id, replicates[config_id]) for config_id in alive]
+
+    def successive_halving(self, config_ids: list[int], min_generations: int,
+                           bracket: int = 0) -> tuple[int, int]:
+        """
+        Runs one successive halving bracket.
+
+        Args:
+            config_ids (list[int]): The configurations of the first rung.
+            min_generations (int): The budget of the first rung.
+            bracket (int, optional): The index of the bracket, for the trajectory.
+
+        Returns:
+            tuple[int, int]: The best configuration and its number of replicates.
+        """
+        budget = min_generations
+        rung = 0
+
+        while True:
+            last = budget >= self.max_generations
+            n_keep = 1 if last else max(1, len(config_ids) // self.eta)
+            ranked = self.race(bracket, rung, budget, config_ids, n_keep)
+
+            for position, (config_id, n_replicates) in enumerate(ranked):
+                decision = 'best' if last and position == 0 else \
+                           'promoted' if not last and position < n_keep else 'stopped'
+                self.decide(bracket, rung, budget, config_id, n_replicates, decision)
+
+            if last:
+                return ranked[0]
+
+            config_ids = [config_id for config_id, _ in ranked[:n_keep]]
+            budget = min(budget * self.eta, self.max_generations)
+            rung += 1
+
+    def brackets(self, method: str) -> list[tuple[list[int], int]]:
+        """
+        Returns the configurations and first budget of each bracket.
+
+        Halving is one bracket with the whole grid. Hyperband has s_max + 1
+        brackets, bracket s starting n = ceil((s_max + 1) / (s + 1) * eta^s)
+        sampled configurations at max_generations / eta^s generations.
+        """
+        if method == 'halving':
+            return [(list(range(len(self.configs))), self.min_generations)]
+        if method != 'hyperband':
+            raise ValueError(f"Unknown method '{method}', expected 'halving' or 'hyperband'")
+
+        generator = np.random.default_rng(self.seed)
+        s_max = int(math.log(self.max_generations / self.min_generations, self.eta) + 1e-9)
+        brackets = []
+
+        for s in range(s_max, -1, -1):
+            n_configs = min(math.ceil((s_max + 1) / (s + 1) * self.eta**s), len(self.configs))
+            config_ids = sorted(generator.choice(len(self.configs), n_configs, replace=False).tolist())
+            brackets.append((config_ids, max(1, round(self.max_generations / self.eta**s))))
+
+        return brackets
+
+    def run(self, method: str = 'halving', output: str = None) -> dict:
+        """
+        Tunes the grid of the spec.
+
+        Args:
+            method (str, optional): 'halving' or 'hyperband'.
+            output (str, optional): The trajectory output. Defaults to the spec
+                                    `output`, or '<name>_tuning.csv'.
+
+        Returns:
+            dict: The best configuration, with its grid values, mean fitness at the
+                  full budget and number of replicates.
+        """
+        output = output or self.spec.get('output') or f"{self.spec.get('name', 'experiment')}_tuning.csv"
+        grid_fields = list(self.spec.get('grid', {}))
+        stem, extension = os.path.splitext(output)
+
+        self.trajectory, self.rungs, self.scores, self.reached = [], [], {}, {}
+        self.writers = (open_writer(output, TRAJECTORY_FIELDS + grid_fields),
+                        open_writer(f'{stem}_rungs{extension}', RUNG_FIELDS + grid_fields))
+        self.directory = tempfile.mkdtemp(prefix='tuner_')
+        self.pool = ProcessPoolExecutor(self.workers, initializer=init_worker,
+                                        initargs=(project_dir(self.spec['engine']),
+                                                  self.spec.get('memory_limit_mb')))
+        winners = []
+
+        try:
+            for bracket, (config_ids, min_generations) in enumerate(self.brackets(method)):
+                config_id, n_replicates = self.successive_halving(config_ids, min_generations, bracket)
+                winners.append((self.losses(bracket, config_id, n_replicates).mean(),
+                                bracket, config_id, n_replicates))
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            shutil.rmtree(self.directory, ignore_errors=True)
+            for writer in self.writers:
+                writer.close()
+
+        loss, bracket, config_id, n_replicates = min(winners)
+        return {'config_id': config_id, 'bracket': bracket, 'config': self.configs[config_id],
+                'mean_fitness': float(self.sign * loss), 'n_replicates': n_replicates,
+                'evaluations': len(self.trajectory),
+                'generations': sum(row['generations'] for row in self.trajectory)}
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Tunes a spec grid with successive halving and racing.')
+    parser.add_argument('spec', help='the experiment spec (.json or .toml)')
+    parser.add_argument('--method', choices=['halving', 'hyperband'], help='the tuning method')
+    parser.add_argument('--workers', type=int, help='the number of worker processes')
+    parser.add_argument('--output', help='the trajectory file (.csv or .parquet)')
+    args = parser.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    options = dict(spec.get('tuner', {}))
+    method = args.method or options.pop('method', 'halving')
+    options.pop('method', None)
+
+    tuner = Tuner(spec, workers=args.workers, **options)
+    best = tuner.run(method, args.output)
+    print(f"{best['evaluations']} evaluations ({best['generations']} generations), best configuration {best['config_id']}: "
+          f"{best['config']} with mean fitness {best['mean_fitness']} over {best['n_replicates']} replicates")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 import numpy as np
 from typing import Callable
 from src.PSO_base import PSOBase
+from src.objective import Objective, as_objective
 
 class FunctionOtimizerPSO(PSOBase):
     """
@@ -15,10 +16,18 @@ class FunctionOtimizerPSO(PSOBase):
                  velocity_range: tuple, position_range: tuple, 
                  inertia: float, cognitive: float, social: float,
                  otimizer: Callable[[np.ndarray], int], n_generations: int = 500,
-                 function: Callable[[np.ndarray], int] = None,
+                 function: Callable[[np.ndarray], int] | Objective = None,
             ):
+       """
+       Initializes the function optimizer.
 
-       self.function = function
+       Args:
+           function (Callable[[np.ndarray], int] | Objective, optional): The function to be
+               optimized. Functions declared with `vectorized` are called once with the
+               whole swarm.
+       """
+
+       self.function = as_objective(function)
        super().__init__(n_particles, n_dim, velocity_range, position_range, 
                         inertia, cognitive, social, otimizer, n_generations)
 
@@ -32,7 +41,10 @@ class FunctionOtimizerPSO(PSOBase):
             np.ndarray: The initial swarm of particles.
         """
 
-        return np.random.uniform(self.position_range[0], self.position_range[1], (self.n_particles, self.n_dim))
+        lower, upper = self.position_range
+        samples = self.initialization.initialize(self.n_particles, self.n_dim)
+        particles = lower + (upper - lower) * samples
+        return particles.astype(self.dtypes.real, copy=False)
 
 
     def fitness(self, particles: np.ndarray) -> np.ndarray:
@@ -46,9 +58,4 @@ class FunctionOtimizerPSO(PSOBase):
             np.ndarray: The fitness values for each particle.
         """
 
-        fitness = np.empty(self.n_particles, dtype=float)
-
-        for i, p in enumerate(particles):
-            fitness[i] = self.function(p)
-
-        return fitness
+        return self.function(particles)
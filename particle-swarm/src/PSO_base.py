@@ -1,5 +1,18 @@
+import time
 from typing import Callable
+from collections import deque
+from concurrent.futures import Executor
 import numpy as np
+from src.async_evaluation import AsyncEvaluator
+from src.swarm_state import SwarmState
+from src.dtype_policy import DTypePolicy, LEGACY
+from src.checkpoint import Checkpointer, load_checkpoint, get_random_state, set_random_state
+from src.telemetry import TelemetrySink, generation_record
+from src.distributed import DistributedEvaluator
+from src.topology.abstract_topology import AbstractTopology
+from src.topology.global_topology import GlobalTopology
+from src.initialization.abstract_initialization import AbstractInitialization
+from src.initialization.uniform_initialization import UniformInitialization
 
 class PSOBase:
     """
@@ -40,6 +53,13 @@ class PSOBase:
         self.cognitive = cognitive
         self.social = social
         self.otimizer = otimizer
+        self.topology = GlobalTopology()
+        self.initialization = UniformInitialization()
+        self.checkpointer = None
+        self.dtypes = LEGACY
+        self.telemetry = None
+        self.evaluator = None
+        self.state = None
 
     def simulate(self, verbose: bool = False) -> np.ndarray:
         """
@@ -49,63 +69,248 @@ class PSOBase:
             verbose (bool): If True, prints progress information for each generation.
 
         Returns:
-            np.ndarray: The best path found after the simulation.
+            tuple[float, np.ndarray]: The best fitness and the best position found.
         """
-        self.history_particles = []
-        best_result = float('inf')
-        best_particle = None
+        self.reset()
+        return self.run_generations(verbose)
 
-        particles = self.create_particles()
-        velocity = np.zeros_like(particles)
-        particles_best = particles.copy()
+    def resume(self, path: str, verbose: bool = False) -> tuple[float, np.ndarray]:
+        """
+        Continues a simulation from a checkpoint until the last generation.
 
-        for i in range(self.n_generations):
+        Args:
+            path (str): The checkpoint written by the checkpointer.
+            verbose (bool): If True, prints progress information for each generation.
 
-            self.history_particles.append(particles.copy())  
+        Returns:
+            tuple[float, np.ndarray]: The best fitness and the best position found.
+        """
+        self.reset()
+        self.set_state(load_checkpoint(path))
+        return self.run_generations(verbose)
 
-            fitness = self.fitness(particles) 
+    def run_generations(self, verbose: bool = False) -> tuple[float, np.ndarray]:
+        """
+        Runs the remaining generations, writing checkpoints when they are due.
 
-            self.position_update(particles, particles_best, velocity, fitness)
+        Args:
+            verbose (bool): If True, prints progress information for each generation.
+
+        Returns:
+            tuple[float, np.ndarray]: The best fitness and the best position found.
+        """
+        start = time.perf_counter()
+        for i in range(self.generation, self.n_generations):
+
+            particles = self.ask()
+            fitness = self.evaluate(particles)
+            self.tell(fitness)
+
+            if self.telemetry is not None:
+                self.telemetry.emit(generation_record(i, particles, fitness, self.otimizer,
+                                                      (i + 1) * self.n_particles,
+                                                      time.perf_counter() - start))
 
             if verbose:
                 print(f'Geracao {i}: {fitness[self.otimizer(fitness)]}')
 
-            if np.min(fitness) < best_result:
-                best_result = np.min(fitness)
-                best_particle = particles[self.otimizer(fitness)]
+            if self.checkpointer is not None and \
+               (self.checkpointer.due(self.generation) or self.generation == self.n_generations):
+                self.checkpointer.save(self.get_state())
+
+        return self.state.global_best_fitness, self.state.global_best_position
 
-        print('Melhor resultado:', best_result)
-        print('Melhor caminho:', best_particle)
+    def get_state(self) -> dict[str, np.ndarray]:
+        """
+        Returns the state of the run as arrays, to be written in a checkpoint.
+
+        Returns:
+            dict[str, np.ndarray]: The swarm, the topology, the generation and the
+                                   random generator state.
+        """
+        if self.state is None:
+            self.reset()
 
-        return best_result, best_particle
+        state = self.state
+        return {'generation': np.array(self.generation),
+                'positions': state.positions,
+                'velocities': state.velocities,
+                'best_positions': state.best_positions,
+                'best_fitness': state.best_fitness,
+                'global_best_position': state.global_best_position,
+                'global_best_fitness': np.array(state.global_best_fitness),
+                **self.topology.get_state(),
+                **get_random_state()}
 
-    def position_update(self, particles: np.ndarray, particles_best: np.ndarray, velocity: np.ndarray, fitness: np.ndarray) -> np.ndarray:
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
         """
-        Updates the velocity of a single particle. The best particle global considered is the one with the best fitness.
+        Restores the state of the run returned by `get_state`.
 
         Args:
-            particle (np.ndarray): The current particle position.
-            particle_best (np.ndarray): The best position of the current particle.
-            best_particle (np.ndarray): The best position of the swarm.
-            velocity (np.ndarray): The current velocity of the particle.
+            state (dict[str, np.ndarray]): The arrays of the run state.
+        """
+        self.generation = int(state['generation'])
+        self.state = SwarmState(state['positions'].copy(), self.otimizer)
+        self.state.velocities = state['velocities'].copy()
+        self.state.best_positions = state['best_positions'].copy()
+        self.state.best_fitness = state['best_fitness'].copy()
+        self.state.global_best_position = state['global_best_position'].copy()
+        self.state.global_best_fitness = float(state['global_best_fitness'])
+        self.topology.set_state(state)
+        set_random_state(state)
+
+    def reset(self) -> None:
+        """
+        Creates a new swarm, so the next `ask` starts a new run.
+        """
+        self.history_particles = []
+        self.state = SwarmState(self.create_particles(), self.otimizer)
+        self.generation = 0
+
+    def ask(self) -> np.ndarray:
+        """
+        Returns the positions waiting for evaluation.
+
+        The particles only move in `tell`, so calling it again before `tell`
+        returns the same positions.
 
         Returns:
-            np.ndarray: The updated velocity of the particle.
+            np.ndarray: A copy of the current positions of the particles.
         """
-        best_particle = particles[self.otimizer(fitness)]
+        if self.state is None:
+            self.reset()
+        return self.state.positions.copy()
 
-        r1, r2 = np.random.rand(2, self.n_particles, self.n_dim)
+    def tell(self, fitness: np.ndarray) -> None:
+        """
+        Receives the fitness of the asked positions, updates the bests and moves the particles.
 
-        velocity = self.inertia * velocity \
-                   + self.cognitive * r1 * (particles_best - particles) \
-                   + self.social * r2 * (best_particle - particles)
-        velocity = np.clip(velocity, self.velocity_range[0], self.velocity_range[1])
+        Args:
+            fitness (np.ndarray): The fitness of each particle returned by `ask`.
+        """
+        if self.state is None:
+            raise RuntimeError("tell() called before ask()")
+
+        state = self.state
+        fitness = np.asarray(fitness, dtype=float)
+        if fitness.shape != (self.n_particles,):
+            raise ValueError(f"Expected {self.n_particles} fitness values, got shape {fitness.shape}")
+
+        self.history_particles.append(state.positions.copy())
 
-        particles += velocity
-        particles = np.clip(particles, self.position_range[0], self.position_range[1])
+        previous_best = state.global_best_fitness
+        state.update_bests(fitness)
+        self.topology.update(state.is_better(state.global_best_fitness, previous_best))
 
-        idx = np.argwhere(fitness < self.fitness(particles_best))
-        particles_best[idx] = particles[idx]
+        self.position_update(state)
+        self.generation += 1
+
+    def simulate_async(self, executor: Executor = None, max_concurrent: int = 4,
+                       verbose: bool = False) -> tuple[float, np.ndarray]:
+        """
+        Simulates the particle swarm with asynchronous evaluations.
+
+        Evaluations run concurrently, up to `max_concurrent` at a time. As soon as
+        the evaluation of a particle finishes, its bests are updated, it moves with
+        the current neighbourhood best and is submitted again, so there is no
+        generation barrier. The budget is n_generations * n_particles evaluations.
+
+        Args:
+            executor (Executor, optional): The executor running the evaluations. If None,
+                                           a thread pool is used.
+            max_concurrent (int, optional): The maximum number of evaluations in flight.
+            verbose (bool): If True, prints progress information every n_particles evaluations.
+
+        Returns:
+            tuple[float, np.ndarray]: The best fitness and the best position found.
+        """
+        self.state = SwarmState(self.create_particles(), self.otimizer)
+        budget = self.n_generations * self.n_particles
+        ready = deque(range(self.n_particles))
+        n_evaluated = n_submitted = 0
+        improved = False
+
+        with AsyncEvaluator(self.fitness, executor, max_concurrent) as evaluator:
+            while n_evaluated < budget:
+                while ready and evaluator.has_capacity() and n_submitted < budget:
+                    i = ready.popleft()
+                    evaluator.submit(i, self.state.positions[i])
+                    n_submitted += 1
+
+                i, fitness = evaluator.next_completed()
+                n_evaluated += 1
+
+                improved |= self.state.update_particle(i, fitness)
+                self.particle_update(self.state, i)
+                ready.append(i)
+
+                if n_evaluated % self.n_particles == 0:
+                    self.topology.update(improved)
+                    improved = False
+                    if verbose:
+                        print(f'Avaliacao {n_evaluated}: {self.state.global_best_fitness}')
+
+        return self.state.global_best_fitness, self.state.global_best_position
+
+    def position_update(self, state: SwarmState) -> None:
+        """
+        Updates the velocities and positions of the swarm in place. Each particle is
+        attracted by its personal best and by the best of its neighbourhood, given
+        by the swarm topology.
+
+        Args:
+            state (SwarmState): The state of the swarm.
+        """
+        neighborhood_best = state.best_positions[self.topology.best(state)]
+        r1, r2 = np.random.rand(2, self.n_particles, self.n_dim).astype(state.positions.dtype, copy=False)
+
+        state.velocities *= self.inertia
+        state.velocities += self.cognitive * r1 * (state.best_positions - state.positions)
+        state.velocities += self.social * r2 * (neighborhood_best - state.positions)
+        np.clip(state.velocities, self.velocity_range[0], self.velocity_range[1], out=state.velocities)
+
+        state.positions += state.velocities
+        np.clip(state.positions, self.position_range[0], self.position_range[1], out=state.positions)
+
+    def particle_update(self, state: SwarmState, index: int) -> None:
+        """
+        Updates the velocity and position of a single particle in place.
+
+        Args:
+            state (SwarmState): The state of the swarm.
+            index (int): The index of the particle.
+        """
+        neighborhood_best = state.best_positions[self.topology.best(state)[index]]
+        r1, r2 = np.random.rand(2, self.n_dim).astype(state.positions.dtype, copy=False)
+
+        velocity = state.velocities[index]
+        position = state.positions[index]
+
+        velocity *= self.inertia
+        velocity += self.cognitive * r1 * (state.best_positions[index] - position)
+        velocity += self.social * r2 * (neighborhood_best - position)
+        np.clip(velocity, self.velocity_range[0], self.velocity_range[1], out=velocity)
+
+        position += velocity
+        np.clip(position, self.position_range[0], self.position_range[1], out=position)
+
+    def set_topology(self, topology: AbstractTopology) -> None:
+        self.topology = topology
+
+    def set_initialization(self, initialization: AbstractInitialization) -> None:
+        self.initialization = initialization
+
+    def set_checkpointer(self, checkpointer: Checkpointer) -> None:
+        self.checkpointer = checkpointer
+
+    def set_dtype_policy(self, dtypes: DTypePolicy) -> None:
+        self.dtypes = dtypes
+
+    def set_telemetry(self, telemetry: TelemetrySink) -> None:
+        self.telemetry = telemetry
+
+    def set_evaluator(self, evaluator: DistributedEvaluator) -> None:
+        self.evaluator = evaluator
 
     def create_particles(self) -> np.ndarray:
         """
@@ -131,4 +336,19 @@ class PSOBase:
         Returns:
             np.ndarray: The fitness values for each particle.
         """
-        raise NotImplementedError("Subclasses must implement fitness")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement fitness")
+
+    def evaluate(self, particles: np.ndarray) -> np.ndarray:
+        """
+        Evaluates particles with the evaluator set by `set_evaluator`, or with
+        `fitness` in this process if there is none.
+
+        Args:
+            particles (np.ndarray): The population of particles to evaluate.
+
+        Returns:
+            np.ndarray: The fitness values for each particle.
+        """
+        if self.evaluator is None:
+            return self.fitness(particles)
+        return self.evaluator(particles)
\ No newline at end of file
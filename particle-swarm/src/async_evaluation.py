@@ -0,0 +1,74 @@
+import numpy as np
+from typing import Callable, Hashable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class AsyncEvaluator:
+    """
+    Evaluates single candidates asynchronously with a bounded number in flight.
+
+    Each candidate is submitted to a `concurrent.futures` executor as a batch of
+    one row, and results are consumed in completion order, so a slow evaluation
+    never blocks the others.
+
+    Parameters:
+        function (Callable[[np.ndarray], np.ndarray]): The fitness function of a batch.
+        executor (Executor, optional): The executor running the evaluations. If None,
+                                       a thread pool with `max_concurrent` workers
+                                       is created and closed by the evaluator. A
+                                       process pool requires a picklable function.
+        max_concurrent (int): The maximum number of evaluations in flight.
+    """
+
+    def __init__(self, function: Callable[[np.ndarray], np.ndarray],
+                 executor: Executor = None, max_concurrent: int = 4) -> None:
+        self.function = function
+        self.max_concurrent = max_concurrent
+        self.owns_executor = executor is None
+        self.executor = ThreadPoolExecutor(max_concurrent) if executor is None else executor
+        self.pending: dict[Future, Hashable] = {}
+
+    def __enter__(self) -> 'AsyncEvaluator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def has_capacity(self) -> bool:
+        """Returns True if another evaluation can be submitted."""
+        return len(self.pending) < self.max_concurrent
+
+    def n_pending(self) -> int:
+        """Returns the number of evaluations in flight."""
+        return len(self.pending)
+
+    def submit(self, key: Hashable, candidate: np.ndarray) -> None:
+        """
+        Submits the evaluation of a single candidate.
+
+        Args:
+            key (Hashable): The identifier returned with the result.
+            candidate (np.ndarray): The candidate to evaluate, copied before submission.
+        """
+        future = self.executor.submit(self.function, np.array(candidate)[None])
+        self.pending[future] = key
+
+    def next_completed(self) -> tuple[Hashable, float]:
+        """
+        Waits for the next evaluation to finish.
+
+        Returns:
+            tuple[Hashable, float]: The key of the candidate and its fitness.
+        """
+        done, _ = wait(self.pending, return_when=FIRST_COMPLETED)
+        future = done.pop()
+        key = self.pending.pop(future)
+        return key, float(future.result()[0])
+
+    def close(self) -> None:
+        """Cancels the evaluations in flight and closes the owned executor."""
+        for future in self.pending:
+            future.cancel()
+        self.pending.clear()
+        if self.owns_executor:
+            self.executor.shutdown(wait=True)
@@ -0,0 +1,196 @@
+import numpy as np
+from typing import Callable
+
+
+class BenchmarkFunction:
+    """
+    A standard test function with its bounds and known optimum.
+
+    The function is vectorized: called with an (N, D) matrix it returns the N
+    values in one NumPy call, and called with a single (D,) vector it returns
+    a float, so it works as the `function` argument of the optimizers in both
+    forms.
+
+    Parameters:
+        name (str): The name of the function.
+        function (Callable[[np.ndarray], np.ndarray]): The batch implementation.
+        bounds (tuple[float, float]): The usual search interval of each variable.
+        optimum_value (float): The global minimum value.
+        optimum_position (Callable[[int], np.ndarray]): The global minimizer for a dimension.
+    """
+
+    vectorized = True
+    chunk_size = None
+
+    def __init__(self, name: str, function: Callable[[np.ndarray], np.ndarray],
+                 bounds: tuple[float, float], optimum_value: float,
+                 optimum_position: Callable[[int], np.ndarray]) -> None:
+        self.name = name
+        self.function = function
+        self.bounds = bounds
+        self.optimum_value = optimum_value
+        self.optimum_position = optimum_position
+
+    def __call__(self, x: np.ndarray) -> np.ndarray | float:
+        x = np.asarray(x)
+        if not np.issubdtype(x.dtype, np.floating):
+            x = x.astype(float)
+        if x.ndim == 1:
+            return float(self.function(x[None])[0])
+        return self.function(x)
+
+    def __repr__(self) -> str:
+        return f'BenchmarkFunction({self.name})'
+
+    @property
+    def lmin(self) -> float:
+        return self.bounds[0]
+
+    @property
+    def lmax(self) -> float:
+        return self.bounds[1]
+
+    def optimum(self, n_dim: int) -> np.ndarray:
+        """
+        Returns the global minimizer of the function.
+
+        Args:
+            n_dim (int): The number of dimensions.
+
+        Returns:
+            np.ndarray: The position of the global minimum.
+        """
+        return np.asarray(self.optimum_position(n_dim), dtype=float)
+
+
+def sphere(x: np.ndarray) -> np.ndarray:
+    return np.sum(np.square(x), axis=1)
+
+
+def rosenbrock(x: np.ndarray) -> np.ndarray:
+    return np.sum(100 * np.square(x[:, 1:] - np.square(x[:, :-1])) + np.square(1 - x[:, :-1]), axis=1)
+
+
+def rastrigin(x: np.ndarray) -> np.ndarray:
+    return 10 * x.shape[1] + np.sum(np.square(x) - 10 * np.cos(2 * np.pi * x), axis=1)
+
+
+def ackley(x: np.ndarray) -> np.ndarray:
+    return - 20 * np.exp(-0.2 * np.sqrt(np.mean(np.square(x), axis=1))) \
+           - np.exp(np.mean(np.cos(2 * np.pi * x), axis=1)) \
+           + 20 + np.e
+
+
+def griewank(x: np.ndarray) -> np.ndarray:
+    i = np.arange(1, x.shape[1] + 1)
+    return 1 + np.sum(np.square(x), axis=1) / 4000 - np.prod(np.cos(x / np.sqrt(i)), axis=1)
+
+
+def schwefel(x: np.ndarray) -> np.ndarray:
+    # Outside [-500, 500] the variables are folded back and penalized, as in CEC 2014,
+    # so the shifted and rotated variants, which reach further, keep the minimum of 0.
+    excess = np.abs(x) - 500
+    z = np.where(excess > 0, np.sign(x) * (500 - np.mod(np.abs(x), 500)), x)
+    penalty = np.sum(np.square(np.maximum(excess, 0)), axis=1) / (10000 * x.shape[1])
+    return 418.9828872724339 * x.shape[1] - np.sum(z * np.sin(np.sqrt(np.abs(z))), axis=1) + penalty
+
+
+def levy(x: np.ndarray) -> np.ndarray:
+    w = 1 + (x - 1) / 4
+    first = np.square(np.sin(np.pi * w[:, 0]))
+    middle = np.sum(np.square(w[:, :-1] - 1) * (1 + 10 * np.square(np.sin(np.pi * w[:, :-1] + 1))), axis=1)
+    last = np.square(w[:, -1] - 1) * (1 + np.square(np.sin(2 * np.pi * w[:, -1])))
+    return first + middle + last
+
+
+BENCHMARKS = {
+    'sphere': BenchmarkFunction('sphere', sphere, (-5.12, 5.12), 0.0, np.zeros),
+    'rosenbrock': BenchmarkFunction('rosenbrock', rosenbrock, (-5.0, 10.0), 0.0, np.ones),
+    'rastrigin': BenchmarkFunction('rastrigin', rastrigin, (-5.12, 5.12), 0.0, np.zeros),
+    'ackley': BenchmarkFunction('ackley', ackley, (-32.768, 32.768), 0.0, np.zeros),
+    'griewank': BenchmarkFunction('griewank', griewank, (-600.0, 600.0), 0.0, np.zeros),
+    'schwefel': BenchmarkFunction('schwefel', schwefel, (-500.0, 500.0), 0.0,
+                                  lambda n_dim: np.full(n_dim, 420.9687463599)),
+    'levy': BenchmarkFunction('levy', levy, (-10.0, 10.0), 0.0, np.ones),
+}
+
+
+def get_benchmark(name: str) -> BenchmarkFunction:
+    """
+    Returns a benchmark function by name.
+
+    Args:
+        name (str): One of the keys of BENCHMARKS.
+
+    Returns:
+        BenchmarkFunction: The benchmark function.
+    """
+    if name not in BENCHMARKS:
+        raise ValueError(f"Unknown benchmark '{name}', expected one of {list(BENCHMARKS)}")
+    return BENCHMARKS[name]
+
+
+def shifted(benchmark: BenchmarkFunction, shift: np.ndarray) -> BenchmarkFunction:
+    """
+    Moves the optimum of a benchmark function by a fixed shift.
+
+    Args:
+        benchmark (BenchmarkFunction): The original function.
+        shift (np.ndarray): The (D,) displacement of the optimum.
+
+    Returns:
+        BenchmarkFunction: The shifted function, defined for D dimensions.
+    """
+    shift = np.asarray(shift, dtype=float)
+    optimum = benchmark.optimum(shift.shape[0]) + shift
+
+    return BenchmarkFunction(f'shifted_{benchmark.name}',
+                             lambda x: benchmark.function(x - shift),
+                             benchmark.bounds, benchmark.optimum_value,
+                             lambda n_dim: optimum)
+
+
+def rotated(benchmark: BenchmarkFunction, rotation: np.ndarray) -> BenchmarkFunction:
+    """
+    Rotates a benchmark function around its optimum.
+
+    Args:
+        benchmark (BenchmarkFunction): The original function.
+        rotation (np.ndarray): A (D, D) orthogonal matrix.
+
+    Returns:
+        BenchmarkFunction: The rotated function, defined for D dimensions.
+    """
+    rotation = np.asarray(rotation, dtype=float)
+    optimum = benchmark.optimum(rotation.shape[0])
+
+    return BenchmarkFunction(f'rotated_{benchmark.name}',
+                             lambda x: benchmark.function((x - optimum) @ rotation.T + optimum),
+                             benchmark.bounds, benchmark.optimum_value,
+                             lambda n_dim: optimum)
+
+
+def shifted_rotated(benchmark: BenchmarkFunction, n_dim: int, seed: int = None) -> BenchmarkFunction:
+    """
+    Creates a randomly rotated and shifted variant of a benchmark function.
+
+    The rotation is a random orthogonal matrix, and the optimum is moved to a
+    random point in the central 80% of the bounds.
+
+    Args:
+        benchmark (BenchmarkFunction): The original function.
+        n_dim (int): The number of dimensions.
+        seed (int, optional): The seed of the random transformation.
+
+    Returns:
+        BenchmarkFunction: The transformed function, defined for n_dim dimensions.
+    """
+    rng = np.random.default_rng(seed)
+    q, r = np.linalg.qr(rng.normal(size=(n_dim, n_dim)))
+    rotation = q * np.sign(np.diag(r))
+
+    low, high = benchmark.bounds
+    target = low + (0.1 + 0.8 * rng.random(n_dim)) * (high - low)
+    shift = target - benchmark.optimum(n_dim)
+
+    return shifted(rotated(benchmark, rotation), shift)
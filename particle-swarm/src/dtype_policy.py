@@ -0,0 +1,51 @@
+import numpy as np
+
+
+class DTypePolicy:
+    """
+    Chooses the dtypes of the arrays created by the engines.
+
+    The engines and examples create their populations with these dtypes, and
+    the operators keep the dtype of the arrays they receive, so a compact
+    policy halves (or better) the memory traffic of every generation.
+
+    Parameters:
+        real (np.dtype): The dtype of real-valued genomes, positions, velocities
+                         and pheronomes.
+        binary (np.dtype): The dtype of binary genomes.
+        index (np.dtype, optional): The dtype of permutations and paths. If None,
+                                    the smallest signed integer that holds the
+                                    number of elements is used.
+    """
+
+    def __init__(self, real: np.dtype = np.float64, binary: np.dtype = np.int_,
+                 index: np.dtype = np.int_) -> None:
+        self.real = np.dtype(real)
+        self.binary = np.dtype(binary)
+        self.index_dtype = None if index is None else np.dtype(index)
+
+    def __repr__(self) -> str:
+        index = 'auto' if self.index_dtype is None else self.index_dtype
+        return f'DTypePolicy(real={self.real}, binary={self.binary}, index={index})'
+
+    def index(self, n_values: int) -> np.dtype:
+        """
+        Returns the dtype of arrays holding indices in [0, n_values).
+
+        Args:
+            n_values (int): The number of distinct indices, e.g. the number of cities.
+
+        Returns:
+            np.dtype: The integer dtype.
+        """
+        if self.index_dtype is not None:
+            return self.index_dtype
+
+        for dtype in (np.int8, np.int16, np.int32):
+            if n_values - 1 <= np.iinfo(dtype).max:
+                return np.dtype(dtype)
+        return np.dtype(np.int64)
+
+
+LEGACY = DTypePolicy()
+COMPACT = DTypePolicy(real=np.float32, binary=np.uint8, index=None)
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class AbstractInitialization(ABC):
+    """Abstract class representing the initialization of a population.
+
+    This class defines the interface for initialization strategies. Specific
+    initializations (e.g., Latin hypercube, Sobol, random permutations) should
+    inherit from this class and implement the `initialize` method.
+
+    Continuous initializations sample the unit hypercube [0, 1)^D and the
+    problem scales the samples to its own bounds.
+
+    """
+
+    @abstractmethod
+    def initialize(self, n_individuals: int, n_genes: int) -> np.ndarray:
+        """Creates the initial population.
+
+        Args:
+            n_individuals (int): The number of individuals to create.
+            n_genes (int): The number of genes in each individual.
+
+        Returns:
+            np.ndarray: The (n_individuals, n_genes) initial population.
+
+        """
+        pass
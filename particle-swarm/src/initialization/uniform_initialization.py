@@ -0,0 +1,20 @@
+from src.initialization.abstract_initialization import AbstractInitialization
+import numpy as np
+
+class UniformInitialization(AbstractInitialization):
+    """
+    Samples every gene independently and uniformly in [0, 1).
+    """
+
+    def initialize(self, n_individuals: int, n_genes: int) -> np.ndarray:
+        """
+        Samples the unit hypercube uniformly.
+
+        Args:
+            n_individuals (int): The number of individuals to create.
+            n_genes (int): The number of genes in each individual.
+
+        Returns:
+            np.ndarray: The samples in [0, 1).
+        """
+        return np.random.random((n_individuals, n_genes))
@@ -0,0 +1,225 @@
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+import numpy as np
+from src.PSO_base import PSOBase
+from src.swarm_state import SwarmState
+
+class MultiSwarmPSO:
+    """
+    Runs several independent particle swarms in parallel worker processes.
+
+    Every `share_every` generations the swarms publish their global best in
+    shared memory, wait for each other, and migrate the overall best into
+    their worst personal best. Swarms whose best has not improved for
+    `reseed_after` generations are re-seeded around the shared best.
+    """
+
+    def __init__(self, swarm_class: type[PSOBase], n_swarms: int,
+                 share_every: int = 10, reseed_after: int = None,
+                 reseed_radius: float = 0.1, seed: int = None,
+                 **swarm_kwargs: dict[str, any]):
+        """
+        Initializes the multi-swarm runner.
+
+        Args:
+            swarm_class (type[PSOBase]): The swarm class, e.g. FunctionOtimizerPSO. The class
+                                         and its arguments must be picklable.
+            n_swarms (int): The number of swarms, one worker process each.
+            share_every (int, optional): The number of generations between best-sharing.
+            reseed_after (int, optional): The number of generations without improvement
+                                          after which a swarm is re-seeded. If None,
+                                          swarms are never re-seeded.
+            reseed_radius (float, optional): The standard deviation of the re-seeded
+                                             positions, relative to the position range.
+            seed (int, optional): The seed of the first swarm; swarm i uses seed + i.
+            **swarm_kwargs: Keyword arguments to pass to the swarm constructor.
+        """
+        self.swarm_class = swarm_class
+        self.n_swarms = n_swarms
+        self.share_every = share_every
+        self.reseed_after = reseed_after
+        self.reseed_radius = reseed_radius
+        self.seed = seed
+        self.swarm_kwargs = swarm_kwargs
+
+    def simulate(self) -> tuple[float, np.ndarray, np.ndarray]:
+        """
+        Runs all the swarms until each one completes its generations.
+
+        Returns:
+            tuple[float, np.ndarray, np.ndarray]: The best fitness, the best position and
+                                                  the merged convergence curve (best
+                                                  fitness over all swarms per generation).
+        """
+        model = self.swarm_class(**self.swarm_kwargs)
+        n_generations, n_dim = model.n_generations, model.n_dim
+        seed = self.seed if self.seed is not None else np.random.randint(0, 2**31 - self.n_swarms)
+
+        blocks = {
+            'positions': ((self.n_swarms, n_dim), np.float64),
+            'fitness': ((self.n_swarms,), np.float64),
+            'curves': ((self.n_swarms, n_generations), np.float64),
+        }
+        memory = {name: shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+                  for name, (shape, _) in blocks.items()}
+        arrays = {name: np.ndarray(shape, dtype, buffer=memory[name].buf)
+                  for name, (shape, dtype) in blocks.items()}
+        layout = {name: (memory[name].name, shape) for name, (shape, _) in blocks.items()}
+
+        barrier = mp.Barrier(self.n_swarms)
+        workers = [mp.Process(target=run_swarm,
+                              args=(index, self, layout, barrier, seed + index))
+                   for index in range(self.n_swarms)]
+
+        try:
+            for worker in workers:
+                worker.start()
+            self.wait(workers, barrier)
+
+            self.curves = arrays['curves'].copy()
+            best = model.otimizer(arrays['fitness'])
+            best_result = float(arrays['fitness'][best])
+            best_position = arrays['positions'][best].copy()
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+            for block in memory.values():
+                block.close()
+                block.unlink()
+
+        reduce = np.max if model.otimizer == np.argmax else np.min
+        return best_result, best_position, reduce(self.curves, axis=0)
+
+    @staticmethod
+    def wait(workers: list[mp.Process], barrier) -> None:
+        """
+        Waits for all workers, aborting the barrier if any of them fails.
+
+        Args:
+            workers (list[mp.Process]): The worker processes.
+            barrier: The barrier shared by the workers.
+        """
+        while any(worker.is_alive() for worker in workers):
+            if any(worker.exitcode not in (None, 0) for worker in workers):
+                barrier.abort()
+                break
+            time.sleep(0.01)
+
+        for worker in workers:
+            worker.join()
+
+        failed = [index for index, worker in enumerate(workers) if worker.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"Swarms {failed} failed")
+
+
+def open_shared(layout: dict) -> tuple[dict, dict]:
+    """
+    Attaches to the shared memory blocks created by the runner.
+
+    Args:
+        layout (dict): The name and shape of each block.
+
+    Returns:
+        tuple[dict, dict]: The shared memory blocks and their array views.
+    """
+    memory = {name: shared_memory.SharedMemory(name=block) for name, (block, _) in layout.items()}
+    arrays = {name: np.ndarray(shape, np.float64, buffer=memory[name].buf)
+              for name, (_, shape) in layout.items()}
+    return memory, arrays
+
+
+def run_swarm(index: int, runner: MultiSwarmPSO, layout: dict, barrier, seed: int) -> None:
+    """
+    Runs a single swarm of a MultiSwarmPSO inside a worker process.
+
+    Args:
+        index (int): The index of the swarm.
+        runner (MultiSwarmPSO): The runner with the swarm configuration.
+        layout (dict): The name and shape of each shared memory block.
+        barrier: The barrier shared by the workers.
+        seed (int): The seed of the swarm.
+    """
+    np.random.seed(seed)
+    memory, shared = open_shared(layout)
+
+    try:
+        swarm = runner.swarm_class(**runner.swarm_kwargs)
+        swarm.reset()
+        state = swarm.state
+        stagnation = 0
+
+        for i in range(swarm.n_generations):
+            previous_best = state.global_best_fitness
+            swarm.tell(swarm.fitness(swarm.ask()))
+            improved = state.is_better(state.global_best_fitness, previous_best)
+            stagnation = 0 if improved else stagnation + 1
+            shared['curves'][index, i] = state.global_best_fitness
+
+            if (i + 1) % runner.share_every == 0 and i + 1 < swarm.n_generations:
+                shared['positions'][index] = state.global_best_position
+                shared['fitness'][index] = state.global_best_fitness
+                barrier.wait()
+
+                best = swarm.otimizer(shared['fitness'])
+                best_position = shared['positions'][best].copy()
+                best_fitness = shared['fitness'][best]
+                barrier.wait()
+
+                if best != index and state.is_better(best_fitness, state.global_best_fitness):
+                    migrate(state, best_position, best_fitness)
+
+                if runner.reseed_after is not None and best != index \
+                   and stagnation >= runner.reseed_after:
+                    reseed(swarm, state, best_position, runner.reseed_radius)
+                    stagnation = 0
+
+        shared['positions'][index] = state.global_best_position
+        shared['fitness'][index] = state.global_best_fitness
+    except BrokenBarrierError:
+        raise SystemExit(1)
+    finally:
+        for block in memory.values():
+            block.close()
+
+
+def migrate(state: SwarmState, position: np.ndarray, fitness: float) -> None:
+    """
+    Replaces the worst personal best of a swarm with a better shared position.
+
+    Args:
+        state (SwarmState): The state of the swarm.
+        position (np.ndarray): The shared best position.
+        fitness (float): The fitness of the shared best position.
+    """
+    worst = np.argmin(state.best_fitness) if state.otimizer == np.argmax \
+            else np.argmax(state.best_fitness)
+    state.best_positions[worst] = position
+    state.best_fitness[worst] = fitness
+    state.global_best_position[:] = position
+    state.global_best_fitness = fitness
+
+
+def reseed(swarm: PSOBase, state: SwarmState, position: np.ndarray, radius: float) -> None:
+    """
+    Scatters the particles of a stagnant swarm around the shared best position.
+
+    The personal bests are discarded, so they restart from the new positions,
+    and the velocities are reset to zero.
+
+    Args:
+        swarm (PSOBase): The swarm being re-seeded.
+        state (SwarmState): The state of the swarm.
+        position (np.ndarray): The shared best position.
+        radius (float): The standard deviation relative to the position range.
+    """
+    low, high = swarm.position_range
+    scale = radius * (np.asarray(high) - np.asarray(low))
+    state.positions[:] = position + np.random.normal(0, 1, state.positions.shape) * scale
+    state.positions[0] = position
+    np.clip(state.positions, low, high, out=state.positions)
+    state.velocities[:] = 0
+    state.best_fitness[:] = float('-inf') if state.otimizer == np.argmax else float('inf')
@@ -0,0 +1,237 @@
+import math
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Callable
+from src.objective import Objective
+
+
+class AbstractSurrogate(ABC):
+    """
+    A regression model approximating the objective function.
+    """
+
+    @abstractmethod
+    def fit(self, candidates: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        Learns from evaluated candidates.
+
+        Args:
+            candidates (np.ndarray): The (N, D) evaluated candidates.
+            fitness (np.ndarray): Their N fitness values.
+        """
+        pass
+
+    @abstractmethod
+    def predict(self, candidates: np.ndarray) -> np.ndarray:
+        """
+        Predicts the fitness of new candidates.
+
+        Args:
+            candidates (np.ndarray): The (M, D) candidates.
+
+        Returns:
+            np.ndarray: The M predicted fitness values.
+        """
+        pass
+
+
+def squared_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Returns the (len(a), len(b)) matrix of squared euclidean distances."""
+    distances = (a**2).sum(axis=1)[:, None] + (b**2).sum(axis=1)[None, :] - 2 * a @ b.T
+    return np.maximum(distances, 0)
+
+
+class KNNSurrogate(AbstractSurrogate):
+    """
+    Predicts the inverse-distance weighted mean of the k nearest evaluated candidates.
+
+    Parameters:
+        k (int): The number of neighbors.
+    """
+
+    def __init__(self, k: int = 5) -> None:
+        self.k = k
+        self.candidates = None
+        self.fitness = None
+
+    def fit(self, candidates: np.ndarray, fitness: np.ndarray) -> None:
+        self.candidates = np.asarray(candidates, dtype=float)
+        self.fitness = np.asarray(fitness, dtype=float)
+
+    def predict(self, candidates: np.ndarray) -> np.ndarray:
+        distances = squared_distances(np.asarray(candidates, dtype=float), self.candidates)
+        k = min(self.k, distances.shape[1])
+
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        weights = 1 / (np.sqrt(np.take_along_axis(distances, nearest, axis=1)) + 1e-12)
+        return (weights * self.fitness[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+
+class RBFSurrogate(AbstractSurrogate):
+    """
+    Gaussian radial basis function interpolation of the evaluated candidates.
+
+    Solving the interpolation system is cubic in the number of samples, so only
+    the last `max_samples` candidates are used.
+
+    Parameters:
+        epsilon (float, optional): The width of the basis functions. If None, the
+                                   median distance between the samples is used.
+        smoothing (float): The ridge added to the diagonal, which regularizes noisy
+                           or nearly duplicated samples.
+        max_samples (int): The maximum number of samples in the system.
+    """
+
+    def __init__(self, epsilon: float = None, smoothing: float = 1e-6, max_samples: int = 500) -> None:
+        self.epsilon = epsilon
+        self.smoothing = smoothing
+        self.max_samples = max_samples
+        self.candidates = None
+        self.weights = None
+        self.mean = 0.0
+        self.width = 1.0
+
+    def fit(self, candidates: np.ndarray, fitness: np.ndarray) -> None:
+        self.candidates = np.asarray(candidates, dtype=float)[-self.max_samples:]
+        fitness = np.asarray(fitness, dtype=float)[-self.max_samples:]
+
+        distances = squared_distances(self.candidates, self.candidates)
+        if self.epsilon is not None:
+            self.width = self.epsilon
+        else:
+            self.width = np.sqrt(np.median(distances[np.triu_indices(len(distances), 1)])) or 1.0
+
+        kernel = np.exp(-distances / (2 * self.width**2))
+        kernel[np.diag_indices_from(kernel)] += self.smoothing
+        self.mean = fitness.mean()
+        self.weights = np.linalg.solve(kernel, fitness - self.mean)
+
+    def predict(self, candidates: np.ndarray) -> np.ndarray:
+        distances = squared_distances(np.asarray(candidates, dtype=float), self.candidates)
+        return np.exp(-distances / (2 * self.width**2)) @ self.weights + self.mean
+
+
+def rank_correlation(a: np.ndarray, b: np.ndarray) -> float:
+    """Returns the Spearman correlation between two arrays (ties are not averaged)."""
+    if len(a) < 2:
+        return float('nan')
+    ranks_a = np.argsort(np.argsort(a)).astype(float)
+    ranks_b = np.argsort(np.argsort(b)).astype(float)
+    if ranks_a.std() == 0 or ranks_b.std() == 0:
+        return float('nan')
+    return float(np.corrcoef(ranks_a, ranks_b)[0, 1])
+
+
+class SurrogateObjective(Objective):
+    """
+    Pre-screens candidates with a surrogate before the real objective.
+
+    Every real evaluation is kept in an archive the surrogate learns from. Once
+    the archive has `min_samples` evaluations, each batch is predicted first
+    and only the most promising `fraction` goes to the real objective. The
+    others get the worst possible fitness (inf, or -inf when maximizing), so
+    a position that was never evaluated can never become a personal or
+    global best of the swarm.
+
+    `screened='prediction'` keeps their prediction instead, limited to be no
+    better than the worst real evaluation of the batch, as the GA does. The
+    PSO keeps personal bests across generations, so with it a particle whose
+    best is worse than that limit would take a predicted fitness as its best.
+
+    The accuracy of the surrogate on the really evaluated candidates (mean
+    absolute error and rank correlation) and the number of evaluations saved
+    are appended to `history`, one entry per batch (per generation).
+
+    Parameters:
+        function (Callable | Objective): The expensive objective function.
+        surrogate (AbstractSurrogate, optional): The regression model. Defaults to
+                                                 a KNNSurrogate.
+        otimizer (Callable[[np.ndarray], int]): The function to select the best
+                                                candidates (np.argmin or np.argmax).
+        fraction (float): The fraction of each batch sent to the real objective.
+        min_samples (int): The number of real evaluations before pre-screening starts.
+        screened (str): The fitness of the screened candidates, 'worst' (inf, or -inf
+                        when maximizing) or 'prediction' (their capped prediction).
+    """
+
+    def __init__(self, function: Callable | Objective, surrogate: AbstractSurrogate = None,
+                 otimizer: Callable[[np.ndarray], int] = np.argmin, fraction: float = 0.3,
+                 min_samples: int = 50, screened: str = 'worst') -> None:
+        if screened not in ('prediction', 'worst'):
+            raise ValueError(f"Unknown screened fitness '{screened}', expected 'prediction' or 'worst'")
+        if isinstance(function, Objective):
+            super().__init__(function.function, function.vectorized, function.chunk_size)
+        else:
+            super().__init__(function)
+
+        self.surrogate = KNNSurrogate() if surrogate is None else surrogate
+        self.otimizer = otimizer
+        self.fraction = fraction
+        self.min_samples = min_samples
+        self.screened = screened
+        self.archive_candidates = []
+        self.archive_fitness = []
+        self.n_samples = 0
+        self.history = []
+
+    @property
+    def n_evaluations(self) -> int:
+        """Returns the number of real evaluations so far."""
+        return self.n_samples
+
+    @property
+    def n_saved(self) -> int:
+        """Returns the number of real evaluations avoided so far."""
+        return sum(entry['n_saved'] for entry in self.history)
+
+    def archive(self, candidates: np.ndarray, fitness: np.ndarray) -> None:
+        self.archive_candidates.append(np.array(candidates, dtype=float))
+        self.archive_fitness.append(np.array(fitness, dtype=float))
+        self.n_samples += len(fitness)
+
+    def __call__(self, population: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a population, pre-screening it when the archive is large enough.
+
+        Args:
+            population (np.ndarray): The (N, D) candidates to evaluate.
+
+        Returns:
+            np.ndarray: The N fitness values, real or predicted.
+        """
+        population = np.asarray(population)
+        n_candidates = population.shape[0]
+        n_evaluated = max(1, math.ceil(self.fraction * n_candidates))
+
+        if self.n_samples < self.min_samples or n_evaluated >= n_candidates:
+            fitness = super().__call__(population)
+            self.archive(population, fitness)
+            self.history.append({'n_candidates': n_candidates, 'n_evaluated': n_candidates,
+                                 'n_saved': 0, 'mae': float('nan'), 'rank_correlation': float('nan')})
+            return fitness
+
+        self.surrogate.fit(np.concatenate(self.archive_candidates), np.concatenate(self.archive_fitness))
+        predicted = self.surrogate.predict(population)
+
+        maximize = self.otimizer == np.argmax
+        order = np.argsort(-predicted if maximize else predicted)
+        promising, screened = order[:n_evaluated], order[n_evaluated:]
+
+        fitness = np.empty(n_candidates, dtype=float)
+        fitness[promising] = super().__call__(population[promising])
+        if self.screened == 'worst':
+            fitness[screened] = -np.inf if maximize else np.inf
+        else:
+            worst = fitness[promising].min() if maximize else fitness[promising].max()
+            fitness[screened] = np.minimum(predicted[screened], worst) if maximize else \
+                                np.maximum(predicted[screened], worst)
+
+        self.archive(population[promising], fitness[promising])
+        self.history.append({
+            'n_candidates': n_candidates,
+            'n_evaluated': n_evaluated,
+            'n_saved': n_candidates - n_evaluated,
+            'mae': float(np.abs(predicted[promising] - fitness[promising]).mean()),
+            'rank_correlation': rank_correlation(predicted[promising], fitness[promising]),
+        })
+        return fitness
@@ -0,0 +1,88 @@
+from typing import Callable
+import numpy as np
+
+class SwarmState:
+    """
+    Holds the state of a particle swarm.
+
+    The state keeps the positions, velocities, personal-best positions with
+    their cached fitness, and the global best of the swarm. All the updates
+    are applied in place, so the arrays keep their identity through the run.
+    """
+
+    def __init__(self, positions: np.ndarray, otimizer: Callable[[np.ndarray], int]):
+        """
+        Initializes the swarm state.
+
+        Args:
+            positions (np.ndarray): The initial positions of the particles.
+            otimizer (Callable[[np.ndarray], int]): The function to select the best particle
+                                                    np.argmin() or np.argmax.
+        """
+        self.otimizer = otimizer
+        worst = float('-inf') if otimizer == np.argmax else float('inf')
+
+        self.positions = positions
+        self.velocities = np.zeros_like(positions)
+        self.best_positions = positions.copy()
+        self.best_fitness = np.full(positions.shape[0], worst)
+        self.global_best_position = positions[0].copy()
+        self.global_best_fitness = worst
+
+    def is_better(self, fitness: np.ndarray, reference: np.ndarray) -> np.ndarray:
+        """
+        Compares fitness values according to the optimization direction.
+
+        Args:
+            fitness (np.ndarray): The candidate fitness values.
+            reference (np.ndarray): The fitness values to compare against.
+
+        Returns:
+            np.ndarray: True where the candidate is strictly better.
+        """
+        if self.otimizer == np.argmax:
+            return fitness > reference
+        return fitness < reference
+
+    def update_bests(self, fitness: np.ndarray) -> np.ndarray:
+        """
+        Updates the personal and global bests with the fitness of the current positions.
+
+        Args:
+            fitness (np.ndarray): The fitness of the current positions.
+
+        Returns:
+            np.ndarray: The mask of particles that improved their personal best.
+        """
+        improved = self.is_better(fitness, self.best_fitness)
+        self.best_fitness[improved] = fitness[improved]
+        self.best_positions[improved] = self.positions[improved]
+
+        best = self.otimizer(self.best_fitness)
+        if self.is_better(self.best_fitness[best], self.global_best_fitness):
+            self.global_best_fitness = self.best_fitness[best]
+            self.global_best_position[:] = self.best_positions[best]
+
+        return improved
+
+    def update_particle(self, index: int, fitness: float) -> bool:
+        """
+        Updates the personal and global bests of a single particle.
+
+        Args:
+            index (int): The index of the particle.
+            fitness (float): The fitness of the current position of the particle.
+
+        Returns:
+            bool: True if the global best improved.
+        """
+        if self.is_better(fitness, self.best_fitness[index]):
+            self.best_fitness[index] = fitness
+            self.best_positions[index] = self.positions[index]
+
+        if self.is_better(fitness, self.global_best_fitness):
+            self.global_best_fitness = fitness
+            self.global_best_position[:] = self.positions[index]
+            return True
+
+        return False
@@ -0,0 +1,169 @@
+import os
+import json
+import queue
+import socket
+import threading
+import numpy as np
+from typing import Callable
+
+
+def finite_summary(values: np.ndarray, otimizer: Callable[[np.ndarray], int]) -> tuple:
+    """Returns the best, mean and standard deviation of the finite values, or None for each."""
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return None, None, None
+    return float(values[otimizer(values)]), float(values.mean()), float(values.std())
+
+
+def generation_record(generation: int, population: np.ndarray, fitness: np.ndarray,
+                      otimizer: Callable[[np.ndarray], int] | list, n_evaluations: int,
+                      elapsed: float) -> dict:
+    """
+    Summarizes one generation for the telemetry stream.
+
+    Args:
+        generation (int): The index of the generation.
+        population (np.ndarray): The evaluated population.
+        fitness (np.ndarray): Its fitness, one column per objective for multi-objective runs.
+        otimizer (Callable | list): np.argmin or np.argmax, or one of them per objective.
+        n_evaluations (int): The number of evaluations since the start of the run.
+        elapsed (float): The seconds since the start of the run.
+
+    Returns:
+        dict: The generation, the best, mean and standard deviation of the fitness,
+              the diversity (mean standard deviation of each gene across the
+              population), the evaluations and the elapsed time. The fitness
+              statistics only count finite values, such as the real evaluations
+              when a surrogate reports the screened candidates as inf, so the
+              record stays valid JSON; they are None when no value is finite.
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    if fitness.ndim == 1:
+        best, mean, std = finite_summary(fitness, otimizer)
+    else:
+        summaries = [finite_summary(fitness[:, k], function) for k, function in enumerate(otimizer)]
+        best, mean, std = (list(values) for values in zip(*summaries))
+
+    diversity = float(np.asarray(population, dtype=float).std(axis=0).mean())
+    return {
+        'generation': generation,
+        'best': best,
+        'mean': mean,
+        'std': std,
+        'diversity': diversity if np.isfinite(diversity) else None,
+        'evaluations': n_evaluations,
+        'elapsed': elapsed,
+    }
+
+
+class TelemetrySink:
+    """
+    Streams telemetry records as JSON lines from a background thread.
+
+    `emit` only puts the record in a bounded queue and never waits: when the
+    queue is full the record is dropped and counted in `dropped`, so the
+    optimizer never blocks on I/O. The thread writes the records to a file,
+    or sends them to a local socket, so a monitor can follow many concurrent
+    runs, each tagged with its `run_id`.
+
+    Parameters:
+        path (str, optional): The JSON-lines file the records are appended to.
+        address (str | tuple[str, int], optional): A Unix socket path, or a (host, port)
+                                                   TCP address, to send the records to.
+        run_id (str, optional): The tag added to every record. Defaults to '<host>-<pid>'.
+        max_queue (int): The maximum number of records waiting to be written.
+    """
+
+    def __init__(self, path: str = None, address: str | tuple[str, int] = None,
+                 run_id: str = None, max_queue: int = 1024) -> None:
+        if (path is None) == (address is None):
+            raise ValueError("Exactly one of path or address must be given")
+
+        self.path = path
+        self.address = address
+        self.run_id = run_id or f'{socket.gethostname()}-{os.getpid()}'
+        self.queue = queue.Queue(max_queue)
+        self.dropped = 0
+        self.errors = 0
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+
+    def __enter__(self) -> 'TelemetrySink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def emit(self, record: dict) -> None:
+        """
+        Queues a record without blocking.
+
+        Args:
+            record (dict): The JSON-serializable record.
+        """
+        try:
+            self.queue.put_nowait({'run': self.run_id, **record})
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Writes the queued records and stops the thread."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def open(self):
+        if self.path is not None:
+            return open(self.path, 'a')
+
+        family = socket.AF_UNIX if isinstance(self.address, str) else socket.AF_INET
+        connection = socket.socket(family, socket.SOCK_STREAM)
+        connection.connect(self.address)
+        stream = connection.makefile('w')
+        connection.close()  # The stream keeps the socket open until it is closed.
+        return stream
+
+    def write_loop(self) -> None:
+        try:
+            stream = self.open()
+        except OSError:
+            stream = None
+            self.errors += 1
+
+        while True:
+            records = [self.queue.get()]
+            while True:
+                try:
+                    records.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            closing = None in records
+            lines = []
+            for record in records:
+                if record is None:
+                    continue
+                try:
+                    # Infinity and NaN are not JSON, so records holding them are not sent.
+                    lines.append(json.dumps(record, allow_nan=False) + '\n')
+                except (TypeError, ValueError):
+                    self.errors += 1
+
+            if stream is not None and lines:
+                try:
+                    stream.writelines(lines)
+                    stream.flush()
+                except OSError:
+                    stream = None
+                    self.errors += 1
+            elif lines:
+                self.dropped += len(lines)
+
+            if closing:
+                break
+
+        if stream is not None:
+            try:
+                stream.close()
+            except OSError:
+                self.errors += 1
@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+import numpy as np
+from src.swarm_state import SwarmState
+
+class AbstractTopology(ABC):
+    """Abstract class representing the neighbourhood topology of a particle swarm.
+
+    This class defines the interface for topologies. Each topology describes the
+    neighbourhood of every particle as a precomputed (n_particles, k) array of
+    particle indices, and the best of each neighbourhood is found for the whole
+    swarm with a single gather and argmin/argmax. Specific topologies should
+    inherit from this class and implement the `create_neighbors` method.
+
+    """
+    def __init__(self) -> None:
+        self.neighbors = None
+
+    @abstractmethod
+    def create_neighbors(self, n_particles: int) -> np.ndarray:
+        """Creates the neighbourhood of each particle.
+
+        Args:
+            n_particles (int): The number of particles in the swarm.
+
+        Returns:
+            np.ndarray: A (n_particles, k) array with the indices of the neighbours
+                        of each particle, the particle itself included.
+
+        """
+        pass
+
+    def best(self, state: SwarmState) -> np.ndarray:
+        """Finds the best personal-best position in the neighbourhood of each particle.
+
+        Args:
+            state (SwarmState): The state of the swarm.
+
+        Returns:
+            np.ndarray: The index of the neighbourhood best of each particle.
+
+        """
+        n_particles = state.best_fitness.shape[0]
+        if self.neighbors is None or self.neighbors.shape[0] != n_particles:
+            self.neighbors = self.create_neighbors(n_particles)
+
+        best = state.otimizer(state.best_fitness[self.neighbors], axis=1)
+        return self.neighbors[np.arange(n_particles), best]
+
+    def update(self, improved: bool) -> None:
+        """Receives, after each generation, whether the global best has improved.
+
+        Args:
+            improved (bool): True if the global best improved in the generation.
+
+        """
+        pass
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """Returns the state of the topology as arrays, to be written in a checkpoint.
+
+        Returns:
+            dict[str, np.ndarray]: The neighbourhoods, if already created.
+
+        """
+        if self.neighbors is None:
+            return {}
+        return {'topology_neighbors': self.neighbors}
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        """Restores the state of the topology returned by `get_state`.
+
+        Args:
+            state (dict[str, np.ndarray]): The arrays of the topology state.
+
+        """
+        self.neighbors = state.get('topology_neighbors')
@@ -0,0 +1,16 @@
+from src.topology.abstract_topology import AbstractTopology
+from src.swarm_state import SwarmState
+import numpy as np
+
+class GlobalTopology(AbstractTopology):
+    """Connects every particle to all the others (gbest).
+
+    The neighbourhood best of every particle is the global best of the swarm.
+
+    """
+    def create_neighbors(self, n_particles: int) -> np.ndarray:
+        return np.tile(np.arange(n_particles), (n_particles, 1))
+
+    def best(self, state: SwarmState) -> np.ndarray:
+        n_particles = state.best_fitness.shape[0]
+        return np.full(n_particles, state.otimizer(state.best_fitness))
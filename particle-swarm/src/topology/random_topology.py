@@ -0,0 +1,38 @@
+from src.topology.abstract_topology import AbstractTopology
+import numpy as np
+
+class RandomTopology(AbstractTopology):
+    """Connects each particle to k random informants, re-drawn on stagnation.
+
+    The informants are drawn again whenever the global best has not improved
+    for `patience` generations.
+
+    Args:
+        k (int): The number of informants of each particle.
+        patience (int): The number of generations without improvement before re-drawing.
+
+    """
+    def __init__(self, k: int = 3, patience: int = 1) -> None:
+        self.k = k
+        self.patience = patience
+        self.stagnation = 0
+        super().__init__()
+
+    def create_neighbors(self, n_particles: int) -> np.ndarray:
+        informants = np.random.randint(0, n_particles, (n_particles, self.k))
+        return np.concatenate([np.arange(n_particles)[:, None], informants], axis=1)
+
+    def update(self, improved: bool) -> None:
+        self.stagnation = 0 if improved else self.stagnation + 1
+        if self.stagnation >= self.patience and self.neighbors is not None:
+            self.neighbors = self.create_neighbors(self.neighbors.shape[0])
+            self.stagnation = 0
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        state = super().get_state()
+        state['topology_stagnation'] = np.array(self.stagnation)
+        return state
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        super().set_state(state)
+        self.stagnation = int(state.get('topology_stagnation', 0))
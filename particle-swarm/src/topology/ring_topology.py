@@ -0,0 +1,17 @@
+from src.topology.abstract_topology import AbstractTopology
+import numpy as np
+
+class RingTopology(AbstractTopology):
+    """Connects each particle to the particles within a radius on a ring (lbest).
+
+    Args:
+        radius (int): The number of neighbours on each side of the particle.
+
+    """
+    def __init__(self, radius: int = 1) -> None:
+        self.radius = radius
+        super().__init__()
+
+    def create_neighbors(self, n_particles: int) -> np.ndarray:
+        offsets = np.arange(-self.radius, self.radius + 1)
+        return (np.arange(n_particles)[:, None] + offsets[None, :]) % n_particles
@@ -0,0 +1,26 @@
+from src.topology.abstract_topology import AbstractTopology
+import numpy as np
+
+class VonNeumannTopology(AbstractTopology):
+    """Connects each particle to its four neighbours on a toroidal grid.
+
+    The particles are laid out row by row on a grid with ceil(sqrt(n_particles))
+    columns, and each one is connected to the particles above, below, on the
+    left and on the right of it. Rows wrap around within themselves and columns
+    within themselves; when the last row is incomplete, it wraps around its own
+    length and the columns it does not reach wrap around one row earlier.
+
+    """
+    def create_neighbors(self, n_particles: int) -> np.ndarray:
+        columns = int(np.ceil(np.sqrt(n_particles)))
+        row, column = np.divmod(np.arange(n_particles), columns)
+
+        # The length of the row, and the height of the column, of each particle.
+        row_length = np.minimum(columns, n_particles - row * columns)
+        column_height = (n_particles - column - 1) // columns + 1
+
+        left = row * columns + (column - 1) % row_length
+        right = row * columns + (column + 1) % row_length
+        up = ((row - 1) % column_height) * columns + column
+        down = ((row + 1) % column_height) * columns + column
+        return np.stack([np.arange(n_particles), left, right, up, down], axis=1)